@@ -12,11 +12,18 @@ Supports:
 """
 
 import asyncio
-import hashlib
+import base64
 import json
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from functools import partial
@@ -34,13 +41,16 @@ from readers import (
     CCCDReader, MyNumberCardReader, SuicaReader, ZairyuCardReader,
     SMARTCARD_AVAILABLE, CRYPTO_AVAILABLE
 )
-from readers.utils import get_hex_string, get_readers
+from readers.utils import get_hex_string, get_readers, xor_bytes
 
 if SMARTCARD_AVAILABLE:
     from smartcard.Exceptions import NoCardException, CardConnectionException
+    from smartcard.CardMonitoring import CardMonitor, CardObserver
 else:
     NoCardException = Exception
     CardConnectionException = Exception
+    CardMonitor = None
+    CardObserver = object
 
 # OCR providers (optional)
 try:
@@ -51,8 +61,125 @@ except ImportError:
     EasyOCRProvider = None
     ZairyuCardParser = None
 
+# Fast JSON serialization (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Reusable simdjson parser for incoming messages (optional)
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 logger = logging.getLogger(__name__)
 
+# SELECT commands used by detect_card_type(), built once at import
+_SELECT_MYNUMBER_JPKI = APDU.select_application(MyNumberCardReader.AID_JPKI_AP)
+_SELECT_MYNUMBER_PROFILE = APDU.select_application(MyNumberCardReader.AID_PROFILE_AP)
+_SELECT_ZAIRYU_DF1 = APDU.select_application(ZairyuCardReader.AID_DF1)
+
+# EMV payment application SELECTs (P2=00: return FCI), tried in order
+_EMV_SELECTS = tuple(
+    (APDU.select_application(aid, p2=0x00), brand)
+    for aid, brand in (
+        ([0xA0, 0x00, 0x00, 0x00, 0x04, 0x10, 0x10], "Mastercard"),
+        ([0xA0, 0x00, 0x00, 0x00, 0x03, 0x10, 0x10], "Visa"),
+        ([0xA0, 0x00, 0x00, 0x00, 0x25, 0x01, 0x01, 0x01], "American Express"),
+        ([0xA0, 0x00, 0x00, 0x00, 0x65, 0x10, 0x10, 0x01], "JCB"),
+    )
+)
+
+
+def install_fast_event_loop() -> Optional[str]:
+    """
+    Switch asyncio to a libuv loop when one is installed (lower WebSocket I/O
+    latency): winloop on Windows, uvloop elsewhere.
+    Must be called before the event loop is created.
+    
+    Returns:
+        Name of the installed event loop, or None if the default loop is used
+    """
+    try:
+        if sys.platform == 'win32':
+            import winloop as loop_module
+        else:
+            import uvloop as loop_module
+    except ImportError:
+        return None
+    asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+    return loop_module.__name__
+
+
+# (epoch second, formatted timestamp) last produced by _iso_now()
+_iso_now_cache = (0, "")
+
+
+def _iso_now() -> str:
+    """Local timestamp for responses (second precision is enough for a response tag)"""
+    global _iso_now_cache
+    second = int(time.time())
+    if _iso_now_cache[0] != second:
+        # Reuse one string per wall-clock second; a tuple swap is safe across threads
+        _iso_now_cache = (second, datetime.fromtimestamp(second).isoformat(timespec='seconds'))
+    return _iso_now_cache[1]
+
+
+def _dumps(message: Dict[str, Any]) -> str:
+    """Serialize a message to JSON text (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(message).decode('utf-8')
+    return json.dumps(message, ensure_ascii=False)
+
+
+# One parser for the whole process - keeps its internal buffer between messages
+# (large test_ocr frames don't reallocate it every time). Safe to share because
+# parsing always happens on the event loop thread.
+_json_parser = simdjson.Parser() if simdjson is not None else None
+
+
+def _loads(message):
+    """
+    Parse an incoming WebSocket message.
+    
+    The document is materialized right away: handle_message awaits between
+    field accesses and the parser can only hold one document at a time.
+    Raises json.JSONDecodeError on bad input whichever backend is used
+    (orjson.JSONDecodeError already subclasses it).
+    """
+    if _json_parser is not None:
+        try:
+            doc = _json_parser.parse(message)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), str(message)[:64], 0) from e
+        if isinstance(doc, simdjson.Object):
+            return doc.as_dict()
+        if isinstance(doc, simdjson.Array):
+            return doc.as_list()
+        return doc
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+# Failure messages from the card readers, matched in one pass in _blocking_read_*
+_MYNUMBER_ERR_RE = re.compile(r"PIN verification failed|Cannot select Profile AP")
+_ZAIRYU_ERR_RE = re.compile(r"Mutual authentication failed|Card number verification failed|Cannot select MF")
+
+# Constant replies, encoded once (str so they go out as text frames like every other reply)
+_PONG_FRAME = _dumps({"type": "pong"})
+_CANCELLED_FRAME = _dumps({"type": "status", "status": "cancelled"})
+_STATUS_WAITING_FRAME = _dumps({
+    "type": "status",
+    "status": "waiting_for_card",
+    "message": "Đặt thẻ lên đầu đọc / Place card on reader"
+})
+_STATUS_READING_FRAME = _dumps({
+    "type": "status",
+    "status": "reading",
+    "message": "Đang đọc thẻ / Reading card..."
+})
 
 # OCR caching removed - always read fresh data from card to prevent stale data issues
 
@@ -74,13 +201,135 @@ class BridgeState(Enum):
     READING = "reading"
 
 
+class ReaderBusyError(RuntimeError):
+    """Too many smartcard jobs are already queued for the reader thread"""
+
+
+class _CardPresenceObserver(CardObserver):
+    """Forwards pyscard card insert/remove notifications to a callback"""
+    
+    def __init__(self, on_change):
+        self.on_change = on_change
+    
+    def update(self, observable, handlers):
+        added_cards, removed_cards = handlers
+        self.on_change(added_cards, removed_cards)
+
+
+class _SuicaWorker:
+    """
+    Long-running suica_subprocess.py (--serve mode).
+    Keeps the interpreter, nfcpy and suica_viewer loaded between reads;
+    each read is one "READ" line in and one JSON line out.
+    """
+    
+    def __init__(self, script_path: str):
+        self.script_path = script_path
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: Optional[queue.Queue] = None
+    
+    def _start(self):
+        self._proc = subprocess.Popen(
+            [sys.executable, self.script_path, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            errors="replace",
+            cwd=os.path.dirname(self.script_path)
+        )
+        # Pipes are drained on threads so reads can time out (no select() on Windows pipes)
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump_stdout, args=(self._proc, self._lines), daemon=True).start()
+        threading.Thread(target=self._pump_stderr, args=(self._proc,), daemon=True).start()
+        logger.info("Started Suica worker process")
+    
+    @staticmethod
+    def _pump_stdout(proc, lines):
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)  # Worker exited
+    
+    @staticmethod
+    def _pump_stderr(proc):
+        for line in proc.stderr:
+            logger.info("Suica worker: %s", line.rstrip())
+    
+    def read(self, timeout: float = 30.0) -> Dict[str, Any]:
+        """
+        Read one card through the worker, starting it if needed.
+        
+        Raises:
+            TimeoutError if no card was read in time (the worker is stopped)
+            RuntimeError/OSError if the worker died
+        """
+        if self._proc is None or self._proc.poll() is not None:
+            self._start()
+        
+        try:
+            self._proc.stdin.write("READ\n")
+            self._proc.stdin.flush()
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            # Worker is still blocked waiting for a card
+            self.stop()
+            raise TimeoutError(f"No Suica result within {timeout}s")
+        except OSError:
+            self.stop()
+            raise
+        
+        if line is None:
+            self.stop()
+            raise RuntimeError("Suica worker exited unexpectedly")
+        return json.loads(line)
+    
+    def stop(self):
+        """Kill the worker process"""
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+
+
 class NFCBridge:
-    """Main NFC Bridge WebSocket Server"""
+    """
+    Main NFC Bridge WebSocket Server
+    
+    Entry points should call install_fast_event_loop() before starting
+    asyncio so the server runs on winloop/uvloop when it is available.
+    """
     
     VERSION = "2.3.0"  # Updated: async-safe card reading
     
-    # Thread pool for blocking smartcard operations
+    # Max clients sent to concurrently per broadcast batch
+    BROADCAST_BATCH_SIZE = 50
+    
+    # Message types handled on the connection's worker task instead of the read loop
+    QUEUED_MESSAGE_TYPES = frozenset({
+        "read_now", "read_mynumber", "read_zairyu", "test_ocr", "detect_card_type"
+    })
+    
+    # Queued messages per connection before the read loop waits
+    MAX_QUEUED_MESSAGES = 64
+    
+    # Seconds a looked-up reader is reused before PC/SC readers are listed again
+    READER_CACHE_TTL = 5.0
+    
+    # Seconds a detect_card_type() result is reused for the same card (ATR + UID)
+    DETECT_CACHE_TTL = 2.0
+    
+    # Dedicated reader thread for blocking smartcard operations.
+    # PC/SC access is serial per reader, so jobs run one at a time in order.
     # This prevents card reading from blocking the WebSocket event loop
+    _reader_queue: Optional[queue.Queue] = None
+    _reader_thread: Optional[threading.Thread] = None
+    
+    # Jobs allowed to wait behind the running one before new reads get BUSY
+    MAX_PENDING_READS = 4
+    
+    # Thread pool for blocking OCR work
     _executor: Optional[ThreadPoolExecutor] = None
     
     def __init__(self, ocr_provider=None, fallback_ocr_provider=None):
@@ -95,11 +344,89 @@ class NFCBridge:
         """
         self.state = BridgeState.IDLE
         self.connected_clients: Set = set()
+        # Immutable copy of connected_clients for broadcast(), refreshed on join/leave
+        self._client_snapshot: tuple = ()
         self.scan_task: Optional[asyncio.Task] = None
         
-        # Initialize thread pool executor for blocking operations
+        # Card connection kept open between detect -> read for the same card.
+        # Only touched from blocking code paths.
+        self._active_conn = None
+        self._active_conn_atr = None
+        
+        # Cached reader handle (see get_reader)
+        self._cached_reader = None
+        self._reader_cached_at = 0.0
+        # str() of the cached reader, taken once per lookup
+        self._reader_name: Optional[str] = None
+        # Serializes PC/SC reader listing in get_reader()
+        self._reader_lock = threading.Lock()
+        
+        # Last detect_card_type() result: ((atr, uid), monotonic time, result)
+        self._last_detection: Optional[tuple] = None
+        
+        # card_type -> (blocking read method, params -> args, timeout in seconds)
+        self._card_readers = {
+            "cccd": (
+                self.read_cccd_card,
+                lambda p: (p.get('card_number', ''), p.get('birth_date', ''), p.get('expiry_date', '')),
+                30.0
+            ),
+            "zairyu": (self.read_zairyu_card, lambda p: (p.get('card_number', ''),), 90.0),  # includes OCR
+            "mynumber": (self.read_mynumber_card, lambda p: (p.get('pin', ''),), 30.0),
+            "suica": (self.read_suica_card, lambda p: (), 45.0),  # nfcpy worker + PC/SC fallback
+            "generic": (self.read_generic_card, lambda p: (), 15.0),
+        }
+        
+        # In-flight API reads by key ("zairyu:<card_number>", "mynumber:<pin>"),
+        # so a repeated request joins the running read instead of queueing another
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # WebSocket message type -> handler(websocket, data)
+        self._message_handlers = {
+            "start_scan": self._on_start_scan,
+            "cancel_scan": self._on_cancel_scan,
+            "read_now": self._on_read_now,
+            "read_mynumber": self._on_read_mynumber,
+            "read_zairyu": self._on_read_zairyu,
+            "test_ocr": self._on_test_ocr,
+            "detect_card_type": self._on_detect_card_type,
+            "get_status": self._on_get_status,
+            "ping": self._on_ping,
+        }
+        
+        # Fields of the "connected" greeting that never change; handler() adds live state
+        self._greeting_static = {
+            "type": "connected",
+            "supported_cards": ["generic", "cccd", "zairyu", "mynumber", "suica"],
+            "supported_features": ["detect_card_type"],
+            "version": self.VERSION,
+            "zairyu_auth": "card_number_only",
+        }
+        
+        # Persistent nfcpy Suica worker (started on first Suica read)
+        self._suica_worker: Optional[_SuicaWorker] = None
+        
+        # Event-driven card presence: names of readers that currently hold a card.
+        # Updated from pyscard's CardMonitor thread; None means polling fallback.
+        self._cards_present: Set[str] = set()
+        self._card_monitor = None
+        # (loop, asyncio.Event) of a wait_for_card() waiting for an insert
+        self._card_waiter: Optional[tuple] = None
+        self._start_card_monitor()
+        
+        # Start the reader thread for blocking smartcard operations
+        if NFCBridge._reader_thread is None:
+            NFCBridge._reader_queue = queue.Queue()
+            NFCBridge._reader_thread = threading.Thread(
+                target=NFCBridge._reader_loop,
+                name="nfc_reader",
+                daemon=True
+            )
+            NFCBridge._reader_thread.start()
+        
+        # Initialize thread pool executor for OCR
         if NFCBridge._executor is None:
-            NFCBridge._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nfc_reader")
+            NFCBridge._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ocr_worker")
         
         # Initialize OCR providers
         if ocr_provider:
@@ -121,9 +448,173 @@ class NFCBridge:
         """Set fallback OCR provider (used when primary misses critical fields)"""
         self.fallback_ocr_provider = provider
     
+    @staticmethod
+    def _reader_loop():
+        """Run queued smartcard jobs one at a time on the reader thread"""
+        while True:
+            future, func, args = NFCBridge._reader_queue.get()
+            # Skip jobs whose caller already gave up (e.g. timed out while queued)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+    
     async def run_blocking(self, func, *args, timeout: float = 60.0):
         """
-        Run a blocking function in thread pool to avoid blocking the event loop.
+        Run a blocking smartcard function on the reader thread to avoid
+        blocking the event loop.
+        
+        Args:
+            func: Blocking function to run
+            *args: Arguments to pass to the function
+            timeout: Maximum time to wait for the operation (default 60s)
+            
+        Returns:
+            Result from the function
+            
+        Raises:
+            asyncio.TimeoutError if operation exceeds timeout
+            ReaderBusyError if MAX_PENDING_READS jobs are already queued
+        """
+        pending = NFCBridge._reader_queue.qsize()
+        if pending >= self.MAX_PENDING_READS:
+            logger.warning("Reader busy: %s jobs queued, rejecting %s", pending, func.__name__)
+            raise ReaderBusyError(f"{pending} smartcard jobs already queued")
+        if pending:
+            logger.info("Reader queue: %s waiting behind %s job(s)", func.__name__, pending)
+        
+        future = Future()
+        NFCBridge._reader_queue.put((future, func, args))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error("Operation timed out after %ss", timeout)
+            raise
+    
+    def _run_coalesced(self, key: str, func, *args, timeout: float):
+        """
+        run_blocking() shared by identical concurrent requests.
+        
+        The first caller for key starts the job; later callers await the same
+        result until it finishes. Returns an awaitable; a caller being cancelled
+        doesn't cancel the read for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.run_blocking(func, *args, timeout=timeout))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._inflight_done(key, t))
+        else:
+            logger.info("Joining in-flight %s", func.__name__)
+        return asyncio.shield(task)
+    
+    def _inflight_done(self, key: str, task: asyncio.Task):
+        """Drop a finished coalesced read and retrieve its exception
+        
+        If every waiter was cancelled (e.g. the client disconnected), nobody
+        awaits the task; reading the exception here keeps asyncio from logging
+        "Task exception was never retrieved" for each such failed read.
+        """
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("Coalesced %s read failed: %r", key, task.exception())
+    
+    async def _run_read(self, func, *args, timeout: float) -> Dict[str, Any]:
+        """Run a blocking read_* method on the reader thread, mapping timeout/busy to an error result"""
+        try:
+            return await self.run_blocking(func, *args, timeout=timeout)
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "error": "TIMEOUT",
+                "error_ja": "カード読み取りがタイムアウトしました",
+                "error_en": "Card reading timed out"
+            }
+        except ReaderBusyError:
+            return {
+                "success": False,
+                "error": "BUSY",
+                "error_ja": "カードリーダーが使用中です。しばらくしてから再試行してください",
+                "error_en": "Card reader is busy, please try again"
+            }
+    
+    @staticmethod
+    def _validate_params(card_type: str, params: Dict, require: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Check the user-supplied parameters for card_type without touching the reader.
+        
+        Args:
+            card_type: Card type the parameters are for
+            params: Request parameters
+            require: Treat a missing PIN / card number as an error. Scans
+                     (start_scan) allow them empty and read basic info only.
+        
+        Returns:
+            Error response dict if the parameters can't work, None if they look valid
+        """
+        if card_type == "mynumber":
+            pin = params.get("pin", "")
+            if not pin:
+                if not require:
+                    return None
+                return {
+                    "success": False,
+                    "error": "NO_PIN",
+                    "error_ja": "PINが入力されていません",
+                    "error_en": "PIN is required"
+                }
+            if len(pin) != 4 or not pin.isdigit():
+                return {
+                    "success": False,
+                    "error": "INVALID_PIN_FORMAT",
+                    "error_ja": "PINは4桁の数字である必要があります",
+                    "error_en": "PIN must be 4 digits"
+                }
+        
+        elif card_type == "zairyu":
+            card_number = params.get("card_number", "")
+            if not card_number:
+                if not require:
+                    return None
+                return {
+                    "success": False,
+                    "error": "NO_CARD_NUMBER",
+                    "error_ja": "在留カード番号が入力されていません",
+                    "error_en": "Card number is required"
+                }
+            if len(card_number) != 12:
+                return {
+                    "success": False,
+                    "error": "INVALID_CARD_NUMBER_FORMAT",
+                    "error_ja": "在留カード番号は12桁である必要があります",
+                    "error_en": "Card number must be 12 characters",
+                    "hint": "Example: AB12345678CD"
+                }
+        
+        elif card_type == "cccd":
+            # BAC keys are derived from all three fields
+            missing = [k for k in ("card_number", "birth_date", "expiry_date") if not params.get(k)]
+            if missing:
+                return {
+                    "success": False,
+                    "error": "MISSING_PARAMS",
+                    "error_ja": "必須項目が入力されていません",
+                    "error_en": f"Missing required fields: {', '.join(missing)}",
+                    "missing": missing
+                }
+        
+        return None
+    
+    async def _read_card(self, card_type: str, params: Dict) -> Dict[str, Any]:
+        """Read the card with the reader for card_type (unknown types read as generic)"""
+        func, get_args, timeout = self._card_readers.get(card_type, self._card_readers["generic"])
+        return await self._run_read(func, *get_args(params), timeout=timeout)
+    
+    async def run_ocr(self, func, *args, timeout: float = 60.0):
+        """
+        Run a blocking OCR function in the thread pool to avoid blocking the event loop.
         
         Args:
             func: Blocking function to run
@@ -143,29 +634,147 @@ class NFCBridge:
                 timeout=timeout
             )
         except asyncio.TimeoutError:
-            logger.error(f"Operation timed out after {timeout}s")
+            logger.error("OCR timed out after %ss", timeout)
             raise
     
+    def _add_client(self, websocket):
+        """Register a connected client"""
+        self.connected_clients.add(websocket)
+        self._client_snapshot = tuple(self.connected_clients)
+    
+    def _remove_client(self, websocket):
+        """Unregister a disconnected client"""
+        self.connected_clients.discard(websocket)
+        self._client_snapshot = tuple(self.connected_clients)
+    
     async def broadcast(self, message: Dict[str, Any]):
         """Send message to all connected clients"""
         if not self.connected_clients:
             return
-        msg = json.dumps(message, ensure_ascii=False)
-        for client in list(self.connected_clients):
-            try:
-                await client.send(msg)
-            except:
-                self.connected_clients.discard(client)
+        # Serialize once; the same frame goes to every client
+        await self.broadcast_raw(_dumps(message))
+    
+    async def broadcast_raw(self, msg: str):
+        """Send an already-encoded JSON frame to all connected clients"""
+        clients = self._client_snapshot
+        if not clients:
+            return
+        batch_size = self.BROADCAST_BATCH_SIZE
+        
+        # Send to all clients concurrently so one slow client doesn't stall the rest.
+        # Large fan-outs are split into batches that yield to the event loop in between.
+        for i in range(0, len(clients), batch_size):
+            batch = clients[i:i + batch_size]
+            results = await asyncio.gather(
+                *(client.send(msg) for client in batch),
+                return_exceptions=True
+            )
+            for client, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self._remove_client(client)
+            if i + batch_size < len(clients):
+                await asyncio.sleep(0)
     
     def get_reader(self):
-        """Get first available NFC reader"""
+        """
+        Get first available NFC reader.
+        The reader is cached for READER_CACHE_TTL seconds so repeated calls
+        don't list PC/SC readers every time.
+        """
         if not SMARTCARD_AVAILABLE:
             return None
-        try:
-            r = get_readers()
-            return r[0] if r else None
-        except:
+        reader = self._cached_reader
+        if reader is not None and time.monotonic() - self._reader_cached_at < self.READER_CACHE_TTL:
+            return reader
+        # Single flight: the event loop and the reader thread may both miss at once
+        with self._reader_lock:
+            reader = self._cached_reader
+            if reader is not None and time.monotonic() - self._reader_cached_at < self.READER_CACHE_TTL:
+                return reader
+            try:
+                r = get_readers()
+                reader = r[0] if r else None
+            except Exception:
+                reader = None
+            self._cached_reader = reader
+            self._reader_cached_at = time.monotonic()
+            self._reader_name = str(reader) if reader is not None else None
+            return reader
+    
+    def invalidate_reader_cache(self):
+        """Forget the cached reader so the next get_reader() lists PC/SC readers again"""
+        self._cached_reader = None
+        self._reader_cached_at = 0.0
+        self._reader_name = None
+    
+    def _reader_name_of(self, reader) -> Optional[str]:
+        """Display name of reader, using the name cached by get_reader() when it's the same reader"""
+        if reader is None:
             return None
+        if reader is self._cached_reader and self._reader_name is not None:
+            return self._reader_name
+        return str(reader)
+    
+    def _acquire_conn(self, reader):
+        """
+        Get a connection to the card on the reader.
+        Reuses the open connection while the same card is still present,
+        otherwise (card removed/replaced or handle invalid) reconnects once.
+        """
+        conn = self._active_conn
+        if conn is not None:
+            try:
+                # getATR() queries the handle status; it fails once the card was removed or reset
+                if conn.getATR() == self._active_conn_atr:
+                    return conn
+            except (NoCardException, CardConnectionException):
+                pass
+            self._drop_conn()
+        
+        conn = reader.createConnection()
+        conn.connect()
+        self._active_conn = conn
+        self._active_conn_atr = conn.getATR()
+        return conn
+    
+    def _drop_conn(self):
+        """Disconnect and forget the cached card connection"""
+        conn = self._active_conn
+        self._active_conn = None
+        self._active_conn_atr = None
+        if conn is not None:
+            try:
+                conn.disconnect()
+            except Exception as e:
+                logger.warning("Error disconnecting card: %s", e)
+    
+    def _start_card_monitor(self):
+        """Subscribe to PC/SC card insert/remove events (falls back to polling on failure)"""
+        if not SMARTCARD_AVAILABLE:
+            return
+        try:
+            monitor = CardMonitor()
+            monitor.addObserver(_CardPresenceObserver(self._on_cards_changed))
+            self._card_monitor = monitor
+            logger.info("Card presence: using PC/SC card monitor")
+        except Exception as e:
+            logger.warning("Card monitor unavailable, polling for cards instead: %s", e)
+            self._card_monitor = None
+    
+    def _on_cards_changed(self, added_cards, removed_cards):
+        """CardMonitor callback (runs on the monitor thread)"""
+        present = set(self._cards_present)
+        for card in removed_cards:
+            present.discard(str(card.reader))
+        for card in added_cards:
+            present.add(str(card.reader))
+        self._cards_present = present
+        
+        # Wake up a scan waiting for a card
+        waiter = self._card_waiter
+        if added_cards and waiter is not None:
+            loop, event = waiter
+            loop.call_soon_threadsafe(event.set)
     
     def check_card_present(self) -> bool:
         """Check if card is on reader"""
@@ -174,14 +783,115 @@ class NFCBridge:
         reader = self.get_reader()
         if not reader:
             return False
+        
+        # Event-driven: no PC/SC round-trip needed
+        if self._card_monitor is not None:
+            return self._reader_name_of(reader) in self._cards_present
+        
+        # Polling fallback: probe with a throwaway connection
         try:
             conn = reader.createConnection()
             conn.connect()
             conn.disconnect()
             return True
-        except:
+        except NoCardException:
+            return False
+        except Exception:
+            # CardConnectionException etc. - reader may have been unplugged - look it up again next time
+            self.invalidate_reader_cache()
             return False
     
+    def _classify_card(self, conn, reader, atr, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Identify the card type by ATR and by trying to select various applications.
+        Fills card_type/card_type_name/confidence (and card-specific flags) into result.
+        """
+        # Initial classification from ATR
+        if atr:
+            result["atr"] = bytes(atr).hex(" ").upper()
+            # Compact uppercase hex in one pass (no spaced string to strip)
+            atr_hex = bytes(atr).hex().upper()
+            
+            # Check for FeliCa indicators in ATR
+            if "FELICA" in self._reader_name_of(reader).upper() or "F0" in atr_hex:
+                # Likely FeliCa card (Suica, etc.)
+                result["card_type"] = CardType.SUICA.value
+                result["card_type_name"] = "FeliCa (Suica/Pasmo/ICOCA)"
+                result["confidence"] = "high"
+                return result
+        
+        # Test 1: Try My Number Card JPKI Application
+        data, sw1, sw2 = conn.transmit(_SELECT_MYNUMBER_JPKI)
+        if sw1 == 0x90:
+            result["card_type"] = CardType.MYNUMBER.value
+            result["card_type_name"] = "マイナンバーカード (My Number Card)"
+            result["card_type_name_en"] = "My Number Card"
+            result["confidence"] = "high"
+            result["jpki_supported"] = True
+            return result
+        
+        # Test 1b: Try My Number Profile AP
+        data, sw1, sw2 = conn.transmit(_SELECT_MYNUMBER_PROFILE)
+        if sw1 == 0x90:
+            result["card_type"] = CardType.MYNUMBER.value
+            result["card_type_name"] = "マイナンバーカード (My Number Card)"
+            result["card_type_name_en"] = "My Number Card"
+            result["confidence"] = "high"
+            result["profile_ap_supported"] = True
+            return result
+        
+        # Test 2: Try Zairyu Card (SELECT MF + DF1)
+        # First SELECT MF
+        data, sw1, sw2 = conn.transmit(APDU.SELECT_MF)
+        mf_success = (sw1 == 0x90)
+        
+        if mf_success:
+            # Try Zairyu DF1 AID
+            data, sw1, sw2 = conn.transmit(_SELECT_ZAIRYU_DF1)
+            if sw1 == 0x90:
+                result["card_type"] = CardType.ZAIRYU.value
+                result["card_type_name"] = "在留カード (Residence Card)"
+                result["card_type_name_en"] = "Residence Card"
+                result["confidence"] = "high"
+                return result
+        
+        # Test 3: Try ICAO 9303 MRTD (Passport/CCCD)
+        data, sw1, sw2 = conn.transmit(APDU.SELECT_MRTD_APP)
+        if sw1 == 0x90:
+            result["card_type"] = CardType.PASSPORT.value
+            result["card_type_name"] = "e-Passport / CCCD"
+            result["card_type_name_en"] = "e-Passport or National ID"
+            result["confidence"] = "high"
+            result["mrtd_supported"] = True
+            return result
+        
+        # Test 4: Try EMV Credit Card applications
+        for select_cmd, brand in _EMV_SELECTS:
+            data, sw1, sw2 = conn.transmit(select_cmd)
+            if sw1 == 0x90 or sw1 == 0x61:
+                result["card_type"] = CardType.CREDIT.value
+                result["card_type_name"] = f"クレジットカード ({brand})"
+                result["card_type_name_en"] = f"Credit Card ({brand})"
+                result["card_brand"] = brand
+                result["confidence"] = "high"
+                return result
+        
+        # If MF selection worked but no specific app found, might be Zairyu
+        if mf_success:
+            result["card_type"] = CardType.ZAIRYU.value
+            result["card_type_name"] = "在留カード (Residence Card) - 推定"
+            result["card_type_name_en"] = "Residence Card (estimated)"
+            result["confidence"] = "medium"
+            result["note"] = "MF selection succeeded, likely Zairyu card"
+            return result
+        
+        # Unknown card
+        result["card_type"] = CardType.GENERIC.value
+        result["card_type_name"] = "不明なNFCカード"
+        result["card_type_name_en"] = "Unknown NFC Card"
+        result["confidence"] = "low"
+        return result
+    
     def detect_card_type(self) -> Dict[str, Any]:
         """
         Quick card type detection without deep reading.
@@ -206,134 +916,35 @@ class NFCBridge:
             }
         
         try:
-            conn = reader.createConnection()
-            conn.connect()
+            conn = self._acquire_conn(reader)
             
             result = {
                 "success": True,
-                "timestamp": datetime.now().isoformat(),
-                "reader": str(reader)
+                "timestamp": _iso_now(),
+                "reader": self._reader_name_of(reader)
             }
             
             # Get UID
             data, sw1, sw2 = conn.transmit(APDU.GET_UID)
             if sw1 == 0x90 and data:
-                result["uid"] = get_hex_string(data).replace(" ", "")
+                result["uid"] = bytes(data).hex().upper()
             
-            # Get ATR for initial classification
             atr = conn.getATR()
-            if atr:
-                result["atr"] = get_hex_string(atr)
-                atr_hex = get_hex_string(atr).upper().replace(" ", "")
-                
-                # Check for FeliCa indicators in ATR
-                if "FELICA" in str(reader).upper() or "F0" in atr_hex:
-                    # Likely FeliCa card (Suica, etc.)
-                    result["card_type"] = CardType.SUICA.value
-                    result["card_type_name"] = "FeliCa (Suica/Pasmo/ICOCA)"
-                    result["confidence"] = "high"
-                    conn.disconnect()
-                    return result
-            
-            # Test 1: Try My Number Card JPKI Application
-            mynumber_aid = [0xD3, 0x92, 0xF0, 0x00, 0x26, 0x01, 0x00, 0x00, 0x00, 0x01]
-            select_cmd = [0x00, 0xA4, 0x04, 0x0C, len(mynumber_aid)] + mynumber_aid
-            data, sw1, sw2 = conn.transmit(select_cmd)
-            if sw1 == 0x90:
-                result["card_type"] = CardType.MYNUMBER.value
-                result["card_type_name"] = "マイナンバーカード (My Number Card)"
-                result["card_type_name_en"] = "My Number Card"
-                result["confidence"] = "high"
-                result["jpki_supported"] = True
-                conn.disconnect()
-                return result
-            
-            # Test 1b: Try My Number Profile AP
-            profile_aid = [0xD3, 0x92, 0x10, 0x00, 0x31, 0x00, 0x01, 0x01, 0x04, 0x08]
-            select_cmd = [0x00, 0xA4, 0x04, 0x0C, len(profile_aid)] + profile_aid
-            data, sw1, sw2 = conn.transmit(select_cmd)
-            if sw1 == 0x90:
-                result["card_type"] = CardType.MYNUMBER.value
-                result["card_type_name"] = "マイナンバーカード (My Number Card)"
-                result["card_type_name_en"] = "My Number Card"
-                result["confidence"] = "high"
-                result["profile_ap_supported"] = True
-                conn.disconnect()
-                return result
-            
-            # Test 2: Try Zairyu Card (SELECT MF + DF1)
-            # First SELECT MF
-            mf_cmd = [0x00, 0xA4, 0x00, 0x00, 0x02, 0x3F, 0x00]
-            data, sw1, sw2 = conn.transmit(mf_cmd)
-            mf_success = (sw1 == 0x90)
-            
-            if mf_success:
-                # Try Zairyu DF1 AID
-                zairyu_aid = [0xD3, 0x92, 0xF0, 0x00, 0x4F, 0x02, 0x00, 0x00, 
-                              0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]
-                select_cmd = [0x00, 0xA4, 0x04, 0x0C, len(zairyu_aid)] + zairyu_aid
-                data, sw1, sw2 = conn.transmit(select_cmd)
-                if sw1 == 0x90:
-                    result["card_type"] = CardType.ZAIRYU.value
-                    result["card_type_name"] = "在留カード (Residence Card)"
-                    result["card_type_name_en"] = "Residence Card"
-                    result["confidence"] = "high"
-                    conn.disconnect()
-                    return result
-            
-            # Test 3: Try ICAO 9303 MRTD (Passport/CCCD)
-            mrtd_aid = [0xA0, 0x00, 0x00, 0x02, 0x47, 0x10, 0x01]
-            select_cmd = [0x00, 0xA4, 0x04, 0x0C, len(mrtd_aid)] + mrtd_aid
-            data, sw1, sw2 = conn.transmit(select_cmd)
-            if sw1 == 0x90:
-                result["card_type"] = CardType.PASSPORT.value
-                result["card_type_name"] = "e-Passport / CCCD"
-                result["card_type_name_en"] = "e-Passport or National ID"
-                result["confidence"] = "high"
-                result["mrtd_supported"] = True
-                conn.disconnect()
-                return result
             
-            # Test 4: Try EMV Credit Card applications
-            emv_aids = [
-                ([0xA0, 0x00, 0x00, 0x00, 0x04, 0x10, 0x10], "Mastercard"),
-                ([0xA0, 0x00, 0x00, 0x00, 0x03, 0x10, 0x10], "Visa"),
-                ([0xA0, 0x00, 0x00, 0x00, 0x25, 0x01, 0x01, 0x01], "American Express"),
-                ([0xA0, 0x00, 0x00, 0x00, 0x65, 0x10, 0x10, 0x01], "JCB"),
-            ]
-            
-            for aid, brand in emv_aids:
-                select_cmd = [0x00, 0xA4, 0x04, 0x00, len(aid)] + aid
-                data, sw1, sw2 = conn.transmit(select_cmd)
-                if sw1 == 0x90 or sw1 == 0x61:
-                    result["card_type"] = CardType.CREDIT.value
-                    result["card_type_name"] = f"クレジットカード ({brand})"
-                    result["card_type_name_en"] = f"Credit Card ({brand})"
-                    result["card_brand"] = brand
-                    result["confidence"] = "high"
-                    conn.disconnect()
-                    return result
-            
-            # If MF selection worked but no specific app found, might be Zairyu
-            if mf_success:
-                result["card_type"] = CardType.ZAIRYU.value
-                result["card_type_name"] = "在留カード (Residence Card) - 推定"
-                result["card_type_name_en"] = "Residence Card (estimated)"
-                result["confidence"] = "medium"
-                result["note"] = "MF selection succeeded, likely Zairyu card"
-                conn.disconnect()
-                return result
-            
-            # Unknown card
-            result["card_type"] = CardType.GENERIC.value
-            result["card_type_name"] = "不明なNFCカード"
-            result["card_type_name_en"] = "Unknown NFC Card"
-            result["confidence"] = "low"
+            # Same card still on the reader: reuse the recent result instead
+            # of re-running the SELECT probes
+            cache_key = (bytes(atr or []), result.get("uid"))
+            cached = self._last_detection
+            if cached and cached[0] == cache_key and time.monotonic() - cached[1] < self.DETECT_CACHE_TTL:
+                return {**cached[2], "timestamp": result["timestamp"]}
             
-            conn.disconnect()
+            self._classify_card(conn, reader, atr, result)
+            self._last_detection = (cache_key, time.monotonic(), dict(result))
             return result
             
         except NoCardException:
+            self._drop_conn()
+            self._last_detection = None
             return {
                 "success": False,
                 "card_type": CardType.NONE.value,
@@ -342,7 +953,8 @@ class NFCBridge:
                 "error_en": "No card detected on reader"
             }
         except Exception as e:
-            logger.error(f"Card detection error: {e}")
+            self._drop_conn()
+            logger.error("Card detection error: %s", e)
             return {
                 "success": False,
                 "card_type": CardType.NONE.value,
@@ -376,8 +988,8 @@ class NFCBridge:
             
             # Build card data from detection result
             card_data = {
-                "timestamp": datetime.now().isoformat(),
-                "reader": str(reader),
+                "timestamp": _iso_now(),
+                "reader": self._reader_name_of(reader),
                 "card_type": type_result.get("card_type", "generic"),
                 "card_type_name": type_result.get("card_type_name", "不明なカード"),
                 "card_type_name_en": type_result.get("card_type_name_en", "Unknown Card"),
@@ -407,7 +1019,7 @@ class NFCBridge:
         except NoCardException:
             return {"success": False, "error": "No card on reader"}
         except Exception as e:
-            logger.error(f"Read error: {e}")
+            logger.error("Read error: %s", e)
             return {"success": False, "error": str(e)}
     
     def read_cccd_card(self, card_number: str, birth_date: str, expiry_date: str) -> Dict[str, Any]:
@@ -429,33 +1041,32 @@ class NFCBridge:
             return {"success": False, "error": "No reader found"}
         
         try:
-            conn = reader.createConnection()
-            conn.connect()
+            conn = self._acquire_conn(reader)
             
             card_data = {
                 "card_number_input": card_number,
                 "birth_date_input": birth_date,
                 "expiry_date_input": expiry_date,
-                "timestamp": datetime.now().isoformat(),
-                "reader": str(reader)
+                "timestamp": _iso_now(),
+                "reader": self._reader_name_of(reader)
             }
             
             # Get ATR
             atr = conn.getATR()
             if atr:
-                card_data["atr"] = get_hex_string(atr)
+                card_data["atr"] = bytes(atr).hex(" ").upper()
             
             # Get UID
             data, sw1, sw2 = conn.transmit(APDU.GET_UID)
             if sw1 == 0x90:
-                card_data["uid"] = get_hex_string(data).replace(" ", "")
+                card_data["uid"] = bytes(data).hex().upper()
             
             # Select MRTD application
             data, sw1, sw2 = conn.transmit(APDU.SELECT_MRTD_APP)
             if sw1 != 0x90:
                 card_data["app_selected"] = False
                 card_data["error"] = f"Cannot select MRTD app: SW={sw1:02X}{sw2:02X}"
-                conn.disconnect()
+                self._drop_conn()
                 return {"success": True, "data": card_data}
             
             card_data["app_selected"] = True
@@ -465,7 +1076,7 @@ class NFCBridge:
             data, sw1, sw2 = conn.transmit(APDU.GET_CHALLENGE)
             if sw1 != 0x90:
                 card_data["bac_error"] = f"Cannot get challenge: SW={sw1:02X}{sw2:02X}"
-                conn.disconnect()
+                self._drop_conn()
                 return {"success": True, "data": card_data}
             
             rnd_ic = bytes(data)
@@ -474,7 +1085,7 @@ class NFCBridge:
             if not CRYPTO_AVAILABLE:
                 card_data["bac_error"] = "pycryptodome not installed"
                 card_data["install_hint"] = "pip install pycryptodome"
-                conn.disconnect()
+                self._drop_conn()
                 return {"success": True, "data": card_data}
             
             # Perform BAC authentication
@@ -505,7 +1116,7 @@ class NFCBridge:
                 card_data["authenticated"] = False
                 card_data["auth_error"] = f"Authentication failed: SW={sw1:02X}{sw2:02X}"
                 card_data["hint"] = "Check card number, birth date, and expiry date"
-                conn.disconnect()
+                self._drop_conn()
                 return {"success": True, "data": card_data}
             
             card_data["authenticated"] = True
@@ -521,7 +1132,7 @@ class NFCBridge:
             decrypted = BACAuthentication.decrypt_data(k_enc, e_ic)
             k_ic = decrypted[16:32]
             
-            key_seed = bytes(a ^ b for a, b in zip(k_ifd, k_ic))
+            key_seed = xor_bytes(k_ifd, k_ic)
             ks_enc = BACAuthentication.compute_key(key_seed, "ENC")
             ks_mac = BACAuthentication.compute_key(key_seed, "MAC")
             
@@ -553,7 +1164,8 @@ class NFCBridge:
                             length = raw_bytes[mrz_start + 2]
                             mrz_data = raw_bytes[mrz_start + 3:mrz_start + 3 + length]
                             card_data["mrz"] = mrz_data.decode('utf-8', errors='replace')
-                    except:
+                    except IndexError:
+                        # Truncated DG1 (length byte missing)
                         pass
                 elif sw1 == 0x6C:
                     read_cmd = [0x00, 0xB0, 0x00, 0x00, sw2]
@@ -568,14 +1180,15 @@ class NFCBridge:
             if sw1 == 0x90:
                 card_data["dg11_available"] = True
             
-            conn.disconnect()
+            self._drop_conn()
             return {"success": True, "data": card_data}
             
         except NoCardException:
+            self._drop_conn()
             return {"success": False, "error": "No card on reader"}
         except Exception as e:
-            logger.error(f"CCCD read error: {e}")
-            import traceback
+            self._drop_conn()
+            logger.error("CCCD read error: %s", e)
             traceback.print_exc()
             return {"success": False, "error": str(e)}
     
@@ -601,22 +1214,21 @@ class NFCBridge:
             return {"success": False, "error": "No reader found"}
         
         try:
-            conn = reader.createConnection()
-            conn.connect()
+            conn = self._acquire_conn(reader)
             
             card_data = {
-                "timestamp": datetime.now().isoformat(),
-                "reader": str(reader),
+                "timestamp": _iso_now(),
+                "reader": self._reader_name_of(reader),
                 "card_type": "マイナンバーカード"
             }
             
             atr = conn.getATR()
             if atr:
-                card_data["atr"] = get_hex_string(atr)
+                card_data["atr"] = bytes(atr).hex(" ").upper()
             
             data, sw1, sw2 = conn.transmit(APDU.GET_UID)
             if sw1 == 0x90:
-                card_data["uid"] = get_hex_string(data).replace(" ", "")
+                card_data["uid"] = bytes(data).hex().upper()
             
             mynumber_reader = MyNumberCardReader(conn)
             
@@ -655,15 +1267,43 @@ class NFCBridge:
             else:
                 card_data["note"] = "4桁のPINを入力すると個人番号・氏名・住所などが読み取れます"
             
-            conn.disconnect()
+            self._drop_conn()
             return {"success": True, "data": card_data}
             
         except NoCardException:
+            self._drop_conn()
             return {"success": False, "error": "No card on reader"}
         except Exception as e:
-            logger.error(f"My Number card read error: {e}")
+            self._drop_conn()
+            logger.error("My Number card read error: %s", e)
             return {"success": False, "error": str(e)}
     
+    def _run_suica_subprocess(self, script_path: str) -> Optional[Dict[str, Any]]:
+        """Run suica_subprocess.py once and return its parsed JSON result (None on failure)"""
+        try:
+            result = subprocess.run(
+                [sys.executable, script_path],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                cwd=os.path.dirname(__file__)
+            )
+            
+            if result.stderr:
+                logger.info("Subprocess stderr: %s", result.stderr[:500])
+            
+            if result.returncode == 0 and result.stdout:
+                try:
+                    return json.loads(result.stdout)
+                except json.JSONDecodeError:
+                    logger.warning("Invalid JSON from subprocess")
+                    
+        except subprocess.TimeoutExpired:
+            logger.warning("Suica subprocess timed out")
+        except Exception as e:
+            logger.warning("nfcpy subprocess error: %s", e)
+        return None
+    
     def read_suica_card(self, use_nfcpy: bool = True) -> Dict[str, Any]:
         """Read Suica/Pasmo/ICOCA transit cards."""
         from readers.suica import SuicaReader, NfcpySuicaReader
@@ -671,41 +1311,30 @@ class NFCBridge:
         
         # Try nfcpy subprocess for full access
         if use_nfcpy and NFCPY_AVAILABLE:
+            # Release our PC/SC handle so the subprocess gets the reader
+            self._drop_conn()
             logger.info("Attempting Suica read via nfcpy subprocess...")
-            try:
-                import subprocess
-                import sys
-                
-                script_path = os.path.join(os.path.dirname(__file__), 'suica_subprocess.py')
+            script_path = os.path.join(os.path.dirname(__file__), 'suica_subprocess.py')
+            
+            if os.path.exists(script_path):
+                data = None
+                try:
+                    # Persistent worker: no Python/nfcpy start-up cost per read
+                    if self._suica_worker is None:
+                        self._suica_worker = _SuicaWorker(script_path)
+                    data = self._suica_worker.read(timeout=30)
+                except TimeoutError:
+                    logger.warning("Suica subprocess timed out")
+                except Exception as e:
+                    logger.warning("Suica worker failed, falling back to one-shot subprocess: %s", e)
+                    data = self._run_suica_subprocess(script_path)
                 
-                if os.path.exists(script_path):
-                    result = subprocess.run(
-                        [sys.executable, script_path],
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                        cwd=os.path.dirname(__file__)
-                    )
-                    
-                    if result.returncode == 0 and result.stdout:
-                        try:
-                            data = json.loads(result.stdout)
-                            if data.get("success"):
-                                return {"success": True, "data": data.get("data", {})}
-                            else:
-                                logger.warning(f"Suica subprocess error: {data.get('error')}")
-                        except json.JSONDecodeError:
-                            logger.warning(f"Invalid JSON from subprocess")
-                    
-                    if result.stderr:
-                        logger.info(f"Subprocess stderr: {result.stderr[:500]}")
-                else:
-                    logger.warning(f"suica_subprocess.py not found")
-                    
-            except subprocess.TimeoutExpired:
-                logger.warning("Suica subprocess timed out")
-            except Exception as e:
-                logger.warning(f"nfcpy subprocess error: {e}")
+                if data is not None:
+                    if data.get("success"):
+                        return {"success": True, "data": data.get("data", {})}
+                    logger.warning("Suica subprocess error: %s", data.get('error'))
+            else:
+                logger.warning("suica_subprocess.py not found")
         
         # Fallback to PC/SC
         if not SMARTCARD_AVAILABLE:
@@ -724,18 +1353,17 @@ class NFCBridge:
             return {"success": False, "error": "No reader found"}
         
         try:
-            conn = reader.createConnection()
-            conn.connect()
+            conn = self._acquire_conn(reader)
             
             card_data = {
-                "timestamp": datetime.now().isoformat(),
-                "reader": str(reader),
+                "timestamp": _iso_now(),
+                "reader": self._reader_name_of(reader),
                 "access_method": "PC/SC (limited)"
             }
             
             atr = conn.getATR()
             if atr:
-                card_data["atr"] = get_hex_string(atr)
+                card_data["atr"] = bytes(atr).hex(" ").upper()
             
             suica_reader = SuicaReader(conn)
             result = suica_reader.read_card()
@@ -744,17 +1372,18 @@ class NFCBridge:
             if "error" in result:
                 data, sw1, sw2 = conn.transmit(APDU.GET_UID)
                 if sw1 == 0x90:
-                    card_data["uid"] = get_hex_string(data).replace(" ", "")
+                    card_data["uid"] = bytes(data).hex().upper()
                     card_data["note"] = "FeliCa commands failed - showing UID only"
             
-            conn.disconnect()
             return {"success": True, "data": card_data}
             
         except NoCardException:
+            self._drop_conn()
             return {"success": False, "error": "No card on reader"}
         except Exception as e:
-            logger.error(f"Suica card read error: {e}")
-            import traceback
+            self._drop_conn()
+            self.invalidate_reader_cache()
+            logger.error("Suica card read error: %s", e)
             traceback.print_exc()
             return {"success": False, "error": str(e)}
     
@@ -779,8 +1408,7 @@ class NFCBridge:
             return {"success": False, "error": "No reader found"}
         
         try:
-            conn = reader.createConnection()
-            conn.connect()
+            conn = self._acquire_conn(reader)
             
             zairyu_reader = ZairyuCardReader(
                 conn, 
@@ -790,7 +1418,7 @@ class NFCBridge:
             
             if card_number:
                 if len(card_number) != 12:
-                    conn.disconnect()
+                    self._drop_conn()
                     return {
                         "success": False,
                         "error": "INVALID_CARD_NUMBER",
@@ -803,10 +1431,11 @@ class NFCBridge:
             else:
                 result = zairyu_reader.read_basic_info()
             
-            conn.disconnect()
+            self._drop_conn()
             return {"success": True, "data": result}
             
         except NoCardException:
+            self._drop_conn()
             return {
                 "success": False,
                 "error": "NO_CARD",
@@ -814,8 +1443,8 @@ class NFCBridge:
                 "error_en": "No card detected on reader"
             }
         except Exception as e:
-            logger.error(f"Zairyu card read error: {e}")
-            import traceback
+            self._drop_conn()
+            logger.error("Zairyu card read error: %s", e)
             traceback.print_exc()
             return {"success": False, "error": str(e)}
     
@@ -823,7 +1452,7 @@ class NFCBridge:
         """
         Blocking implementation of My Number card reading.
         This runs in a thread pool to avoid blocking the event loop.
-        All blocking operations (including card presence check) happen here.
+        All blocking operations happen here.
         """
         reader = self.get_reader()
         if not reader:
@@ -834,19 +1463,17 @@ class NFCBridge:
                 "error_en": "No card reader connected"
             }
         
-        # Check if card is present (this is blocking, so we do it here in the thread)
-        if not self.check_card_present():
-            return {
-                "success": False,
-                "error": "NO_CARD",
-                "error_ja": "カードが検出されません",
-                "error_en": "No card detected on reader"
-            }
-        
-        conn = None
         try:
-            conn = reader.createConnection()
-            conn.connect()
+            # No separate presence probe - connect() already fails with NoCardException
+            try:
+                conn = self._acquire_conn(reader)
+            except NoCardException:
+                return {
+                    "success": False,
+                    "error": "NO_CARD",
+                    "error_ja": "カードが検出されません",
+                    "error_en": "No card detected on reader"
+                }
             
             mynumber_reader = MyNumberCardReader(conn)
             
@@ -856,8 +1483,10 @@ class NFCBridge:
             if "error" in result:
                 error_msg = result.get("error", "")
                 remaining = result.get("remaining_tries", -1)
+                match = _MYNUMBER_ERR_RE.search(error_msg)
+                failure = match.group(0) if match else None
                 
-                if "PIN verification failed" in error_msg:
+                if failure == "PIN verification failed":
                     if remaining == 0:
                         return {
                             "success": False,
@@ -874,7 +1503,7 @@ class NFCBridge:
                             "error_en": f"Wrong PIN ({remaining} tries remaining)",
                             "remaining_tries": remaining
                         }
-                elif "Cannot select Profile AP" in error_msg:
+                elif failure == "Cannot select Profile AP":
                     return {
                         "success": False,
                         "error": "NOT_MYNUMBER_CARD",
@@ -891,8 +1520,8 @@ class NFCBridge:
             
             response = {
                 "success": True,
-                "timestamp": datetime.now().isoformat(),
-                "reader": str(reader)
+                "timestamp": _iso_now(),
+                "reader": self._reader_name_of(reader)
             }
             
             if "my_number" in result:
@@ -910,7 +1539,7 @@ class NFCBridge:
             if "gender" in result:
                 response["gender"] = result["gender"]
             
-            logger.info(f"API: Successfully read My Number card")
+            logger.info("API: Successfully read My Number card")
             return response
             
         except NoCardException:
@@ -921,6 +1550,7 @@ class NFCBridge:
                 "error_en": "Card was removed during reading"
             }
         except CardConnectionException as e:
+            self.invalidate_reader_cache()
             return {
                 "success": False,
                 "error": "CONNECTION_ERROR",
@@ -929,8 +1559,7 @@ class NFCBridge:
                 "detail": str(e)
             }
         except Exception as e:
-            logger.error(f"Blocking read_mynumber error: {e}")
-            import traceback
+            logger.error("Blocking read_mynumber error: %s", e)
             traceback.print_exc()
             return {
                 "success": False,
@@ -940,11 +1569,7 @@ class NFCBridge:
             }
         finally:
             # CRITICAL: Always disconnect to release the reader
-            if conn:
-                try:
-                    conn.disconnect()
-                except Exception as e:
-                    logger.warning(f"Error disconnecting card: {e}")
+            self._drop_conn()
     
     async def api_read_mynumber(self, pin: str) -> Dict[str, Any]:
         """API endpoint for reading My Number card."""
@@ -957,25 +1582,14 @@ class NFCBridge:
             }
         
         # Quick validation (non-blocking)
-        if not pin:
-            return {
-                "success": False,
-                "error": "NO_PIN",
-                "error_ja": "PINが入力されていません",
-                "error_en": "PIN is required"
-            }
-        
-        if len(pin) != 4 or not pin.isdigit():
-            return {
-                "success": False,
-                "error": "INVALID_PIN_FORMAT",
-                "error_ja": "PINは4桁の数字である必要があります",
-                "error_en": "PIN must be 4 digits"
-            }
+        invalid = self._validate_params("mynumber", {"pin": pin}, require=True)
+        if invalid:
+            return invalid
         
         try:
             # Run ALL blocking operations in thread pool (including card presence check)
-            result = await self.run_blocking(
+            result = await self._run_coalesced(
+                f"mynumber:{pin}",
                 self._blocking_read_mynumber, 
                 pin,
                 timeout=30.0  # 30 second timeout
@@ -989,9 +1603,15 @@ class NFCBridge:
                 "error_ja": "カード読み取りがタイムアウトしました",
                 "error_en": "Card reading timed out"
             }
+        except ReaderBusyError:
+            return {
+                "success": False,
+                "error": "BUSY",
+                "error_ja": "カードリーダーが使用中です。しばらくしてから再試行してください",
+                "error_en": "Card reader is busy, please try again"
+            }
         except Exception as e:
-            logger.error(f"API read_mynumber error: {e}")
-            import traceback
+            logger.error("API read_mynumber error: %s", e)
             traceback.print_exc()
             return {
                 "success": False,
@@ -1004,7 +1624,7 @@ class NFCBridge:
         """
         Blocking implementation of Zairyu card reading.
         This runs in a thread pool to avoid blocking the event loop.
-        All blocking operations (including card presence check) happen here.
+        All blocking operations happen here.
         """
         reader = self.get_reader()
         if not reader:
@@ -1015,19 +1635,17 @@ class NFCBridge:
                 "error_en": "No card reader connected"
             }
         
-        # Check if card is present (this is blocking, so we do it here in the thread)
-        if not self.check_card_present():
-            return {
-                "success": False,
-                "error": "NO_CARD",
-                "error_ja": "カードが検出されません",
-                "error_en": "No card detected on reader"
-            }
-        
-        conn = None
         try:
-            conn = reader.createConnection()
-            conn.connect()
+            # No separate presence probe - connect() already fails with NoCardException
+            try:
+                conn = self._acquire_conn(reader)
+            except NoCardException:
+                return {
+                    "success": False,
+                    "error": "NO_CARD",
+                    "error_ja": "カードが検出されません",
+                    "error_en": "No card detected on reader"
+                }
             
             zairyu_reader = ZairyuCardReader(
                 conn, 
@@ -1035,14 +1653,16 @@ class NFCBridge:
                 fallback_ocr_provider=self.fallback_ocr_provider
             )
             
-            logger.info(f"API: Reading Zairyu card with number {card_number[:4]}****{card_number[-2:]}")
+            logger.info("API: Reading Zairyu card with number %s****%s", card_number[:4], card_number[-2:])
             
             result = zairyu_reader.read_all_data(card_number)
             
             if "error" in result:
                 error_msg = result.get("error", "")
+                match = _ZAIRYU_ERR_RE.search(error_msg)
+                failure = match.group(0) if match else None
                 
-                if "Mutual authentication failed" in error_msg:
+                if failure == "Mutual authentication failed":
                     return {
                         "success": False,
                         "error": "AUTH_FAILED",
@@ -1050,14 +1670,14 @@ class NFCBridge:
                         "error_en": "Failed mutual authentication with card",
                         "hint": result.get("hint", "")
                     }
-                elif "Card number verification failed" in error_msg:
+                elif failure == "Card number verification failed":
                     return {
                         "success": False,
                         "error": "WRONG_CARD_NUMBER",
                         "error_ja": "在留カード番号が一致しません",
                         "error_en": "Card number does not match"
                     }
-                elif "Cannot select MF" in error_msg:
+                elif failure == "Cannot select MF":
                     return {
                         "success": False,
                         "error": "NOT_ZAIRYU_CARD",
@@ -1075,12 +1695,12 @@ class NFCBridge:
             response = {
                 "success": True,
                 "authenticated": result.get("authenticated", False),
-                "timestamp": datetime.now().isoformat(),
-                "reader": str(reader)
+                "timestamp": _iso_now(),
+                "reader": self._reader_name_of(reader)
             }
             response.update(result)
             
-            logger.info(f"API: Successfully read Zairyu card")
+            logger.info("API: Successfully read Zairyu card")
             return response
             
         except NoCardException:
@@ -1091,6 +1711,7 @@ class NFCBridge:
                 "error_en": "Card was removed during reading"
             }
         except CardConnectionException as e:
+            self.invalidate_reader_cache()
             return {
                 "success": False,
                 "error": "CONNECTION_ERROR",
@@ -1099,8 +1720,7 @@ class NFCBridge:
                 "detail": str(e)
             }
         except Exception as e:
-            logger.error(f"Blocking read_zairyu error: {e}")
-            import traceback
+            logger.error("Blocking read_zairyu error: %s", e)
             traceback.print_exc()
             return {
                 "success": False,
@@ -1110,11 +1730,7 @@ class NFCBridge:
             }
         finally:
             # CRITICAL: Always disconnect to release the reader
-            if conn:
-                try:
-                    conn.disconnect()
-                except Exception as e:
-                    logger.warning(f"Error disconnecting card: {e}")
+            self._drop_conn()
     
     async def api_read_zairyu(self, card_number: str) -> Dict[str, Any]:
         """API endpoint for reading Zairyu (Residence) Card."""
@@ -1127,28 +1743,16 @@ class NFCBridge:
             }
         
         # Quick validation (non-blocking)
-        if not card_number:
-            return {
-                "success": False,
-                "error": "NO_CARD_NUMBER",
-                "error_ja": "在留カード番号が入力されていません",
-                "error_en": "Card number is required"
-            }
-        
-        if len(card_number) != 12:
-            return {
-                "success": False,
-                "error": "INVALID_CARD_NUMBER_FORMAT",
-                "error_ja": "在留カード番号は12桁である必要があります",
-                "error_en": "Card number must be 12 characters",
-                "hint": "Example: AB12345678CD"
-            }
+        invalid = self._validate_params("zairyu", {"card_number": card_number}, require=True)
+        if invalid:
+            return invalid
         
         try:
             # Run ALL blocking operations in thread pool (including card presence check)
             # This prevents blocking the event loop during polling
             # Always read fresh data from card - no caching to prevent stale data issues
-            result = await self.run_blocking(
+            result = await self._run_coalesced(
+                f"zairyu:{card_number}",
                 self._blocking_read_zairyu, 
                 card_number,
                 timeout=90.0  # 90 second timeout for OCR processing
@@ -1163,9 +1767,15 @@ class NFCBridge:
                 "error_ja": "カード読み取りがタイムアウトしました",
                 "error_en": "Card reading timed out"
             }
+        except ReaderBusyError:
+            return {
+                "success": False,
+                "error": "BUSY",
+                "error_ja": "カードリーダーが使用中です。しばらくしてから再試行してください",
+                "error_en": "Card reader is busy, please try again"
+            }
         except Exception as e:
-            logger.error(f"API read_zairyu error: {e}")
-            import traceback
+            logger.error("API read_zairyu error: %s", e)
             traceback.print_exc()
             return {
                 "success": False,
@@ -1176,7 +1786,7 @@ class NFCBridge:
     
     async def api_test_ocr(self, image_base64: str, filename: str = "uploaded") -> Dict[str, Any]:
         """API endpoint for testing OCR on an uploaded image."""
-        logger.info(f"API: Testing OCR on uploaded image: {filename}")
+        logger.info("API: Testing OCR on uploaded image: %s", filename)
         
         if not self.ocr_provider:
             return {
@@ -1195,12 +1805,13 @@ class NFCBridge:
             }
         
         try:
-            import base64
             image_data = base64.b64decode(image_base64)
-            logger.info(f"Decoded image: {len(image_data)} bytes")
+            # Drop the base64 text now - it's the largest object we hold during OCR
+            del image_base64
+            logger.info("Decoded image: %s bytes", len(image_data))
             
-            # Run OCR
-            ocr_result = self.ocr_provider.process_image(image_data)
+            # Run OCR in the thread pool (keeps the event loop responsive)
+            ocr_result = await self.run_ocr(self.ocr_provider.process_image, image_data)
             
             if not ocr_result.success:
                 return {
@@ -1216,8 +1827,8 @@ class NFCBridge:
                 parser = ZairyuCardParser()
                 parsed_fields = parser.parse(ocr_result)
             
-            logger.info(f"OCR extracted {len(ocr_result.text_blocks)} text regions")
-            logger.info(f"Parsed fields: {list(parsed_fields.keys())}")
+            logger.info("OCR extracted %s text regions", len(ocr_result.text_blocks))
+            logger.info("Parsed fields: %s", list(parsed_fields.keys()))
             
             return {
                 "success": True,
@@ -1231,8 +1842,7 @@ class NFCBridge:
             }
             
         except Exception as e:
-            logger.error(f"OCR test error: {e}")
-            import traceback
+            logger.error("OCR test error: %s", e)
             traceback.print_exc()
             return {
                 "success": False,
@@ -1241,201 +1851,236 @@ class NFCBridge:
                 "error_en": f"OCR error: {str(e)}"
             }
     
+    async def _wait_for_card_insert(self, timeout: float) -> bool:
+        """
+        Wait until a card is on the reader.
+        Event-driven via the card monitor; polls every 300 ms if it isn't running.
+        
+        Returns:
+            True if a card is present, False on timeout
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        
+        if self._card_monitor is None:
+            while loop.time() < deadline:
+                if self.check_card_present():
+                    return True
+                await asyncio.sleep(0.3)
+            return False
+        
+        event = asyncio.Event()
+        # Register before checking so an insert in between isn't missed
+        self._card_waiter = (loop, event)
+        try:
+            while True:
+                event.clear()
+                if self.check_card_present():
+                    return True
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                try:
+                    # Woken for any reader's insert; loop re-checks ours
+                    await asyncio.wait_for(event.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return False
+        finally:
+            self._card_waiter = None
+    
     async def wait_for_card(self, card_type: str, params: Dict, timeout: int = 30) -> Dict[str, Any]:
         """Wait for card and read it"""
+        # Reject bad input before spending the whole timeout waiting for a card
+        invalid = self._validate_params(card_type, params)
+        if invalid:
+            return invalid
+        
         self.state = BridgeState.WAITING_FOR_CARD
         
-        await self.broadcast({
-            "type": "status",
-            "status": "waiting_for_card",
-            "message": "Đặt thẻ lên đầu đọc / Place card on reader"
-        })
+        await self.broadcast_raw(_STATUS_WAITING_FRAME)
         
-        start = asyncio.get_event_loop().time()
+        if not await self._wait_for_card_insert(timeout):
+            self.state = BridgeState.IDLE
+            return {"success": False, "error": "Timeout"}
         
-        while True:
-            if asyncio.get_event_loop().time() - start > timeout:
-                self.state = BridgeState.IDLE
-                return {"success": False, "error": "Timeout"}
-            
-            if self.check_card_present():
-                self.state = BridgeState.READING
-                await self.broadcast({
-                    "type": "status",
-                    "status": "reading",
-                    "message": "Đang đọc thẻ / Reading card..."
-                })
-                
-                await asyncio.sleep(0.3)
-                
-                if card_type == "cccd":
-                    result = self.read_cccd_card(
-                        params.get('card_number', ''),
-                        params.get('birth_date', ''),
-                        params.get('expiry_date', '')
-                    )
-                elif card_type == "zairyu":
-                    result = self.read_zairyu_card(params.get('card_number', ''))
-                elif card_type == "mynumber":
-                    result = self.read_mynumber_card(params.get('pin', ''))
-                elif card_type == "suica":
-                    result = self.read_suica_card()
-                else:
-                    result = self.read_generic_card()
-                
-                self.state = BridgeState.IDLE
-                return result
-            
-            await asyncio.sleep(0.3)
+        self.state = BridgeState.READING
+        await self.broadcast_raw(_STATUS_READING_FRAME)
+        
+        await asyncio.sleep(0.3)
+        
+        result = await self._read_card(card_type, params)
+        
+        self.state = BridgeState.IDLE
+        return result
+    
+    @staticmethod
+    def _scan_params(data: Dict) -> Dict[str, str]:
+        """Card parameters of a start_scan/read_now message"""
+        return {
+            "card_number": data.get("card_number", ""),
+            "birth_date": data.get("birth_date", ""),
+            "expiry_date": data.get("expiry_date", ""),
+            "pin": data.get("pin", "")
+        }
     
-    async def handle_message(self, websocket, message: str):
-        """Handle incoming WebSocket message"""
+    async def _on_start_scan(self, websocket, data: Dict):
+        if self.scan_task and not self.scan_task.done():
+            self.scan_task.cancel()
+            try:
+                await self.scan_task
+            except asyncio.CancelledError:
+                pass
+        
+        card_type = data.get("card_type", "generic")
+        timeout = data.get("timeout", 30)
+        params = self._scan_params(data)
+        
+        async def do_scan():
+            result = await self.wait_for_card(card_type, params, timeout)
+            await websocket.send(_dumps({
+                "type": "scan_result",
+                **result
+            }))
+        
+        self.scan_task = asyncio.create_task(do_scan())
+    
+    async def _on_cancel_scan(self, websocket, data: Dict):
+        if self.scan_task and not self.scan_task.done():
+            self.scan_task.cancel()
+        self.state = BridgeState.IDLE
+        # Users often cancel to swap/replug the reader - look it up fresh next time
+        self.invalidate_reader_cache()
+        await websocket.send(_CANCELLED_FRAME)
+    
+    async def _on_read_now(self, websocket, data: Dict):
+        card_type = data.get("card_type", "generic")
+        result = await self._read_card(card_type, self._scan_params(data))
+        await websocket.send(_dumps({
+            "type": "scan_result",
+            **result
+        }))
+    
+    async def _on_read_mynumber(self, websocket, data: Dict):
+        result = await self.api_read_mynumber(data.get("pin", ""))
+        await websocket.send(_dumps({
+            "type": "mynumber_result",
+            **result
+        }))
+    
+    async def _on_read_zairyu(self, websocket, data: Dict):
+        result = await self.api_read_zairyu(data.get("card_number", ""))
+        await websocket.send(_dumps({
+            "type": "zairyu_result",
+            **result
+        }))
+    
+    async def _on_test_ocr(self, websocket, data: Dict):
+        # pop() so the parsed dict doesn't keep a second reference to the image
+        result = await self.api_test_ocr(
+            data.pop("image_base64", ""),
+            data.get("filename", "uploaded_image")
+        )
+        await websocket.send(_dumps({
+            "type": "ocr_result",
+            **result
+        }))
+    
+    async def _on_detect_card_type(self, websocket, data: Dict):
+        # Quick card type detection without deep reading
+        result = await self.run_blocking(self.detect_card_type, timeout=10.0)
+        await websocket.send(_dumps({
+            "type": "card_type_result",
+            **result
+        }))
+    
+    async def _on_get_status(self, websocket, data: Dict):
+        reader = self.get_reader()
+        await websocket.send(_dumps({
+            "type": "status_response",
+            "state": self.state.value,
+            "reader_available": reader is not None,
+            "reader_name": self._reader_name_of(reader),
+            "card_present": self.check_card_present(),
+            "ocr_available": self.ocr_provider is not None
+        }))
+    
+    async def _on_ping(self, websocket, data: Dict):
+        await websocket.send(_PONG_FRAME)
+    
+    async def _run_handler(self, websocket, on_message, data: Dict):
+        """Run one message handler, reporting its failure to the client"""
         try:
-            data = json.loads(message)
+            await on_message(websocket, data)
+        except websockets.exceptions.ConnectionClosed:
+            raise
+        except Exception as e:
+            logger.error("Error: %s", e)
+            await websocket.send(_dumps({"type": "error", "error": str(e)}))
+    
+    async def handle_message(self, websocket, message: str, jobs: Optional[asyncio.Queue] = None):
+        """
+        Handle incoming WebSocket message.
+        
+        Card reads and OCR (QUEUED_MESSAGE_TYPES) are put on jobs when given, so
+        the caller can keep reading control messages (ping, get_status,
+        cancel_scan) while they run. Without jobs everything runs inline.
+        """
+        try:
+            data = _loads(message)
             msg_type = data.get("type", "")
-            
-            logger.info(f"Message: {msg_type}")
-            
-            if msg_type == "start_scan":
-                if self.scan_task and not self.scan_task.done():
-                    self.scan_task.cancel()
-                    try:
-                        await self.scan_task
-                    except asyncio.CancelledError:
-                        pass
-                
-                card_type = data.get("card_type", "generic")
-                timeout = data.get("timeout", 30)
-                
-                params = {
-                    "card_number": data.get("card_number", ""),
-                    "birth_date": data.get("birth_date", ""),
-                    "expiry_date": data.get("expiry_date", ""),
-                    "pin": data.get("pin", "")
-                }
-                
-                async def do_scan():
-                    result = await self.wait_for_card(card_type, params, timeout)
-                    await websocket.send(json.dumps({
-                        "type": "scan_result",
-                        **result
-                    }))
-                
-                self.scan_task = asyncio.create_task(do_scan())
-                
-            elif msg_type == "cancel_scan":
-                if self.scan_task and not self.scan_task.done():
-                    self.scan_task.cancel()
-                self.state = BridgeState.IDLE
-                await websocket.send(json.dumps({
-                    "type": "status",
-                    "status": "cancelled"
-                }))
-                
-            elif msg_type == "read_now":
-                card_type = data.get("card_type", "generic")
-                params = {
-                    "card_number": data.get("card_number", ""),
-                    "birth_date": data.get("birth_date", ""),
-                    "expiry_date": data.get("expiry_date", ""),
-                    "pin": data.get("pin", "")
-                }
-                
-                if card_type == "cccd":
-                    result = self.read_cccd_card(
-                        params['card_number'],
-                        params['birth_date'],
-                        params['expiry_date']
-                    )
-                elif card_type == "zairyu":
-                    result = self.read_zairyu_card(params.get('card_number', ''))
-                elif card_type == "mynumber":
-                    result = self.read_mynumber_card(params.get('pin', ''))
-                elif card_type == "suica":
-                    result = self.read_suica_card()
-                else:
-                    result = self.read_generic_card()
-                
-                await websocket.send(json.dumps({
-                    "type": "scan_result",
-                    **result
-                }))
-                
-            elif msg_type == "read_mynumber":
-                result = await self.api_read_mynumber(data.get("pin", ""))
-                await websocket.send(json.dumps({
-                    "type": "mynumber_result",
-                    **result
-                }))
-            
-            elif msg_type == "read_zairyu":
-                result = await self.api_read_zairyu(data.get("card_number", ""))
-                await websocket.send(json.dumps({
-                    "type": "zairyu_result",
-                    **result
-                }))
-            
-            elif msg_type == "test_ocr":
-                result = await self.api_test_ocr(
-                    data.get("image_base64", ""),
-                    data.get("filename", "uploaded_image")
-                )
-                await websocket.send(json.dumps({
-                    "type": "ocr_result",
-                    **result
-                }))
-            
-            elif msg_type == "detect_card_type":
-                # Quick card type detection without deep reading
-                result = await self.run_blocking(self.detect_card_type, timeout=10.0)
-                await websocket.send(json.dumps({
-                    "type": "card_type_result",
-                    **result
-                }))
-            
-            elif msg_type == "get_status":
-                reader = self.get_reader()
-                await websocket.send(json.dumps({
-                    "type": "status_response",
-                    "state": self.state.value,
-                    "reader_available": reader is not None,
-                    "reader_name": str(reader) if reader else None,
-                    "card_present": self.check_card_present(),
-                    "ocr_available": self.ocr_provider is not None
-                }))
-                
-            elif msg_type == "ping":
-                await websocket.send(json.dumps({"type": "pong"}))
-                
         except json.JSONDecodeError:
-            await websocket.send(json.dumps({"type": "error", "error": "Invalid JSON"}))
+            await websocket.send(_dumps({"type": "error", "error": "Invalid JSON"}))
+            return
         except Exception as e:
-            logger.error(f"Error: {e}")
-            await websocket.send(json.dumps({"type": "error", "error": str(e)}))
+            logger.error("Error: %s", e)
+            await websocket.send(_dumps({"type": "error", "error": str(e)}))
+            return
+        
+        logger.info("Message: %s", msg_type)
+        
+        on_message = self._message_handlers.get(msg_type)
+        if on_message is None:
+            await websocket.send(_dumps({"type": "error", "error": f"Unknown message type: {msg_type}"}))
+            return
+        
+        if jobs is not None and msg_type in self.QUEUED_MESSAGE_TYPES:
+            # Waits only if MAX_QUEUED_MESSAGES are already pending (backpressure)
+            await jobs.put((on_message, data))
+        else:
+            await self._run_handler(websocket, on_message, data)
+    
+    async def _message_worker(self, websocket, jobs: asyncio.Queue):
+        """Run a connection's queued messages one at a time, in arrival order"""
+        while True:
+            on_message, data = await jobs.get()
+            try:
+                await self._run_handler(websocket, on_message, data)
+            except websockets.exceptions.ConnectionClosed:
+                return
     
     async def handler(self, websocket):
         """Handle WebSocket connection"""
-        self.connected_clients.add(websocket)
-        logger.info(f"Client connected. Total: {len(self.connected_clients)}")
+        self._add_client(websocket)
+        logger.info("Client connected. Total: %s", len(self.connected_clients))
         
         reader = self.get_reader()
-        await websocket.send(json.dumps({
-            "type": "connected",
+        await websocket.send(_dumps({
+            **self._greeting_static,
             "state": self.state.value,
             "reader_available": reader is not None,
-            "reader_name": str(reader) if reader else None,
-            "supported_cards": ["generic", "cccd", "zairyu", "mynumber", "suica"],
-            "supported_features": ["detect_card_type"],
-            "version": self.VERSION,
-            "zairyu_auth": "card_number_only",
+            "reader_name": self._reader_name_of(reader),
             "ocr_available": self.ocr_provider is not None
         }))
         
+        # Reads/OCR run on a per-connection worker; this loop keeps draining frames
+        jobs: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_QUEUED_MESSAGES)
+        worker = asyncio.create_task(self._message_worker(websocket, jobs))
         try:
             async for message in websocket:
-                await self.handle_message(websocket, message)
+                await self.handle_message(websocket, message, jobs)
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
-            self.connected_clients.discard(websocket)
-            logger.info(f"Client disconnected. Total: {len(self.connected_clients)}")
+            worker.cancel()
+            self._remove_client(websocket)
+            logger.info("Client disconnected. Total: %s", len(self.connected_clients))
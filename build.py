@@ -3,31 +3,54 @@ NFC Bridge Build Script
 =======================
 Builds the NFC Bridge Server as Windows executables using PyInstaller.
 
-Creates:
-- nfc_server.exe   - Main server executable (run in background)
-- nfc_launcher.exe - Launcher that opens status page in browser
-- nfc_service.exe  - Windows service wrapper
+Creates (one folder per app, PyInstaller --onedir):
+- nfc_server/nfc_server.exe     - Main server executable (run in background)
+- nfc_launcher/nfc_launcher.exe - Launcher that opens status page in browser
+- nfc_service/nfc_service.exe   - Windows service wrapper
 
 Usage:
     python build.py              # Build with OCR (includes EasyOCR+PyTorch, ~500MB-2GB exe)
     python build.py --no-ocr     # Build without OCR (fast, ~50MB exe)
+    python build.py --with-nfcpy # Also bundle nfcpy (direct USB FeliCa access for Suica)
+    python build.py --force      # Rebuild even if sources haven't changed since the last build
+    python build.py --parallel   # Experimental: run the apps' PyInstaller processes side by side
+    python build.py --merge      # Experimental: build server/service from one shared spec (MERGE)
     python build.py server       # Build server only (with OCR)
     python build.py launcher     # Build launcher only
     python build.py service      # Build service only
     python build.py checker      # Build check_system.exe (optional diagnostic tool)
-    python build.py clean        # Clean build artifacts only
+    python build.py clean        # Remove dist/ only (add --deep-clean to drop build/ and .spec files too)
+    python build.py zip          # Also pack dist/ into NFCBridge.zip for distribution
 """
 
 import sys
 import os
+import hashlib
+import importlib.util
+import json
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
 from pathlib import Path
 
 # Configuration
 SCRIPT_DIR = Path(__file__).parent.resolve()
 DIST_DIR = SCRIPT_DIR / "dist"
 BUILD_DIR = SCRIPT_DIR / "build"
+# Pinned so the PyInstaller cache is reused no matter where build.py is run from
+WORKPATH_ARGS = ['--workpath', str(BUILD_DIR)]
+# Pre-imports websockets/pyscard/pycryptodome before the server script runs
+WARMUP_HOOK = SCRIPT_DIR / "runtime_hooks" / "warmup.py"
+
+
+# Set by --force: rebuild even when the outputs look up-to-date
+FORCE_REBUILD = False
+
+
+def app_dir(name):
+    """Output folder of a --onedir build (dist/<name>/<name>.exe + _internal/)"""
+    return DIST_DIR / name
 
 
 def check_pyinstaller():
@@ -45,18 +68,20 @@ def kill_running_processes():
     """Kill any running NFC server processes that might lock files"""
     processes_to_kill = ['nfc_server.exe', 'nfc_service.exe', 'nfc_launcher.exe', 'check_system.exe']
     
-    for proc_name in processes_to_kill:
-        try:
-            # Use taskkill to terminate processes
-            result = subprocess.run(
-                ['taskkill', '/F', '/IM', proc_name],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
+    # One taskkill for all of them - it accepts repeated /IM filters
+    im_args = [arg for proc_name in processes_to_kill for arg in ('/IM', proc_name)]
+    try:
+        result = subprocess.run(
+            ['taskkill', '/F', *im_args],
+            capture_output=True,
+            text=True
+        )
+    except Exception:
+        return  # taskkill not available, nothing to stop
+    for line in result.stdout.splitlines():
+        for proc_name in processes_to_kill:
+            if f'"{proc_name}"' in line:
                 print(f"  Stopped: {proc_name}")
-        except Exception:
-            pass  # Process not running, ignore
 
 
 def rmtree_with_retry(path, max_retries=3, delay=2):
@@ -82,8 +107,13 @@ def rmtree_with_retry(path, max_retries=3, delay=2):
     return True
 
 
-def clean_build():
-    """Clean previous build artifacts"""
+def clean_build(deep=False):
+    """Clean previous build artifacts
+    
+    Args:
+        deep: Also delete build/ (PyInstaller's cached Analysis/PYZ/PKG)
+              and the generated .spec files.
+    """
     print("Cleaning previous build...")
     
     # First, try to kill any running processes that might lock files
@@ -95,19 +125,22 @@ def clean_build():
     time.sleep(1)
     
     success = True
-    for path in [DIST_DIR, BUILD_DIR]:
+    # build/ is PyInstaller's work cache - keeping it lets the next build
+    # skip straight through 'checking Analysis/PYZ/PKG'
+    for path in [DIST_DIR, BUILD_DIR] if deep else [DIST_DIR]:
         if path.exists():
             print(f"  Removing: {path}")
             if not rmtree_with_retry(path):
                 success = False
     
-    # Clean .spec files
-    for spec in SCRIPT_DIR.glob("*.spec"):
-        try:
-            spec.unlink()
-            print(f"  Removed: {spec.name}")
-        except PermissionError:
-            print(f"  [WARNING] Could not delete {spec.name}")
+    # Clean .spec files (only on --deep-clean; PyInstaller regenerates them anyway)
+    if deep:
+        for spec in SCRIPT_DIR.glob("*.spec"):
+            try:
+                spec.unlink()
+                print(f"  Removed: {spec.name}")
+            except PermissionError:
+                print(f"  [WARNING] Could not delete {spec.name}")
     
     if success:
         print("Clean complete")
@@ -122,85 +155,197 @@ def clean_build():
         input()
 
 
-def get_hidden_imports():
-    """Get list of hidden imports needed"""
-    return [
-        # Core
-        'websockets',
-        'websockets.legacy',
-        'websockets.legacy.server',
-        'websockets.server',
-        'websockets.exceptions',
-        'asyncio',
-        'json',
-        'logging',
-        'hashlib',
-        
-        # Smart card (pyscard)
-        'smartcard',
-        'smartcard.System',
-        'smartcard.util',
-        'smartcard.Exceptions',
-        'smartcard.scard',
-        'smartcard.CardConnection',
-        'smartcard.CardRequest',
-        'smartcard.CardType',
-        
-        # Cryptography (pycryptodome)
-        'Crypto',
-        'Crypto.Cipher',
-        'Crypto.Cipher.DES3',
-        'Crypto.Cipher.DES',
-        'Crypto.Cipher.AES',
-        'Crypto.Hash',
-        'Crypto.Hash.SHA1',
-        'Crypto.Hash.SHA256',
-        'Crypto.Util',
-        'Crypto.Util.Padding',
-        # Also try Cryptodome namespace
-        'Cryptodome',
-        'Cryptodome.Cipher',
-        'Cryptodome.Cipher.DES3',
-        'Cryptodome.Cipher.DES',
-        
-        # Image processing (Pillow)
-        'PIL',
-        'PIL.Image',
-        'PIL.ImageFile',
-        'PIL.JpegImagePlugin',
-        'PIL.Jpeg2KImagePlugin',
-        'PIL.PngImagePlugin',
-        
-        # NumPy
-        'numpy',
-        'numpy.core',
-        'numpy.core._multiarray_umath',
-        
-        # EasyOCR and PyTorch
-        'easyocr',
-        'easyocr.easyocr',
-        'easyocr.utils',
-        'easyocr.model',
-        'torch',
-        'torch.nn',
-        'torch.cuda',
-        'torchvision',
-        'torchvision.models',
-        
-        # nfcpy
-        'nfc',
-        'nfc.tag',
-        'nfc.clf',
-        
-        # Windows service
-        'win32serviceutil',
-        'win32service',
-        'win32event',
-        'servicemanager',
-        'win32api',
-        'win32con',
-        'pywintypes',
-    ]
+# Hidden imports, grouped so each build only pulls in what it runs.
+# Core: what server.py/bridge.py import on every start
+CORE_HIDDEN = [
+    'websockets',
+    'websockets.legacy',
+    'websockets.legacy.server',
+    'websockets.server',
+    'websockets.exceptions',
+    'asyncio',
+    'json',
+    'logging',
+    
+    # Smart card (pyscard)
+    'smartcard',
+    'smartcard.System',
+    'smartcard.util',
+    'smartcard.Exceptions',
+    'smartcard.scard',
+    'smartcard.CardConnection',
+    'smartcard.CardRequest',
+    'smartcard.CardType',
+]
+
+# Cryptography (pycryptodome) - needed for BAC / Zairyu secure messaging
+CRYPTO_HIDDEN = [
+    'Crypto',
+    'Crypto.Cipher',
+    'Crypto.Cipher.DES3',
+    'Crypto.Cipher.DES',
+    'Crypto.Cipher.AES',
+    'Crypto.Hash',
+    'Crypto.Hash.SHA1',
+    'Crypto.Hash.SHA256',
+    'Crypto.Util',
+    'Crypto.Util.Padding',
+]
+
+# pycryptodomex namespace - only used when pycryptodome isn't installed
+CRYPTODOME_HIDDEN = [
+    'Cryptodome',
+    'Cryptodome.Cipher',
+    'Cryptodome.Cipher.DES3',
+    'Cryptodome.Cipher.DES',
+    'Cryptodome.Hash',
+    'Cryptodome.Hash.SHA1',
+]
+
+# Image processing (Pillow) - Zairyu card photo conversion
+PIL_HIDDEN = [
+    'PIL',
+    'PIL.Image',
+    'PIL.ImageFile',
+    'PIL.JpegImagePlugin',
+    'PIL.Jpeg2KImagePlugin',
+    'PIL.PngImagePlugin',
+]
+
+# EasyOCR, PyTorch and NumPy (--no-ocr leaves these out)
+OCR_HIDDEN = [
+    'numpy',
+    'numpy.core',
+    'numpy.core._multiarray_umath',
+    'easyocr',
+    'easyocr.easyocr',
+    'easyocr.utils',
+    'easyocr.model',
+    'torch',
+    'torch.nn',
+    'torch.cuda',
+    'torchvision',
+    'torchvision.models',
+]
+
+# nfcpy (--with-nfcpy) - direct USB FeliCa access for Suica
+NFCPY_HIDDEN = [
+    'nfc',
+    'nfc.tag',
+    'nfc.clf',
+]
+
+# Windows service (pywin32) - nfc_service only
+SERVICE_HIDDEN = [
+    'win32serviceutil',
+    'win32service',
+    'win32event',
+    'servicemanager',
+    'win32api',
+    'win32con',
+    'pywintypes',
+]
+
+
+# check_system queries the service and WMI in-process through pywin32
+CHECKER_HIDDEN = [
+    'win32com',
+    'win32com.client',
+]
+
+
+def _crypto_hidden():
+    """pycryptodome modules, or the Cryptodome namespace if that's what is installed"""
+    if importlib.util.find_spec('Crypto') is not None:
+        return CRYPTO_HIDDEN
+    return CRYPTODOME_HIDDEN
+
+
+def get_hidden_imports(include_ocr=False, include_nfcpy=False, include_service=False):
+    """Get list of hidden imports needed
+    
+    Args:
+        include_ocr: Add EasyOCR/PyTorch/NumPy.
+        include_nfcpy: Add nfcpy.
+        include_service: Add the pywin32 service modules.
+    """
+    hidden = CORE_HIDDEN + _crypto_hidden() + PIL_HIDDEN
+    if include_ocr:
+        hidden += OCR_HIDDEN
+    if include_nfcpy:
+        hidden += NFCPY_HIDDEN
+    if include_service:
+        hidden += SERVICE_HIDDEN
+    return hidden
+
+
+def get_app_sources(entry, with_packages=False):
+    """Files whose changes require rebuilding an app
+    
+    Args:
+        entry: Entry script name (e.g. 'server.py').
+        with_packages: Also include server.py, bridge.py, readers/ and ocr/ (server and
+            service - nfc_service imports NFCBridge, HOST/PORT and signal_ready from server).
+    """
+    sources = [SCRIPT_DIR / entry]
+    if with_packages:
+        if entry != 'server.py':
+            sources.append(SCRIPT_DIR / 'server.py')
+        sources.append(SCRIPT_DIR / 'bridge.py')
+        sources.append(WARMUP_HOOK)
+        for pkg in ('readers', 'ocr'):
+            sources.extend((SCRIPT_DIR / pkg).rglob('*.py'))
+    sources.extend(Path(src) for src, _ in get_data_files())
+    return sources
+
+
+def inputs_stamp_path(exe_path):
+    """File next to the exe recording which PyInstaller command built it"""
+    return exe_path.with_name(exe_path.name + '.inputs.sha256')
+
+
+def get_inputs_digest(cmd):
+    """SHA-256 of the PyInstaller command (hidden imports, flags, data files)"""
+    return hashlib.sha256(json.dumps(cmd).encode('utf-8')).hexdigest()
+
+
+def is_up_to_date(exe_path, sources, cmd):
+    """True if exe_path was built by the same command and is newer than every source"""
+    if FORCE_REBUILD:
+        return False
+    stamp = inputs_stamp_path(exe_path)
+    if not exe_path.exists() or not stamp.exists():
+        return False
+    if stamp.read_text(encoding='utf-8').strip() != get_inputs_digest(cmd):
+        return False
+    newest = max(src.stat().st_mtime for src in sources if src.exists())
+    return exe_path.stat().st_mtime >= newest
+
+
+def write_inputs_stamp(exe_path, cmd):
+    """Record the command that built exe_path (read by is_up_to_date)"""
+    if exe_path.exists():
+        inputs_stamp_path(exe_path).write_text(get_inputs_digest(cmd), encoding='utf-8')
+
+
+def run_pyinstaller(cmd, name):
+    """Run a PyInstaller command, returning True on success
+    
+    The (very verbose) output goes to build/<name>.log rather than the
+    console - that keeps parallel builds from interleaving and saves the
+    console flushes. On failure the last lines of the log are printed.
+    """
+    BUILD_DIR.mkdir(exist_ok=True)
+    log_path = BUILD_DIR / f"{name}.log"
+    print(f"  PyInstaller output: {log_path}")
+    with open(log_path, 'wb') as log:
+        result = subprocess.run(cmd, cwd=str(SCRIPT_DIR), stdout=log, stderr=subprocess.STDOUT)
+    if result.returncode != 0:
+        lines = log_path.read_text(encoding='utf-8', errors='replace').splitlines()
+        print(f"  --- last {min(len(lines), 50)} lines of {log_path.name} ---")
+        for line in lines[-50:]:
+            print(f"  {line}")
+    return result.returncode == 0
 
 
 def get_data_files():
@@ -221,19 +366,25 @@ def get_data_files():
 
 
 def get_collect_packages():
-    """Get packages that need all submodules collected"""
+    """Get packages that need all submodules collected
+    
+    Kept to pyscard (it loads its platform modules dynamically). Crypto, PIL
+    and websockets are covered by the hidden imports above - --collect-all
+    would make PyInstaller walk every one of their submodules.
+    """
     return [
         'smartcard',
-        'Crypto',
-        'Cryptodome',
-        'PIL',
-        'websockets',
     ]
 
 
-def get_excluded_packages():
-    """Packages to exclude from the build (too large or problematic)"""
-    return [
+def get_excluded_packages(include_ocr=True, include_nfcpy=True):
+    """Packages to exclude from the build (too large or problematic)
+    
+    Args:
+        include_ocr: If False, also exclude the EasyOCR/PyTorch stack.
+        include_nfcpy: If False, also exclude nfcpy.
+    """
+    excluded = [
         # These are definitely not needed
         'tensorflow',
         'keras',
@@ -242,7 +393,29 @@ def get_excluded_packages():
         'matplotlib',
         'IPython',
         'jupyter',
+        'notebook',
+        # Dragged in by optional imports of numpy/PIL/torch, never used here
+        'tkinter',
+        '_tkinter',
+        'pandas',
+        'pytest',
+        'sphinx',
     ]
+    if not include_ocr:
+        excluded += ['torch', 'torchvision', 'torchaudio', 'easyocr', 'scipy', 'skimage', 'numpy']
+    if not include_nfcpy:
+        excluded.append('nfc')
+    return excluded
+
+
+def find_leaked_packages(name, excluded):
+    """Excluded packages that still ended up in dist/<name>/_internal
+    
+    Only packages that ship binaries/data get a folder there (pure-Python
+    modules live in the PYZ archive) - those are the big ones that matter.
+    """
+    internal = app_dir(name) / '_internal'
+    return [pkg for pkg in excluded if '.' not in pkg and (internal / pkg).is_dir()]
 
 
 def get_torch_binaries():
@@ -257,12 +430,46 @@ def get_torch_binaries():
     ]
 
 
-def build_server(include_ocr=True):
+def pyinstaller_args(flag, values):
+    """Expand values into PyInstaller argv: (flag, v1, flag, v2, ...)"""
+    return tuple(arg for value in values for arg in (flag, value))
+
+
+@cache
+def get_hidden_import_args(include_ocr=False, include_nfcpy=False, include_service=False):
+    """--hidden-import argv for get_hidden_imports() (computed once per flag set)"""
+    return pyinstaller_args('--hidden-import', get_hidden_imports(
+        include_ocr=include_ocr, include_nfcpy=include_nfcpy, include_service=include_service
+    ))
+
+
+@cache
+def get_collect_args():
+    """--collect-all argv for get_collect_packages()"""
+    return pyinstaller_args('--collect-all', get_collect_packages())
+
+
+@cache
+def get_exclude_args(include_ocr=True, include_nfcpy=True):
+    """--exclude-module argv for get_excluded_packages()"""
+    return pyinstaller_args('--exclude-module', get_excluded_packages(
+        include_ocr=include_ocr, include_nfcpy=include_nfcpy
+    ))
+
+
+@cache
+def get_data_args():
+    """--add-data argv for get_data_files()"""
+    return pyinstaller_args('--add-data', [f'{src};{dst}' for src, dst in get_data_files()])
+
+
+def build_server(include_ocr=True, include_nfcpy=False):
     """Build the main server executable
     
     Args:
         include_ocr: If True, includes EasyOCR+PyTorch (~2GB exe). 
                      If False, builds without OCR (~50MB exe).
+        include_nfcpy: If True, bundles nfcpy for direct FeliCa access.
     """
     print("\n" + "=" * 60)
     print("Building NFC Server...")
@@ -273,57 +480,45 @@ def build_server(include_ocr=True):
         print("Without OCR (fast build, ~50MB exe)")
     print("=" * 60)
     
-    hidden_imports = get_hidden_imports()
-    hidden_import_args = []
-    for imp in hidden_imports:
-        hidden_import_args.extend(['--hidden-import', imp])
-    
-    # Collect all submodules for complex packages
-    collect_args = []
-    for pkg in get_collect_packages():
-        collect_args.extend(['--collect-all', pkg])
-    
     # PyTorch binaries for OCR support
     torch_args = []
     if include_ocr:
         torch_args = get_torch_binaries()
     
-    # Exclude large/problematic packages
-    exclude_args = []
-    for pkg in get_excluded_packages():
-        exclude_args.extend(['--exclude-module', pkg])
-    
-    # If not including OCR, also exclude torch
-    if not include_ocr:
-        for pkg in ['torch', 'torchvision', 'torchaudio', 'easyocr']:
-            exclude_args.extend(['--exclude-module', pkg])
-    
-    data_files = get_data_files()
-    data_args = []
-    for src, dst in data_files:
-        data_args.extend(['--add-data', f'{src};{dst}'])
+    # Exclude large/problematic packages (and OCR/nfcpy when not selected)
+    excluded = get_excluded_packages(include_ocr=include_ocr, include_nfcpy=include_nfcpy)
     
     cmd = [
         sys.executable, '-m', 'PyInstaller',
-        '--onefile',
+        '--onedir',  # No unpacking to %TEMP% on every launch
         '--name', 'nfc_server',
         '--icon', 'NONE',  # Add icon if you have one
         '--console',  # Show console for debugging, use --noconsole for production
         '--noupx',
         '--noconfirm',  # Don't ask to overwrite
-        *hidden_import_args,
-        *collect_args,
+        *WORKPATH_ARGS,
+        *get_hidden_import_args(include_ocr, include_nfcpy),
+        *get_collect_args(),  # Collect all submodules for complex packages
         *torch_args,
-        *exclude_args,
-        *data_args,
+        *get_exclude_args(include_ocr, include_nfcpy),
+        *get_data_args(),
+        '--runtime-hook', str(WARMUP_HOOK),
         str(SCRIPT_DIR / 'server.py')
     ]
     
-    print(f"Running PyInstaller...")
-    result = subprocess.run(cmd, cwd=str(SCRIPT_DIR))
+    exe_path = app_dir('nfc_server') / 'nfc_server.exe'
+    if is_up_to_date(exe_path, get_app_sources('server.py', with_packages=True), cmd):
+        print("✓ Server up-to-date: dist/nfc_server/nfc_server.exe (use --force to rebuild)")
+        return True
     
-    if result.returncode == 0:
-        print("✓ Server build complete: dist/nfc_server.exe")
+    print(f"Running PyInstaller...")
+    if run_pyinstaller(cmd, exe_path.stem):
+        leaked = find_leaked_packages('nfc_server', excluded)
+        if leaked:
+            print(f"✗ Server build bundled excluded packages: {', '.join(leaked)}")
+            return False
+        write_inputs_stamp(exe_path, cmd)
+        print("✓ Server build complete: dist/nfc_server/nfc_server.exe")
         return True
     else:
         print("✗ Server build failed")
@@ -336,80 +531,74 @@ def build_launcher():
     print("Building NFC Launcher...")
     print("=" * 60)
     
-    # Include status.html with launcher
-    data_files = get_data_files()
-    data_args = []
-    for src, dst in data_files:
-        data_args.extend(['--add-data', f'{src};{dst}'])
-    
     cmd = [
         sys.executable, '-m', 'PyInstaller',
-        '--onefile',
+        '--onedir',  # No unpacking to %TEMP% on every launch
         '--name', 'nfc_launcher',
         '--icon', 'NONE',
         '--noconsole',  # No console for launcher
         '--noupx',
-        *data_args,
+        '--noconfirm',  # Replace the existing dist/nfc_launcher folder
+        *WORKPATH_ARGS,
+        *get_exclude_args(False, False),  # Stdlib only - keep anything heavy out
+        *get_data_args(),  # Include status.html with launcher
         str(SCRIPT_DIR / 'launcher.py')
     ]
     
-    print(f"Running: {' '.join(cmd[:10])}...")
-    result = subprocess.run(cmd, cwd=str(SCRIPT_DIR))
+    exe_path = app_dir('nfc_launcher') / 'nfc_launcher.exe'
+    if is_up_to_date(exe_path, get_app_sources('launcher.py'), cmd):
+        print("✓ Launcher up-to-date: dist/nfc_launcher/nfc_launcher.exe (use --force to rebuild)")
+        return True
     
-    if result.returncode == 0:
-        print("✓ Launcher build complete: dist/nfc_launcher.exe")
+    print(f"Running: {' '.join(cmd[:10])}...")
+    if run_pyinstaller(cmd, exe_path.stem):
+        write_inputs_stamp(exe_path, cmd)
+        print("✓ Launcher build complete: dist/nfc_launcher/nfc_launcher.exe")
         return True
     else:
         print("✗ Launcher build failed")
         return False
 
 
-def build_service():
+def build_service(include_ocr=True, include_nfcpy=False):
     """Build the Windows service executable"""
     print("\n" + "=" * 60)
     print("Building NFC Service...")
     print("=" * 60)
     
-    hidden_imports = get_hidden_imports()
-    hidden_import_args = []
-    for imp in hidden_imports:
-        hidden_import_args.extend(['--hidden-import', imp])
-    
-    # Collect all submodules for complex packages
-    collect_args = []
-    for pkg in get_collect_packages():
-        collect_args.extend(['--collect-all', pkg])
-    
-    # Exclude large/problematic packages
-    exclude_args = []
-    for pkg in get_excluded_packages():
-        exclude_args.extend(['--exclude-module', pkg])
-    
-    data_files = get_data_files()
-    data_args = []
-    for src, dst in data_files:
-        data_args.extend(['--add-data', f'{src};{dst}'])
+    # Exclude large/problematic packages (and OCR/nfcpy when not selected)
+    excluded = get_excluded_packages(include_ocr=include_ocr, include_nfcpy=include_nfcpy)
     
     cmd = [
         sys.executable, '-m', 'PyInstaller',
-        '--onefile',
+        '--onedir',  # No unpacking to %TEMP% on every launch
         '--name', 'nfc_service',
         '--icon', 'NONE',
         '--console',
         '--noupx',
         '--noconfirm',
-        *hidden_import_args,
-        *collect_args,
-        *exclude_args,
-        *data_args,
+        *WORKPATH_ARGS,
+        *get_hidden_import_args(include_ocr, include_nfcpy, True),
+        *get_collect_args(),
+        *get_exclude_args(include_ocr, include_nfcpy),
+        *get_data_args(),
+        '--runtime-hook', str(WARMUP_HOOK),
         str(SCRIPT_DIR / 'nfc_service.py')
     ]
     
-    print(f"Running: {' '.join(cmd[:10])}...")
-    result = subprocess.run(cmd, cwd=str(SCRIPT_DIR))
+    exe_path = app_dir('nfc_service') / 'nfc_service.exe'
+    if is_up_to_date(exe_path, get_app_sources('nfc_service.py', with_packages=True), cmd):
+        print("✓ Service up-to-date: dist/nfc_service/nfc_service.exe (use --force to rebuild)")
+        return True
     
-    if result.returncode == 0:
-        print("✓ Service build complete: dist/nfc_service.exe")
+    print(f"Running: {' '.join(cmd[:10])}...")
+    if run_pyinstaller(cmd, exe_path.stem):
+        leaked = find_leaked_packages('nfc_service', excluded)
+        if leaked:
+            print(f"✗ Service build bundled excluded packages: {', '.join(leaked)}")
+            return False
+        write_inputs_stamp(exe_path, cmd)
+        print("✓ Service build complete: dist/nfc_service/nfc_service.exe")
         return True
     else:
         print("✗ Service build failed")
@@ -422,62 +611,233 @@ def build_checker():
     print("Building System Checker...")
     print("=" * 60)
     
-    hidden_imports = get_hidden_imports()
-    hidden_import_args = []
-    for imp in hidden_imports:
-        hidden_import_args.extend(['--hidden-import', imp])
-    
     cmd = [
         sys.executable, '-m', 'PyInstaller',
-        '--onefile',
+        '--onedir',  # No unpacking to %TEMP% on every launch
         '--name', 'check_system',
         '--icon', 'NONE',
         '--console',
         '--noupx',
-        *hidden_import_args,
+        '--noconfirm',
+        *WORKPATH_ARGS,
+        *get_hidden_import_args(False, False, True),
+        *pyinstaller_args('--hidden-import', CHECKER_HIDDEN),
+        *get_exclude_args(False, False),
         str(SCRIPT_DIR / 'check_system.py')
     ]
     
-    print(f"Running: {' '.join(cmd[:10])}...")
-    result = subprocess.run(cmd, cwd=str(SCRIPT_DIR))
+    exe_path = app_dir('check_system') / 'check_system.exe'
+    if is_up_to_date(exe_path, get_app_sources('check_system.py'), cmd):
+        print("✓ System checker up-to-date: dist/check_system/check_system.exe (use --force to rebuild)")
+        return True
     
-    if result.returncode == 0:
-        print("✓ System checker build complete: dist/check_system.exe")
+    print(f"Running: {' '.join(cmd[:10])}...")
+    if run_pyinstaller(cmd, exe_path.stem):
+        write_inputs_stamp(exe_path, cmd)
+        print("✓ System checker build complete: dist/check_system/check_system.exe")
         return True
     else:
         print("✗ System checker build failed")
         return False
 
 
+MERGED_SPEC = SCRIPT_DIR / "nfc_bundle.spec"
+
+MERGED_SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build.py (build_all_merged) - edit build.py instead
+import os
+
+from PyInstaller.utils.hooks import collect_all, collect_data_files, collect_dynamic_libs, copy_metadata
+
+APPS = {apps!r}
+
+analyses = []
+for name, app in APPS.items():
+    datas = list(app['datas'])
+    binaries = []
+    hiddenimports = list(app['hiddenimports'])
+    for pkg in app['collect']:
+        pkg_datas, pkg_binaries, pkg_hidden = collect_all(pkg)
+        datas += pkg_datas
+        binaries += pkg_binaries
+        hiddenimports += pkg_hidden
+    if app['torch']:
+        binaries += collect_dynamic_libs('torch') + collect_dynamic_libs('torchvision')
+        datas += collect_data_files('torch')
+        datas += copy_metadata('torch') + copy_metadata('torchvision') + copy_metadata('easyocr')
+    analysis = Analysis(
+        [app['script']],
+        datas=datas,
+        binaries=binaries,
+        hiddenimports=hiddenimports,
+        excludes=app['excludes'],
+        runtime_hooks=app['runtime_hooks'],
+    )
+    script_name = os.path.splitext(os.path.basename(app['script']))[0]
+    analyses.append((analysis, script_name, name))
+
+# Modules/DLLs shared with the first app are kept only in its folder
+MERGE(*analyses)
+
+for analysis, _, name in analyses:
+    # analysis.dependencies carries the references MERGE() left in place of
+    # the modules/DLLs it moved out - without it the app can't find them
+    exe = EXE(
+        PYZ(analysis.pure),
+        analysis.dependencies,
+        analysis.scripts,
+        [],
+        exclude_binaries=True,
+        name=name,
+        icon='NONE',
+        console=True,
+        upx=False,
+    )
+    COLLECT(exe, analysis.binaries, analysis.datas, upx=False, name=name)
+"""
+
+
+def get_merged_apps(include_ocr=True, include_nfcpy=False, include_checker=False):
+    """Analysis inputs for each app in nfc_bundle.spec (same as the separate builds)"""
+    data_files = get_data_files()
+    apps = {
+        'nfc_server': {
+            'script': str(SCRIPT_DIR / 'server.py'),
+            'hiddenimports': get_hidden_imports(include_ocr=include_ocr, include_nfcpy=include_nfcpy),
+            'excludes': get_excluded_packages(include_ocr=include_ocr, include_nfcpy=include_nfcpy),
+            'datas': data_files,
+            'collect': get_collect_packages(),
+            'torch': include_ocr,
+            'runtime_hooks': [str(WARMUP_HOOK)],
+        },
+        'nfc_service': {
+            'script': str(SCRIPT_DIR / 'nfc_service.py'),
+            'hiddenimports': get_hidden_imports(
+                include_ocr=include_ocr, include_nfcpy=include_nfcpy, include_service=True
+            ),
+            'excludes': get_excluded_packages(include_ocr=include_ocr, include_nfcpy=include_nfcpy),
+            'datas': data_files,
+            'collect': get_collect_packages(),
+            'torch': include_ocr,
+            'runtime_hooks': [str(WARMUP_HOOK)],
+        },
+    }
+    if include_checker:
+        apps['check_system'] = {
+            'script': str(SCRIPT_DIR / 'check_system.py'),
+            'hiddenimports': get_hidden_imports(include_service=True) + CHECKER_HIDDEN,
+            'excludes': get_excluded_packages(include_ocr=False, include_nfcpy=False),
+            'datas': [],
+            'collect': [],
+            'torch': False,
+            'runtime_hooks': [],
+        }
+    return apps
+
+
+def build_all_merged(include_ocr=True, include_nfcpy=False, include_checker=False):
+    """Build server, service (and optionally the checker) from one shared spec
+    
+    The separate builds each repeat PyInstaller's Analysis (module graph and
+    DLL scan) for nearly the same set of modules. nfc_bundle.spec runs them in
+    one PyInstaller process and MERGE()s the results, so common dependencies
+    are collected once into nfc_server/ and the other apps reference them there.
+    The dist/ folders therefore have to be deployed together.
+    
+    Opt-in (--merge) until a merged build has been verified on Windows,
+    including starting nfc_service.exe from its own folder.
+    """
+    print("\n" + "=" * 60)
+    print("Building NFC Server + Service" + (" + System Checker" if include_checker else "") + " (shared spec)...")
+    print("=" * 60)
+    
+    apps = get_merged_apps(include_ocr, include_nfcpy, include_checker)
+    spec_text = MERGED_SPEC_TEMPLATE.format(apps=apps)
+    cmd = [sys.executable, '-m', 'PyInstaller', '--noconfirm', *WORKPATH_ARGS, str(MERGED_SPEC)]
+    inputs = cmd + [spec_text]
+    
+    sources = {
+        'nfc_server': get_app_sources('server.py', with_packages=True),
+        'nfc_service': get_app_sources('nfc_service.py', with_packages=True),
+        'check_system': get_app_sources('check_system.py'),
+    }
+    exe_paths = {name: app_dir(name) / f'{name}.exe' for name in apps}
+    if all(is_up_to_date(exe_paths[name], sources[name], inputs) for name in apps):
+        print("✓ Merged build up-to-date: " + ", ".join(f"dist/{name}/{name}.exe" for name in apps)
+              + " (use --force to rebuild)")
+        return True
+    
+    MERGED_SPEC.write_text(spec_text, encoding='utf-8')
+    print(f"Running PyInstaller on {MERGED_SPEC.name}...")
+    if not run_pyinstaller(cmd, MERGED_SPEC.stem):
+        print("✗ Merged build failed")
+        return False
+    
+    for name, app in apps.items():
+        leaked = find_leaked_packages(name, app['excludes'])
+        if leaked:
+            print(f"✗ {name} bundled excluded packages: {', '.join(leaked)}")
+            return False
+    for name in apps:
+        write_inputs_stamp(exe_paths[name], inputs)
+        print(f"✓ Build complete: dist/{name}/{name}.exe")
+    return True
+
+
+def _copy_if_newer(src, dst):
+    """Copy src to dst unless dst is at least as new (copy2 keeps the mtime)"""
+    if dst.exists() and dst.stat().st_mtime >= src.stat().st_mtime:
+        return False
+    shutil.copy2(src, dst)
+    return True
+
+
+def _write_if_changed(path, content):
+    """Write a generated text file only if its content differs, returns True if written"""
+    try:
+        if path.read_text(encoding='utf-8') == content:
+            print(f"  ✓ {path.name} (unchanged)")
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(content, encoding='utf-8')
+    print(f"  ✓ {path.name}")
+    return True
+
+
 def copy_additional_files():
-    """Copy additional files to dist folder"""
+    """Copy additional files to dist folder (skipping copies that are up to date)"""
     print("\nCopying additional files...")
     
-    # Copy status.html
+    # Copy status.html (top level, and next to the launcher which opens it)
     status_src = SCRIPT_DIR / "status.html"
     if status_src.exists():
-        shutil.copy(status_src, DIST_DIR / "status.html")
+        _copy_if_newer(status_src, DIST_DIR / "status.html")
+        if app_dir('nfc_launcher').exists():
+            _copy_if_newer(status_src, app_dir('nfc_launcher') / "status.html")
         print("  ✓ status.html")
     
-    # Copy suica_subprocess.py
+    # Copy suica_subprocess.py next to the executables that read cards
     suica_src = SCRIPT_DIR / "suica_subprocess.py"
     if suica_src.exists():
-        shutil.copy(suica_src, DIST_DIR / "suica_subprocess.py")
+        for name in ('nfc_server', 'nfc_service'):
+            if app_dir(name).exists():
+                _copy_if_newer(suica_src, app_dir(name) / "suica_subprocess.py")
         print("  ✓ suica_subprocess.py")
     
     # Copy install guide
     guide_src = SCRIPT_DIR / "dist_package" / "INSTALL_GUIDE.txt"
     if guide_src.exists():
-        shutil.copy(guide_src, DIST_DIR / "INSTALL_GUIDE.txt")
+        _copy_if_newer(guide_src, DIST_DIR / "INSTALL_GUIDE.txt")
         print("  ✓ INSTALL_GUIDE.txt")
 
 
 def create_install_script():
-    """Create installation scripts for the dist folder"""
+    """Create installation scripts for the dist folder (unchanged files are not rewritten)"""
     
     # Create install.bat
     install_bat = DIST_DIR / "install.bat"
-    install_bat.write_text('''@echo off
+    _write_if_changed(install_bat, '''@echo off
 echo ====================================
 echo NFC Bridge Server - Installation
 echo ====================================
@@ -492,11 +852,11 @@ if %errorLevel% neq 0 (
 )
 
 echo Installing NFC Bridge Service...
-nfc_service.exe install
+"%~dp0nfc_service\\nfc_service.exe" install
 
 echo.
 echo Starting NFC Bridge Service...
-nfc_service.exe start
+"%~dp0nfc_service\\nfc_service.exe" start
 
 echo.
 echo ====================================
@@ -505,15 +865,14 @@ echo.
 echo The NFC Bridge Server is now running.
 echo Service name: NFCBridgeService
 echo.
-echo To open status page, run: nfc_launcher.exe
+echo To open status page, run: nfc_launcher\\nfc_launcher.exe
 echo ====================================
 pause
-''', encoding='utf-8')
-    print("  ✓ install.bat")
+''')
     
     # Create uninstall.bat
     uninstall_bat = DIST_DIR / "uninstall.bat"
-    uninstall_bat.write_text('''@echo off
+    _write_if_changed(uninstall_bat, '''@echo off
 echo ====================================
 echo NFC Bridge Server - Uninstallation
 echo ====================================
@@ -528,45 +887,46 @@ if %errorLevel% neq 0 (
 )
 
 echo Stopping NFC Bridge Service...
-nfc_service.exe stop
+"%~dp0nfc_service\\nfc_service.exe" stop
 
 echo.
 echo Removing NFC Bridge Service...
-nfc_service.exe remove
+"%~dp0nfc_service\\nfc_service.exe" remove
 
 echo.
 echo ====================================
 echo Uninstallation complete!
 echo ====================================
 pause
-''', encoding='utf-8')
-    print("  ✓ uninstall.bat")
+''')
     
     # Create start.bat (run without service)
     start_bat = DIST_DIR / "start.bat"
-    start_bat.write_text('''@echo off
+    _write_if_changed(start_bat, '''@echo off
 echo Starting NFC Bridge Server...
-start "" nfc_server.exe
+start "" /D "%~dp0nfc_server" "%~dp0nfc_server\\nfc_server.exe"
 timeout /t 2 /nobreak >nul
-start "" nfc_launcher.exe
-''', encoding='utf-8')
-    print("  ✓ start.bat")
+start "" "%~dp0nfc_launcher\\nfc_launcher.exe"
+''')
     
     # Create README
     readme = DIST_DIR / "README.txt"
-    readme.write_text('''NFC Bridge Server
+    _write_if_changed(readme, '''NFC Bridge Server
 =================
 
 Files:
-- nfc_server.exe    : Main server (WebSocket on port 3005)
-- nfc_launcher.exe  : Opens status page in browser
-- nfc_service.exe   : Windows service wrapper
-- status.html       : Status page (opened by launcher)
+- nfc_server\\nfc_server.exe     : Main server (WebSocket on port 3005)
+- nfc_launcher\\nfc_launcher.exe : Opens status page in browser
+- nfc_service\\nfc_service.exe   : Windows service wrapper
+- status.html                    : Status page (opened by launcher)
+
+Each program folder also holds an _internal folder with its libraries -
+keep the folders together and don't move the exe files out of them.
 
 Quick Start:
 ------------
 1. Double-click 'start.bat' to run the server
-2. Or run 'nfc_launcher.exe' - it will ask to start server
+2. Or run 'nfc_launcher\\nfc_launcher.exe' - it will ask to start server
 
 Install as Windows Service:
 --------------------------
@@ -579,10 +939,10 @@ Uninstall Service:
 
 Manual Service Commands:
 -----------------------
-- Install: nfc_service.exe install
-- Start:   nfc_service.exe start
-- Stop:    nfc_service.exe stop
-- Remove:  nfc_service.exe remove
+- Install: nfc_service\\nfc_service.exe install
+- Start:   nfc_service\\nfc_service.exe start
+- Stop:    nfc_service\\nfc_service.exe stop
+- Remove:  nfc_service\\nfc_service.exe remove
 
 WebSocket API:
 -------------
@@ -596,8 +956,7 @@ Supported Cards:
 - Generic NFC cards
 
 Version: 2.1
-''', encoding='utf-8')
-    print("  ✓ README.txt")
+''')
 
 
 def main():
@@ -613,9 +972,24 @@ def main():
     build_items = sys.argv[1:] if len(sys.argv) > 1 else ['all']
     build_all = len(sys.argv) == 1 or 'all' in build_items
     
-    # Check for --no-ocr flag
+    # Check for --no-ocr / --with-nfcpy / --force flags
+    global FORCE_REBUILD
     include_ocr = '--no-ocr' not in build_items
-    build_items = [item for item in build_items if item != '--no-ocr']
+    include_nfcpy = '--with-nfcpy' in build_items
+    FORCE_REBUILD = '--force' in build_items
+    parallel = '--parallel' in build_items
+    merge = '--merge' in build_items
+    build_items = [item for item in build_items
+                   if item not in ('--no-ocr', '--with-nfcpy', '--force', '--parallel', '--merge')]
+    
+    # 'zip' only adds packaging; on its own it still means a full build
+    make_zip = 'zip' in build_items
+    deep_clean = '--deep-clean' in build_items
+    build_items = [item for item in build_items if item not in ('zip', '--deep-clean')]
+    clean_only = build_items == ['clean'] or (deep_clean and not build_items)
+    if not build_items:
+        build_items = ['all']
+        build_all = True
     
     if include_ocr:
         print("\n[OCR] Building WITH EasyOCR + PyTorch")
@@ -625,35 +999,55 @@ def main():
         print("\n[OCR] Building WITHOUT OCR (--no-ocr flag)")
         print("      Smaller exe (~50MB), no text extraction from images\n")
     
-    if 'clean' in build_items:
-        clean_build()
-        if build_items == ['clean']:
+    # Only clean when asked: keeping build/ lets PyInstaller reuse its analysis
+    if 'clean' in build_items or deep_clean:
+        clean_build(deep=deep_clean)
+        if clean_only:
             return 0
+    else:
+        # Running exes lock their folders, which --noconfirm needs to replace
+        print("Stopping any running NFC processes...")
+        kill_running_processes()
     
-    # Clean on full build
-    if build_all:
-        clean_build()
+    # Build requested components
+    want_server = build_all or 'server' in build_items
+    want_service = build_all or 'service' in build_items
+    # Checker is optional - only build if explicitly requested
+    # (It can cause file locking issues if left running)
+    want_checker = 'checker' in build_items
     
-    success = True
+    builds = []
+    if want_server and want_service and merge:
+        # One PyInstaller Analysis pass shared by server/service(/checker)
+        builds.append(partial(build_all_merged, include_ocr=include_ocr, include_nfcpy=include_nfcpy,
+                              include_checker=want_checker))
+        want_server = want_service = want_checker = False
     
-    # Build requested components
-    if build_all or 'server' in build_items:
-        success = build_server(include_ocr=include_ocr) and success
+    if want_server:
+        builds.append(partial(build_server, include_ocr=include_ocr, include_nfcpy=include_nfcpy))
     
     if build_all or 'launcher' in build_items:
-        success = build_launcher() and success
+        builds.append(build_launcher)
     
-    if build_all or 'service' in build_items:
-        success = build_service() and success
+    if want_service:
+        builds.append(partial(build_service, include_ocr=include_ocr, include_nfcpy=include_nfcpy))
     
-    # Checker is optional - only build if explicitly requested
-    # (It can cause file locking issues if left running)
-    if 'checker' in build_items:
-        success = build_checker() and success
-    elif build_all:
+    if want_checker:
+        builds.append(build_checker)
+    elif build_all and 'checker' not in build_items:
         print("\n[INFO] Skipping check_system.exe (optional)")
         print("       To build it: python build.py checker")
     
+    # Serial by default: the PyInstaller processes share build/ and the per-user
+    # bincache, and concurrent copies of the same DLLs there are unverified on Windows
+    if len(builds) > 1 and parallel:
+        print(f"\nBuilding {len(builds)} apps in parallel (--parallel)...")
+        with ThreadPoolExecutor(max_workers=len(builds)) as pool:
+            results = list(pool.map(lambda build: build(), builds))
+    else:
+        results = [build() for build in builds]
+    success = all(results)
+    
     # Copy additional files
     if DIST_DIR.exists():
         copy_additional_files()
@@ -667,7 +1061,11 @@ def main():
         print(f"\nOutput directory: {DIST_DIR}")
         print("\nFiles created:")
         for f in DIST_DIR.iterdir():
-            size = f.stat().st_size
+            if f.is_dir():
+                # --onedir app folder: report the whole folder
+                size = sum(p.stat().st_size for p in f.rglob('*') if p.is_file())
+            else:
+                size = f.stat().st_size
             if size > 1024 * 1024:
                 size_str = f"{size / 1024 / 1024:.1f} MB"
             elif size > 1024:
@@ -675,6 +1073,10 @@ def main():
             else:
                 size_str = f"{size} B"
             print(f"  - {f.name} ({size_str})")
+        
+        if make_zip:
+            archive = shutil.make_archive(str(SCRIPT_DIR / "NFCBridge"), 'zip', DIST_DIR)
+            print(f"\nPackaged: {archive}")
     else:
         print("  BUILD FAILED")
         print("=" * 60)
@@ -171,6 +171,13 @@ if %errorLevel% neq 0 (
     pip install --only-binary :all: pyscard pycryptodome Pillow numpy 2>nul
 )
 
+:: Optional accelerators - install one at a time, skip any without a wheel
+echo.
+echo Installing optional packages from requirements-optional.txt...
+for /f "usebackq eol=# tokens=* delims=" %%p in ("requirements-optional.txt") do (
+    pip install "%%p" >nul 2>&1 || echo [INFO] Optional package not installed: %%p
+)
+
 :: Install PyInstaller
 echo.
 echo Checking PyInstaller...
@@ -199,7 +206,7 @@ set BUILD_RESULT=%errorLevel%
 echo.
 echo ========================================
 if %BUILD_RESULT% equ 0 (
-    if exist "dist\nfc_server.exe" (
+    if exist "dist\nfc_server\nfc_server.exe" (
         echo   BUILD SUCCESSFUL!
         echo ========================================
         echo.
@@ -8,7 +8,118 @@ Run this to diagnose issues on target machines.
 import sys
 import os
 import ctypes
+import contextlib
+import functools
+import io
+import json
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Passing system checks are remembered for a few minutes so re-running the
+# checker doesn't repeat the slow service/driver/PC-SC probes.
+# Failures are never cached - after fixing something, the next run re-checks it.
+CACHE_TTL = 300
+CACHE_FILE = Path(os.environ.get('LOCALAPPDATA', str(Path.home()))) / 'NFCBridge' / 'syscheck.json'
+
+_cache = None
+_cache_lock = threading.Lock()  # Checks run on a thread pool
+
+
+class ThreadStdout:
+    """sys.stdout stand-in that lets each thread capture its own prints"""
+    
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+    
+    def write(self, text):
+        return getattr(self._local, 'buf', self._default).write(text)
+    
+    def flush(self):
+        getattr(self._local, 'buf', self._default).flush()
+    
+    @contextlib.contextmanager
+    def capture(self):
+        prev = getattr(self._local, 'buf', None)
+        buf = self._local.buf = io.StringIO()
+        try:
+            yield buf
+        finally:
+            if prev is None:
+                del self._local.buf
+            else:
+                self._local.buf = prev
+
+
+@contextlib.contextmanager
+def capture_output():
+    """Collect what the current thread prints (works with and without ThreadStdout)"""
+    if isinstance(sys.stdout, ThreadStdout):
+        with sys.stdout.capture() as buf:
+            yield buf
+    else:
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            yield buf
+
+
+def _load_cache():
+    """Read the cached check results (empty if missing/corrupt or --force given)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            cache = {}
+            if '--force' not in sys.argv:
+                try:
+                    cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+                except (OSError, ValueError):
+                    pass
+            _cache = cache
+        return _cache
+
+
+def save_cache():
+    """Write the check results cache (best effort)"""
+    with _cache_lock:
+        if _cache is None:
+            return
+        data = json.dumps(_cache)
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(data, encoding='utf-8')
+    except OSError:
+        pass
+
+
+def cached(ttl=CACHE_TTL):
+    """Reuse a passing check's result and output for ttl seconds"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper():
+            cache = _load_cache()
+            with _cache_lock:
+                entry = cache.get(func.__name__)
+            if entry and time.time() - entry['time'] < ttl:
+                print(entry['output'], end='')
+                print(f"  (cached {int(time.time() - entry['time'])}s ago - use --force to re-check)")
+                return entry['result']
+            
+            with capture_output() as buf:
+                result = func()
+            output = buf.getvalue()
+            print(output, end='')
+            
+            with _cache_lock:
+                if result is True:
+                    cache[func.__name__] = {'time': time.time(), 'result': result, 'output': output}
+                else:
+                    cache.pop(func.__name__, None)
+            return result
+        return wrapper
+    return decorator
 
 def is_admin():
     """Check if running as administrator"""
@@ -27,19 +138,16 @@ def check_python():
         print("  ✗ Python 3.8+ required")
         return False
 
+@cached()
 def check_smartcard_service():
     """Check if Smart Card service is running"""
     print("\n[Smart Card Service]")
     try:
-        result = subprocess.run(
-            ['sc', 'query', 'SCardSvr'],
-            capture_output=True,
-            text=True
-        )
-        if 'RUNNING' in result.stdout:
+        state = _query_service_state('SCardSvr')
+        if state == 'RUNNING':
             print("  ✓ Smart Card service is running")
             return True
-        elif 'STOPPED' in result.stdout:
+        elif state == 'STOPPED':
             print("  ✗ Smart Card service is stopped")
             print("  → Run: sc start SCardSvr (as Administrator)")
             return False
@@ -50,6 +158,26 @@ def check_smartcard_service():
         print(f"  ✗ Error checking service: {e}")
         return False
 
+def _query_service_state(name):
+    """'RUNNING', 'STOPPED' or None - in-process via pywin32, 'sc query' without it"""
+    try:
+        import win32service
+        import win32serviceutil
+    except ImportError:
+        result = subprocess.run(['sc', 'query', name], capture_output=True, text=True)
+        for state in ('RUNNING', 'STOPPED'):
+            if state in result.stdout:
+                return state
+        return None
+    
+    status = win32serviceutil.QueryServiceStatus(name)[1]
+    if status == win32service.SERVICE_RUNNING:
+        return 'RUNNING'
+    if status == win32service.SERVICE_STOPPED:
+        return 'STOPPED'
+    return None
+
+@cached()
 def check_pyscard():
     """Check if pyscard is working"""
     print("\n[PC/SC Library]")
@@ -119,19 +247,55 @@ def check_port():
         print(f"  ? Error checking port: {e}")
         return None
 
+# Device class GUID of smart card readers (PNPClass 'SmartCardReader')
+SMARTCARD_READER_CLASS = '{50dd5230-ba8a-11d1-bf5d-0000f805f530}'
+
+def _smartcard_reader_devices():
+    """
+    Names of smart card reader devices, looked up in-process (no wmic spawn).
+    Uses WMI over COM when pywin32 is available (currently present devices),
+    otherwise the reader device class in the registry (installed drivers).
+    """
+    try:
+        import win32com.client
+    except ImportError:
+        win32com = None
+    
+    if win32com is not None:
+        # COM must be initialized on each thread (checks run on a thread pool)
+        import pythoncom
+        pythoncom.CoInitialize()
+        wmi = win32com.client.GetObject("winmgmts:")
+        query = wmi.ExecQuery("SELECT Name FROM Win32_PnPEntity WHERE PNPClass='SmartCardReader'")
+        return [item.Name for item in query if item.Name]
+    
+    import winreg
+    names = []
+    class_key = rf"SYSTEM\CurrentControlSet\Control\Class\{SMARTCARD_READER_CLASS}"
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, class_key) as root:
+        index = 0
+        while True:
+            try:
+                sub = winreg.EnumKey(root, index)
+            except OSError:
+                break
+            index += 1
+            # Instance keys are 0000, 0001, ...; skip "Properties" and similar
+            if not sub.isdigit():
+                continue
+            try:
+                with winreg.OpenKey(root, sub) as key:
+                    names.append(winreg.QueryValueEx(key, 'DriverDesc')[0])
+            except OSError:
+                continue
+    return names
+
+@cached()
 def check_nfc_reader_driver():
     """Check for NFC reader in Device Manager"""
     print("\n[NFC Reader Device]")
     try:
-        # Use WMI to check for smart card readers
-        result = subprocess.run(
-            ['wmic', 'path', 'Win32_PnPEntity', 'where', 
-             "PNPClass='SmartCardReader'", 'get', 'Name'],
-            capture_output=True,
-            text=True
-        )
-        
-        lines = [l.strip() for l in result.stdout.strip().split('\n') if l.strip() and l.strip() != 'Name']
+        lines = _smartcard_reader_devices()
         
         if lines:
             print(f"  ✓ Found smart card reader(s):")
@@ -146,6 +310,71 @@ def check_nfc_reader_driver():
         print(f"  ? Could not check Device Manager: {e}")
         return None
 
+def run_checks(checks):
+    """
+    Run the checks concurrently (they mostly wait on processes, DLLs and sockets)
+    and print each one's output in the order given.
+    """
+    def run(check):
+        with capture_output() as buf:
+            try:
+                result = check()
+            except Exception as e:
+                print(f"  ? {check.__name__} failed: {e}")
+                result = None
+        return result, buf.getvalue()
+    
+    real_stdout = sys.stdout
+    sys.stdout = ThreadStdout(real_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = {name: pool.submit(run, check) for name, check in checks.items()}
+            outcomes = {name: future.result() for name, future in futures.items()}
+    finally:
+        sys.stdout = real_stdout
+    
+    results = {}
+    for name, (result, output) in outcomes.items():
+        print(output, end='')
+        results[name] = result
+    return results
+
+def wait_for_keypress(timeout):
+    """Block until a key is pressed or timeout seconds pass, True on keypress
+    
+    Waits on the console input handle instead of polling kbhit(), so the
+    process sleeps until there is input. Mouse/focus/key-up events also
+    signal the handle; those are flushed and the wait resumes. When stdin
+    isn't a console (redirected file/NUL/pipe) its handle is always
+    signalled, so it just sleeps out the timeout.
+    """
+    import msvcrt
+    from ctypes import wintypes
+    
+    kernel32 = ctypes.windll.kernel32
+    kernel32.GetStdHandle.restype = ctypes.c_void_p
+    kernel32.GetConsoleMode.argtypes = [ctypes.c_void_p, ctypes.POINTER(wintypes.DWORD)]
+    kernel32.WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    kernel32.FlushConsoleInputBuffer.argtypes = [ctypes.c_void_p]
+    handle = kernel32.GetStdHandle(-10)  # STD_INPUT_HANDLE
+    
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(wintypes.DWORD())):
+        time.sleep(timeout)
+        return False
+    
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if kernel32.WaitForSingleObject(handle, int(remaining * 1000)) != 0:  # WAIT_OBJECT_0
+            return False  # Timed out (or no console to wait on)
+        if msvcrt.kbhit():
+            msvcrt.getch()
+            return True
+        kernel32.FlushConsoleInputBuffer(handle)
+
+
 def main():
     print("=" * 60)
     print("  NFC Bridge System Checker")
@@ -158,17 +387,21 @@ def main():
     
     print("\n" + "-" * 60)
     
-    results = {}
-    
     print("\n[Python Environment]")
-    results['python'] = check_python()
     
-    results['smartcard_service'] = check_smartcard_service()
-    results['nfc_driver'] = check_nfc_reader_driver()
-    results['pyscard'] = check_pyscard()
-    results['websockets'] = check_websockets()
-    results['crypto'] = check_crypto()
-    results['port'] = check_port()
+    checks = {
+        'python': check_python,
+        'smartcard_service': check_smartcard_service,
+        'nfc_driver': check_nfc_reader_driver,
+        'pyscard': check_pyscard,
+        'websockets': check_websockets,
+        'crypto': check_crypto,
+        'port': check_port,
+    }
+    # Load before the checks start so they all share one cache dict
+    _load_cache()
+    results = run_checks(checks)
+    save_cache()
     
     print("\n" + "=" * 60)
     print("  SUMMARY")
@@ -209,14 +442,7 @@ def main():
     # Auto-close after 30 seconds to prevent locking files
     print("\nClosing in 30 seconds (press any key to exit now)...")
     
-    import msvcrt
-    import time
-    
-    for i in range(300):  # 30 seconds in 0.1s increments
-        if msvcrt.kbhit():
-            msvcrt.getch()
-            break
-        time.sleep(0.1)
+    wait_for_keypress(30)
     
     return 0 if critical_ok else 1
 
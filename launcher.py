@@ -4,16 +4,15 @@ NFC Bridge Launcher
 Opens the status page in the default browser.
 Also checks if the server is running and offers to start it.
 
+Imports only needed on some paths (socket, subprocess, webbrowser, ctypes)
+are done inside the functions to keep the frozen exe's startup short.
+
 This is the main entry point when clicking the app icon.
 """
 
 import sys
 import os
 import time
-import socket
-import webbrowser
-import subprocess
-import threading
 from pathlib import Path
 
 # Configuration
@@ -21,6 +20,14 @@ HOST = "localhost"
 PORT = 3005
 STATUS_PAGE = "status.html"
 
+# nfc_server touches this every ~2s while it runs (see server.PID_FILE)
+PID_FILE = Path(os.environ.get('LOCALAPPDATA', str(Path.home()))) / 'NFCBridge' / 'server.pid'
+PID_FILE_MAX_AGE = 5  # seconds
+
+# Named event nfc_server sets once it is listening (see server.READY_EVENT)
+READY_EVENT = "Local\\NFCBridgeReady"
+SERVER_START_TIMEOUT = 5  # seconds
+
 
 def get_script_dir():
     """Get the directory where this script/exe is located"""
@@ -32,8 +39,22 @@ def get_script_dir():
         return Path(__file__).parent.resolve()
 
 
+# Resolved once - the launcher runs these lookups on every start
+SCRIPT_DIR = get_script_dir()
+STATUS_FILE = SCRIPT_DIR / STATUS_PAGE
+SERVER_EXE = SCRIPT_DIR / "nfc_server.exe"
+
+
 def is_server_running():
     """Check if the NFC Bridge server is running"""
+    # A freshly touched PID file is enough - skips the socket round-trip
+    try:
+        if time.time() - PID_FILE.stat().st_mtime < PID_FILE_MAX_AGE:
+            return True
+    except OSError:
+        pass
+    
+    import socket
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(1)
@@ -46,18 +67,21 @@ def is_server_running():
 
 def start_server_background():
     """Start the server in the background"""
-    script_dir = get_script_dir()
+    import subprocess
     
     # Try to find the server executable or script
-    server_exe = script_dir / "nfc_server.exe"
-    server_py = script_dir / "server.py"
-    service_py = script_dir / "nfc_service.py"
+    server_exe = SERVER_EXE
+    if not server_exe.exists():
+        # --onedir build: dist/nfc_launcher/ sits next to dist/nfc_server/
+        server_exe = SCRIPT_DIR.parent / "nfc_server" / "nfc_server.exe"
+    server_py = SCRIPT_DIR / "server.py"
+    service_py = SCRIPT_DIR / "nfc_service.py"
     
     if server_exe.exists():
         # Run compiled server
         subprocess.Popen(
             [str(server_exe)],
-            cwd=str(script_dir),
+            cwd=str(server_exe.parent),
             creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
         )
         return True
@@ -66,7 +90,7 @@ def start_server_background():
         python_exe = sys.executable
         subprocess.Popen(
             [python_exe, str(service_py), "standalone"],
-            cwd=str(script_dir),
+            cwd=str(SCRIPT_DIR),
             creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
         )
         return True
@@ -75,7 +99,7 @@ def start_server_background():
         python_exe = sys.executable
         subprocess.Popen(
             [python_exe, str(server_py)],
-            cwd=str(script_dir),
+            cwd=str(SCRIPT_DIR),
             creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
         )
         return True
@@ -83,13 +107,48 @@ def start_server_background():
     return False
 
 
+def wait_for_server(timeout=SERVER_START_TIMEOUT):
+    """Wait until the server is up, returning True if it came up in time
+    
+    On Windows this blocks on READY_EVENT, so we wake as soon as the server
+    is listening. Elsewhere (or if the event can't be created) poll the port.
+    """
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+    except (ImportError, AttributeError):
+        kernel32 = None
+    
+    if kernel32 is not None:
+        kernel32.CreateEventW.restype = ctypes.c_void_p
+        kernel32.WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+        kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+        # Opens the server's event if it already exists (manual-reset, so
+        # it stays signalled however late we get here)
+        handle = kernel32.CreateEventW(None, True, False, READY_EVENT)
+        if handle:
+            try:
+                if kernel32.WaitForSingleObject(handle, int(timeout * 1000)) == 0:  # WAIT_OBJECT_0
+                    return True
+            finally:
+                kernel32.CloseHandle(handle)
+            # Scripts started without the event (e.g. older builds)
+            return is_server_running()
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.5)
+        if is_server_running():
+            return True
+    return False
+
+
 def open_status_page():
     """Open the status page in the default browser"""
-    script_dir = get_script_dir()
-    status_file = script_dir / STATUS_PAGE
+    import webbrowser
     
-    if status_file.exists():
-        webbrowser.open(f"file:///{status_file}")
+    if STATUS_FILE.exists():
+        webbrowser.open(f"file:///{STATUS_FILE}")
     else:
         # Open web version if available
         webbrowser.open(f"http://{HOST}:{PORT}/status")
@@ -149,11 +208,8 @@ def main():
             if start_server_background():
                 # Wait for server to start
                 print("Waiting for server to start...")
-                for i in range(10):
-                    time.sleep(0.5)
-                    if is_server_running():
-                        print(f"✓ Server started successfully")
-                        break
+                if wait_for_server():
+                    print(f"✓ Server started successfully")
                 else:
                     print("✗ Server did not start in time")
             else:
@@ -1,5 +1,10 @@
 #! /usr/bin/env python3
-"""Check what card is connected and its ATR"""
+"""Check what card is connected and its ATR
+
+Usage: python check_card.py [--all]
+  --all  Also select the Profile applet when the PKI applet was found
+         (by default that second SELECT is skipped - the card is identified)
+"""
 
 import sys
 sys.path.append('./../mnbcard')
@@ -7,6 +12,15 @@ sys.path.append('./../mnbcard')
 from smartcard.System import readers
 from smartcard.util import toHexString
 
+CHECK_ALL = '--all' in sys.argv
+
+# ATR fragments (hex, no spaces) -> card type, most specific first
+KNOWN_ATRS = (
+    ("D276000085010100", "マイナンバーカード (My Number Card)"),
+    ("D276000085", "Japanese IC card"),
+    ("3B8F8001804F0CA0", "FeliCa card (Suica/PASMO/etc)"),
+)
+
 print("="*60)
 print("Card Reader Check")
 print("="*60)
@@ -37,12 +51,10 @@ try:
     print(f"ATR: {atr_hex}")
     
     # Known ATR patterns
-    if "D276000085010100" in atr_hex.replace(" ", ""):
-        print("→ This appears to be a マイナンバーカード (My Number Card)")
-    elif "D276000085" in atr_hex.replace(" ", ""):
-        print("→ This appears to be a Japanese IC card")
-    elif "3B8F8001804F0CA0" in atr_hex.replace(" ", ""):
-        print("→ This appears to be a FeliCa card (Suica/PASMO/etc)")
+    atr_compact = bytes(atr).hex().upper()
+    card_type = next((name for pattern, name in KNOWN_ATRS if pattern in atr_compact), None)
+    if card_type:
+        print(f"→ This appears to be a {card_type}")
     else:
         print("→ Unknown card type")
     
@@ -54,23 +66,29 @@ try:
     data, sw1, sw2 = connection.transmit(SELECT_PKI)
     print(f"Response: SW1={hex(sw1)} SW2={hex(sw2)}")
     
-    if sw1 == 0x90 and sw2 == 0x00:
+    pki_found = sw1 == 0x90 and sw2 == 0x00
+    if pki_found:
         print("✓ PKI applet found - This IS a マイナンバーカード!")
     else:
         print("✗ PKI applet NOT found - This might not be a マイナンバーカード")
-        
-    # Try Profile applet
-    print("\nTrying to select Profile applet (券面入力補助AP)...")
-    SELECT_PROFILE = [0x00, 0xA4, 0x04, 0x0C, 0x0A,
-                      0xD3, 0x92, 0x10, 0x00, 0x31, 0x00, 0x01, 0x01, 0x04, 0x08]
     
-    data, sw1, sw2 = connection.transmit(SELECT_PROFILE)
-    print(f"Response: SW1={hex(sw1)} SW2={hex(sw2)}")
-    
-    if sw1 == 0x90 and sw2 == 0x00:
-        print("✓ Profile applet found!")
+    # Each SELECT is a full reader round-trip - once PKI answered, the card
+    # is identified and the Profile applet is only probed with --all
+    if pki_found and not CHECK_ALL:
+        print("\nSkipping Profile applet check (run with --all to check it too)")
     else:
-        print("✗ Profile applet NOT found")
+        # Try Profile applet
+        print("\nTrying to select Profile applet (券面入力補助AP)...")
+        SELECT_PROFILE = [0x00, 0xA4, 0x04, 0x0C, 0x0A,
+                          0xD3, 0x92, 0x10, 0x00, 0x31, 0x00, 0x01, 0x01, 0x04, 0x08]
+        
+        data, sw1, sw2 = connection.transmit(SELECT_PROFILE)
+        print(f"Response: SW1={hex(sw1)} SW2={hex(sw2)}")
+        
+        if sw1 == 0x90 and sw2 == 0x00:
+            print("✓ Profile applet found!")
+        else:
+            print("✗ Profile applet NOT found")
 
 except Exception as e:
     print(f"\n✗ Error: {e}")
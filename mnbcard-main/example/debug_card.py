@@ -6,12 +6,17 @@ sys.path.append('./../mnbcard')
 
 from reader import get_reader, connect_card
 from api import Card
+from helper import iter_tlv
+
+# bytes.translate table: printable ASCII kept, everything else shown as '.'
+PRINTABLE = bytes(b if 32 <= b < 127 else ord('.') for b in range(256))
 
 print("Connecting to card reader...")
 reader = get_reader()
 connection = connect_card(reader)
 card = Card(connection)
 
+
 profile_pin = input("4-digit PIN: ")
 
 # Read raw data
@@ -19,7 +24,8 @@ card.select_file_profile_ap()
 card.select_file_profile_pin()
 card.verify_profile_pin([ord(c) for c in profile_pin])
 card.select_file_base_4_info()
-raw_data = card.read_binary_256()
+# pyscard returns a list of ints - pack it once
+raw_data = bytes(card.read_binary_256())
 
 print("\n" + "="*70)
 print("RAW DATA ANALYSIS")
@@ -27,31 +33,28 @@ print("="*70)
 
 # Print first 50 bytes with indices
 print("\nByte index and values:")
-for i in range(min(50, len(raw_data))):
-    val = raw_data[i]
-    char = chr(val) if 32 <= val < 127 else '.'
-    print(f"  [{i:2d}] = 0x{val:02x} ({val:3d}) '{char}'")
+head = raw_data[:50]
+printable = head.translate(PRINTABLE).decode("ascii")
+sys.stdout.write("".join(
+    f"  [{i:2d}] = 0x{val:02x} ({val:3d}) '{char}'\n"
+    for i, (val, char) in enumerate(zip(head, printable))
+))
 
 print("\n" + "-"*70)
-print("Looking for TLV segments (0xDF markers):")
+print("TLV segments:")
 
-# Find all 0xDF markers (TLV segment starts)
-for i, b in enumerate(raw_data[:100]):
-    if b == 0xDF:
-        tag1 = raw_data[i+1] if i+1 < len(raw_data) else 0
-        length = raw_data[i+2] if i+2 < len(raw_data) else 0
-        print(f"  Found 0xDF at position {i}, tag=0x{tag1:02x}, length={length}")
-        
-        # Try to decode the content
-        if i + 3 + length <= len(raw_data):
-            content = bytes(raw_data[i+3:i+3+length])
-            for enc in ["utf-8", "cp932", "shift-jis"]:
-                try:
-                    decoded = content.decode(enc)
-                    print(f"    Content ({enc}): {decoded}")
-                    break
-                except:
-                    pass
+for tag, value in iter_tlv(memoryview(raw_data)):
+    print(f"  Tag {tag.hex().upper()}, length={len(value)}")
+    if tag[0] & 0x20:
+        continue  # Constructed - its children follow
+    
+    # UTF-8 or cp932 (a superset of Shift_JIS, so that never needs a separate try)
+    content = bytes(value)
+    try:
+        enc, decoded = "utf-8", content.decode("utf-8")
+    except UnicodeDecodeError:
+        enc, decoded = "cp932", content.decode("cp932", errors="replace")
+    print(f"    Content ({enc}): {decoded}")
 
 print("\n" + "-"*70)
 print("Manifest positions from library:")
@@ -2,6 +2,9 @@
 """
 Simple script to read basic info from マイナンバーカード
 Only requires the 4-digit Profile PIN (券面入力補助用パスワード)
+
+Usage: python read_basic_info.py [--force]
+  --force  Re-read the auth certificate even if Auth_Cert.der already holds it
 """
 
 import logging
@@ -12,6 +15,32 @@ from reader import get_reader, connect_card
 from api import Card
 from helper import save_to_file
 
+FORCE = '--force' in sys.argv
+AUTH_CERT_FILE = "Auth_Cert.der"
+
+# The gender field is a single ASCII digit
+GENDER_MAP = {"1": "男性", "2": "女性", "3": "その他"}
+
+
+def cached_auth_cert_matches(card, path):
+    """
+    True if path already holds this card's auth certificate.
+
+    The ATR is identical on every マイナンバーカード, so it can't tell cards
+    apart. The first 256-byte block of the certificate contains its serial
+    number, so one READ BINARY decides instead of reading the whole cert.
+    """
+    try:
+        with open(path, "rb") as f:
+            cached = f.read()
+    except OSError:
+        return False
+    card.select_file_pki_ap()
+    card.select_file_cert_for_auth()
+    head = bytes(card.read_binary_256())
+    return len(cached) > len(head) and cached.startswith(head)
+
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
@@ -38,8 +67,7 @@ except Exception as e:
 # Get basic 4 info (name, address, birthdate, gender)
 try:
     name, address, birthdate, gender = card.get_basic_info(profile_pin)
-    gender_map = {"1": "男性", "2": "女性", "3": "その他"}
-    gender_text = gender_map.get(gender.strip(), gender)
+    gender_text = GENDER_MAP.get(gender[:1], gender)
     
     print(f"\n--- 基本4情報 ---")
     print(f"名前: {name}")
@@ -55,17 +83,20 @@ except Exception as e:
         card.select_file_profile_pin()
         card.verify_profile_pin([ord(c) for c in profile_pin])
         card.select_file_base_4_info()
-        raw_data = card.read_binary_256()
-        print(f"Raw data (first 100 bytes): {raw_data[:100]}")
-        print(f"Raw hex: {' '.join(f'{b:02x}' for b in raw_data[:100])}")
+        raw_data = bytes(card.read_binary_256())
+        print(f"Raw data (first 100 bytes): {list(raw_data[:100])}")
+        print(f"Raw hex: {raw_data[:100].hex(' ')}")
     except Exception as e2:
         print(f"Debug failed: {e2}")
 
 # Also get auth certificate (no PIN required)
 try:
-    auth_cert = card.get_cert_for_auth()
-    save_to_file("Auth_Cert.der", auth_cert)
-    print(f"\n認証用証明書を Auth_Cert.der に保存しました")
+    if not FORCE and cached_auth_cert_matches(card, AUTH_CERT_FILE):
+        print(f"\n認証用証明書は {AUTH_CERT_FILE} に保存済みです (--force で再取得)")
+    else:
+        auth_cert = card.get_cert_for_auth()
+        save_to_file(AUTH_CERT_FILE, auth_cert)
+        print(f"\n認証用証明書を {AUTH_CERT_FILE} に保存しました")
 except Exception as e:
     print(f"Error reading auth certificate: {e}")
 
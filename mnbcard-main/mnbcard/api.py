@@ -12,6 +12,11 @@ class Card:
         self.__conn = connection
         self._check_connection()
 
+        # Card state cached to skip repeated APDUs within this connection:
+        # the currently selected AP, and (PIN EF, pin bytes) verified under it
+        self._selected_aid = None
+        self._pin_verified = None
+
     def _log_apdu(self, apdu_data):
         logger.debug("APDU:   " + APDU.get_hex(apdu_data))
 
@@ -33,6 +38,9 @@ class Card:
         self._log_result(data, sw1, sw2)
 
         if sw1 != APDU.APDU_STATUS.SUCCESS:
+            # The card's selection/security state is no longer known
+            self._selected_aid = None
+            self._pin_verified = None
             error_msg = "APDU ERROR: sw1=%x sw2=%x --- %s " % (sw1, sw2, APDU.get_status_msg(sw1, sw2))
             
             logger.error(error_msg)
@@ -75,12 +83,32 @@ class Card:
         # Fallback: decode with errors replaced
         return raw_bytes.decode("cp932", errors="replace")
 
+    def _select_ap(self, aid):
+        """
+            SELECT an AP unless it is already the selected one.
+            Selecting another AP resets the card's PIN security status.
+
+            @return: (sw1, sw2), or None if the SELECT was skipped
+        """
+        if self._selected_aid == aid:
+            return None
+        apdu_select = APDU.SELECT_AP(data = aid)
+        _, sw1, sw2 = self._send_apdu_raw(apdu_select)
+        self._selected_aid = aid
+        self._pin_verified = None
+        return (sw1, sw2)
+
+    def _is_pin_verified(self, pin_ef, pin_bytes):
+        """
+            True if pin_bytes was already verified for pin_ef under the current AP.
+        """
+        return self._pin_verified == (pin_ef, tuple(pin_bytes))
+
     def select_file_pki_ap(self):
         """
             SELECT FILE: 公的個人認証AP
         """
-        apdu_select = APDU.SELECT_AP(data = APDU.APPLET.PKI_AUTH)
-        _, sw1, sw2 = self._send_apdu_raw(apdu_select)
+        self._select_ap(APDU.APPLET.PKI_AUTH)
 
     def select_file_cert_for_auth(self):
         """
@@ -166,9 +194,9 @@ class Card:
         """
             SELECT FILE: 券面入力補助AP (DF)
         """
-        apdu_select = APDU.SELECT_AP(data = APDU.APPLET.PROFILE)
-        _, sw1, sw2 = self._send_apdu_raw(apdu_select)
-        logger.info("券面入力補助AP: %x %x" % (sw1, sw2))
+        status = self._select_ap(APDU.APPLET.PROFILE)
+        if status is not None:
+            logger.info("券面入力補助AP: %x %x" % status)
 
     def select_file_profile_pin(self):
         """
@@ -184,6 +212,7 @@ class Card:
         """
         apdu_verify = APDU.VERIFY_PIN(pin_bytes)
         _, sw1, sw2 = self._send_apdu_raw(apdu_verify)
+        self._pin_verified = (APDU.EF.PROFILE_PIN, tuple(pin_bytes))
         logger.info("VERIFY 券面入力補助用PIN: %x %x" % (sw1, sw2))
 
     def select_file_my_number(self):
@@ -351,11 +380,14 @@ class Card:
         # SELECT FILE: 券面入力補助AP (DF)
         self.select_file_profile_ap()
 
-        # SELECT FILE: 券面入力補助用PIN (EF)
-        self.select_file_profile_pin()
+        # PIN already verified in this session (e.g. get_my_number before get_basic_info)
+        pin_bytes = [ord(c) for c in auth_pin]
+        if not self._is_pin_verified(APDU.EF.PROFILE_PIN, pin_bytes):
+            # SELECT FILE: 券面入力補助用PIN (EF)
+            self.select_file_profile_pin()
 
-        # VERIFY: 券面入力補助用PIN (パスワード)
-        self.verify_profile_pin(pin_bytes = [ord(c) for c in auth_pin])
+            # VERIFY: 券面入力補助用PIN (パスワード)
+            self.verify_profile_pin(pin_bytes = pin_bytes)
 
         # SELECT FILE: マイナンバー (EF)
         self.select_file_my_number()
@@ -378,11 +410,14 @@ class Card:
         # SELECT FILE: 券面入力補助AP (DF)
         self.select_file_profile_ap()
 
-        # SELECT FILE: 券面入力補助用PIN (EF)
-        self.select_file_profile_pin()
+        # PIN already verified in this session (e.g. get_my_number before get_basic_info)
+        pin_bytes = [ord(c) for c in auth_pin]
+        if not self._is_pin_verified(APDU.EF.PROFILE_PIN, pin_bytes):
+            # SELECT FILE: 券面入力補助用PIN (EF)
+            self.select_file_profile_pin()
 
-        # VERIFY: 券面入力補助用PIN (パスワード)
-        self.verify_profile_pin(pin_bytes = [ord(c) for c in auth_pin])
+            # VERIFY: 券面入力補助用PIN (パスワード)
+            self.verify_profile_pin(pin_bytes = pin_bytes)
 
         # SELECT FILE: 基本4情報 (EF)
         self.select_file_base_4_info()
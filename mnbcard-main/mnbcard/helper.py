@@ -20,6 +20,53 @@ def get_file_hash(filename):
     hash = sha256_str_to_int_array(sha256)
     return hash
 
+def iter_tlv(buf):
+    """
+        Walk BER-TLV data in one pass (ISO 7816-4 / ASN.1 framing).
+
+        Multi-byte tags (low 5 bits of the first byte all set) and long-form
+        lengths are honoured. Constructed tags (bit 0x20) are yielded and then
+        descended into. Stops at the first truncated TLV.
+
+        @param buf: bytes-like TLV data
+        @return: generator of (tag_bytes, value_memoryview), values are not copied
+    """
+    mv = buf if isinstance(buf, memoryview) else memoryview(bytes(buf))
+    end = len(mv)
+    pos = 0
+    while pos < end:
+        # Tag
+        tag_start = pos
+        first = mv[pos]
+        pos += 1
+        if first & 0x1F == 0x1F:
+            while pos < end and mv[pos] & 0x80:
+                pos += 1
+            pos += 1
+        if pos >= end:
+            return
+        tag = bytes(mv[tag_start:pos])
+
+        # Length
+        length = mv[pos]
+        pos += 1
+        if length & 0x80:
+            num_bytes = length & 0x7F
+            if pos + num_bytes > end:
+                return
+            length = int.from_bytes(mv[pos:pos + num_bytes], "big")
+            pos += num_bytes
+
+        # Value
+        if pos + length > end:
+            return
+        value = mv[pos:pos + length]
+        pos += length
+
+        yield tag, value
+        if first & 0x20:
+            yield from iter_tlv(value)
+
 def save_to_file(filename, data):
     newFile = open(filename, "wb")
     newFileByteArray = bytearray(data)
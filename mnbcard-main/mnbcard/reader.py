@@ -1,4 +1,5 @@
-from smartcard.Exceptions import NoCardException
+from smartcard.CardConnection import CardConnection
+from smartcard.Exceptions import CardConnectionException, NoCardException
 from smartcard.System import readers
 
 def get_reader():
@@ -10,9 +11,19 @@ def get_reader():
     return readers()[0]
 
 def connect_card(reader):
+    """
+        Connect to the card, preferring T=1.
+
+        Baud rate (PPS) and IFSD are negotiated by the reader driver when the
+        card is powered; T=1 lets it move the 256-byte READ BINARY responses
+        in blocks. Cards/readers without T=1 fall back to the default protocol.
+    """
     try:
         connection = reader.createConnection()
-        connection.connect()
+        try:
+            connection.connect(CardConnection.T1_protocol)
+        except CardConnectionException:
+            connection.connect()
         return connection
     except NoCardException:
-        raise Exception('No card deteched')
\ No newline at end of file
+        raise Exception('No card deteched')
@@ -24,16 +24,20 @@ Debug (run in console):
 """
 
 # CRITICAL: Set environment variables BEFORE any imports to prevent PaddleOCR timeout
+# (inherited by child processes, which then skip this block via _NFC_ENV_SET)
 import os
-os.environ['DISABLE_MODEL_SOURCE_CHECK'] = 'True'  # Skip PaddleOCR network check
-os.environ['PADDLE_PDX_LOCAL_MODEL_SOURCE'] = 'True'  # Use local models only
-os.environ['FLAGS_use_mkldnn'] = 'False'  # Disable MKL-DNN for faster startup
+if not os.environ.get('_NFC_ENV_SET'):
+    os.environ['_NFC_ENV_SET'] = '1'
+    os.environ['DISABLE_MODEL_SOURCE_CHECK'] = 'True'  # Skip PaddleOCR network check
+    os.environ['PADDLE_PDX_LOCAL_MODEL_SOURCE'] = 'True'  # Use local models only
+    os.environ['FLAGS_use_mkldnn'] = 'False'  # Disable MKL-DNN for faster startup
 
 import sys
 import time
 import asyncio
 import logging
 import threading
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 # Add current directory to path for imports
@@ -60,19 +64,30 @@ except ImportError:
 # This will be imported when the service actually starts
 SERVER_AVAILABLE = None  # Will be set to True/False when needed
 NFCBridge = None
+signal_ready = None
+install_fast_event_loop = None
+websockets = None
 HOST = "localhost"
 PORT = 3005
 
+# Set once the log file handler is attached (standalone + service paths may both construct a service)
+_LOGGING_INITIALIZED = False
+
 def _import_server():
     """Lazy import of server module to defer PaddleOCR initialization"""
-    global SERVER_AVAILABLE, NFCBridge, HOST, PORT
+    global SERVER_AVAILABLE, NFCBridge, signal_ready, install_fast_event_loop, websockets, HOST, PORT
     if SERVER_AVAILABLE is not None:
         return SERVER_AVAILABLE
     
     try:
         from server import NFCBridge as _NFCBridge, HOST as _HOST, PORT as _PORT
-        import websockets
+        from server import signal_ready as _signal_ready
+        from bridge import install_fast_event_loop as _install_fast_event_loop
+        import websockets as _websockets
         NFCBridge = _NFCBridge
+        websockets = _websockets
+        signal_ready = _signal_ready
+        install_fast_event_loop = _install_fast_event_loop
         HOST = _HOST
         PORT = _PORT
         SERVER_AVAILABLE = True
@@ -95,6 +110,7 @@ class NFCBridgeService:
         self.bridge = None
         self.server = None
         self.loop = None
+        self._stop_evt = None  # asyncio.Event, created on the server thread's loop
         self.server_thread = None
         self.logger = None
         
@@ -102,25 +118,27 @@ class NFCBridgeService:
         self._setup_logging()
     
     def _setup_logging(self):
-        """Setup logging with fallbacks for service environment"""
+        """Setup logging with fallbacks for service environment (once per process)"""
+        global _LOGGING_INITIALIZED
+        self.logger = logging.getLogger(__name__)
+        if _LOGGING_INITIALIZED:
+            return
+        
         try:
             log_path = script_dir / 'nfc_service.log'
             
-            # Clear any existing handlers
-            root_logger = logging.getLogger()
-            root_logger.handlers.clear()
-            
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(str(log_path), encoding='utf-8'),
-                ]
+            # Added to the root logger so bridge/reader logs land in the file too;
+            # other handlers (e.g. pywin32's) are left alone
+            handler = RotatingFileHandler(
+                str(log_path), maxBytes=5_000_000, backupCount=3, encoding='utf-8'
             )
-            self.logger = logging.getLogger(__name__)
+            handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+            root_logger = logging.getLogger()
+            root_logger.addHandler(handler)
+            root_logger.setLevel(logging.INFO)
+            _LOGGING_INITIALIZED = True
         except Exception as e:
             # Fallback to null logger if file logging fails
-            self.logger = logging.getLogger(__name__)
             self.logger.addHandler(logging.NullHandler())
     
     def start(self):
@@ -136,15 +154,29 @@ class NFCBridgeService:
         self.logger.info("NFC Bridge Service stopping...")
         self.running = False
         
-        if self.loop and self.server:
-            # Schedule server close
-            asyncio.run_coroutine_threadsafe(self._stop_server(), self.loop)
+        if self.loop and self._stop_evt:
+            # Wake serve(), which closes the server
+            try:
+                self.loop.call_soon_threadsafe(self._stop_evt.set)
+            except RuntimeError:
+                pass  # Loop already closed
         
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(timeout=5)
         
         self.logger.info("NFC Bridge Service stopped")
     
+    def _warmup_ocr(self):
+        """Load the OCR models in the background so the first Zairyu read doesn't pay for it"""
+        provider = self.bridge.ocr_provider
+        try:
+            if provider.initialize():
+                self.logger.info(f"OCR: {provider.name} models loaded")
+            else:
+                self.logger.warning(f"OCR: {provider.name} failed to initialize")
+        except Exception as e:
+            self.logger.warning(f"OCR warmup error: {e}")
+    
     async def _stop_server(self):
         """Stop the WebSocket server"""
         if self.server:
@@ -153,6 +185,16 @@ class NFCBridgeService:
     
     def _run_server(self):
         """Run the server in a separate thread"""
+        if sys.platform == 'win32':
+            # The event loop thread relays card reads to clients - keep other
+            # workloads from preempting it (THREAD_PRIORITY_ABOVE_NORMAL)
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 1)
+            except Exception as e:
+                self.logger.warning(f"Could not raise server thread priority: {e}")
+        
         try:
             self.logger.info("Initializing server components...")
             
@@ -161,13 +203,18 @@ class NFCBridgeService:
                 self.logger.error("Failed to import server module")
                 return
             
-            import websockets
+            loop_name = install_fast_event_loop()
+            if loop_name:
+                self.logger.info(f"Using {loop_name} event loop")
             
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
+            self._stop_evt = asyncio.Event()
             
-            self.logger.info("Creating NFC Bridge...")
-            self.bridge = NFCBridge()
+            # Reused across stop/start so OCR models and the reader thread survive a restart
+            if self.bridge is None:
+                self.logger.info("Creating NFC Bridge...")
+                self.bridge = NFCBridge()
             
             async def serve():
                 self.server = await websockets.serve(
@@ -176,17 +223,22 @@ class NFCBridgeService:
                     PORT
                 )
                 self.logger.info(f"Server listening on ws://{HOST}:{PORT}")
+                signal_ready()  # Wakes the launcher in standalone mode
+                
+                # Load OCR models while we wait for the first client
+                if self.bridge.ocr_provider:
+                    threading.Thread(target=self._warmup_ocr, name="ocr_warmup", daemon=True).start()
                 
-                # Keep running until stopped
-                while self.running:
-                    await asyncio.sleep(1)
+                # Keep running until stop() sets the event
+                if self.running:
+                    await self._stop_evt.wait()
+                await self._stop_server()
             
             self.loop.run_until_complete(serve())
             
-        except Exception as e:
-            self.logger.error(f"Server error: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            # One record with the traceback, through the rotating log file
+            self.logger.exception("Server error")
         finally:
             if self.loop:
                 self.loop.close()
@@ -200,6 +252,16 @@ if WIN32_AVAILABLE:
         _svc_display_name_ = "NFC Bridge Server"
         _svc_description_ = "WebSocket server for NFC card reading (CCCD, My Number, Suica)"
         
+        # Set once the process has changed into script_dir (cwd is process-wide)
+        _cwd_set = False
+        
+        @classmethod
+        def _chdir_once(cls):
+            """Change to the script directory so imports and relative paths work"""
+            if not cls._cwd_set:
+                os.chdir(str(script_dir))
+                cls._cwd_set = True
+        
         def __init__(self, args):
             win32serviceutil.ServiceFramework.__init__(self, args)
             self.stop_event = win32event.CreateEvent(None, 0, 0, None)
@@ -207,7 +269,7 @@ if WIN32_AVAILABLE:
             
             try:
                 # Change to script directory so imports work correctly
-                os.chdir(str(script_dir))
+                self._chdir_once()
                 
                 # Create service instance (minimal initialization)
                 self.service = NFCBridgeService()
@@ -232,7 +294,7 @@ if WIN32_AVAILABLE:
             """Called when the service is asked to start"""
             try:
                 # Ensure we're in the correct directory
-                os.chdir(str(script_dir))
+                self._chdir_once()
                 
                 # Report running status IMMEDIATELY to prevent Windows timeout
                 # The actual server initialization will happen in background thread
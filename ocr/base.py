@@ -4,30 +4,40 @@ Implement this interface to add new OCR backends (PaddleOCR, LLM, etc.)
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Optional: xxhash for fast content hashing of cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+    xxhash = None
 
-@dataclass
+
+@dataclass(slots=True)
 class OCRTextBlock:
     """Single text block detected by OCR"""
     text: str
     confidence: float
-    bbox: List[List[float]] = field(default_factory=list)  # Bounding box coordinates
+    bbox: Tuple[float, ...] = ()  # Flat corner coordinates (x0, y0, x1, y1, ...), top-left first
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to JSON-serializable dict"""
         return {
             "text": self.text,
             "confidence": round(self.confidence, 3),
-            "bbox": self.bbox
+            "bbox": [list(self.bbox[i:i + 2]) for i in range(0, len(self.bbox), 2)]
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """Result from OCR processing"""
     success: bool
@@ -84,15 +94,23 @@ class OCRProvider(ABC):
                 self._reader = MyOCRLib()
                 return True
             
-            def process_image(self, image_data: bytes) -> OCRResult:
+            def _process_image_impl(self, image_data: bytes) -> OCRResult:
                 results = self._reader.read(image_data)
                 blocks = [OCRTextBlock(text=r.text, confidence=r.conf) for r in results]
                 return OCRResult(success=True, text_blocks=blocks, provider=self.name)
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 128):
+        """
+        Args:
+            cache_size: Number of successful results to keep, keyed by a hash
+                       of the image bytes (0 disables the cache)
+        """
         self.name: str = "base"
         self._initialized: bool = False
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, OCRResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()  # OCR runs on a thread pool
     
     @abstractmethod
     def is_available(self) -> bool:
@@ -116,28 +134,95 @@ class OCRProvider(ABC):
         pass
     
     @abstractmethod
+    def _process_image_impl(self, image_data: bytes) -> OCRResult:
+        """
+        Process an image and extract text (provider-specific, uncached).
+        
+        Args:
+            image_data: Raw image bytes (JPEG, PNG, etc.)
+            
+        Returns:
+            OCRResult with extracted text blocks
+        """
+        pass
+    
     def process_image(self, image_data: bytes) -> OCRResult:
         """
         Process an image and extract text.
         
+        Re-reads of the same card image are served from an LRU cache;
+        failed results are never cached.
+        
         Args:
             image_data: Raw image bytes (JPEG, PNG, etc.)
             
         Returns:
             OCRResult with extracted text blocks
         """
-        pass
+        if not self.cache_size:
+            return self._process_image_impl(image_data)
+        
+        key = self._cache_key(image_data)
+        result = self._cache_get(key)
+        if result is not None:
+            logger.info(f"OCR cache hit ({self.name})")
+            return result
+        
+        result = self._process_image_impl(image_data)
+        self._cache_put(key, result)
+        return result
+    
+    @staticmethod
+    def _cache_key(image_data: bytes) -> tuple:
+        """Fast non-cryptographic content key for an image"""
+        if XXHASH_AVAILABLE:
+            return (len(image_data), xxhash.xxh3_64_intdigest(image_data))
+        return (len(image_data), hash(image_data))
+    
+    def _cache_get(self, key: tuple) -> Optional[OCRResult]:
+        """Look up a cached result, marking it most recently used"""
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+    
+    def _cache_put(self, key: tuple, result: OCRResult):
+        """Store a successful result, evicting the least recently used"""
+        if not self.cache_size or not result.success:
+            return
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def process_batch(self, images: List[bytes]) -> List[OCRResult]:
+        """
+        Process several images, one OCRResult per input (in order).
+        
+        The default runs process_image() on each image; providers whose
+        engine can batch inference override this.
+        
+        Args:
+            images: Raw image bytes for each image
+            
+        Returns:
+            List of OCRResult, same length and order as images
+        """
+        return [self.process_image(image_data) for image_data in images]
     
     def ensure_initialized(self) -> bool:
         """Ensure the OCR engine is initialized"""
-        if not self._initialized:
-            if not self.is_available():
-                logger.error(f"OCR provider {self.name} is not available")
-                return False
-            if not self.initialize():
-                logger.error(f"Failed to initialize OCR provider {self.name}")
-                return False
-            self._initialized = True
+        if self._initialized:
+            return True
+        if not self.is_available():
+            logger.error(f"OCR provider {self.name} is not available")
+            return False
+        if not self.initialize():
+            logger.error(f"Failed to initialize OCR provider {self.name}")
+            return False
+        self._initialized = True
         return True
     
     def get_install_instructions(self) -> str:
@@ -4,6 +4,8 @@ Supports Japanese and English text recognition.
 """
 
 import logging
+import threading
+import weakref
 from typing import List
 from .base import OCRProvider, OCRResult, OCRTextBlock
 
@@ -17,6 +19,13 @@ except ImportError:
     EASYOCR_AVAILABLE = False
     easyocr = None
 
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+    torch = None
+
 try:
     from PIL import Image
     import io
@@ -33,6 +42,48 @@ except ImportError:
     NUMPY_AVAILABLE = False
     np = None
 
+# Optional: libjpeg-turbo for faster JPEG decode (SIMD IDCT, decodes straight
+# to a numpy array). TurboJPEG() raises if the native library is missing.
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+except Exception:
+    TurboJPEG = None
+    TJPF_RGB = None
+    _turbo_jpeg = None
+
+JPEG_MAGIC = b'\xff\xd8\xff'
+
+# One easyocr.Reader per (languages, use_gpu), shared by all provider
+# instances - each reader holds ~150 MB of weights (and VRAM on GPU).
+# Weak values: a reader is freed once no provider uses it.
+_READER_CACHE: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+_READER_LOCK = threading.Lock()
+
+PRECISIONS = ("fp32", "fp16", "int8")
+
+
+def _cast_floats(value, dtype):
+    """Cast floating-point tensors (also inside tuples/lists) to dtype"""
+    if torch.is_tensor(value):
+        return value.to(dtype) if value.is_floating_point() else value
+    if isinstance(value, (tuple, list)):
+        return type(value)(_cast_floats(v, dtype) for v in value)
+    return value
+
+
+def _run_in_fp16(module):
+    """
+    Convert a model to FP16 in place, keeping a float32 interface.
+    
+    Inputs are cast to half on the way in and outputs back to float32 on
+    the way out, so EasyOCR's numpy/OpenCV post-processing is unaffected.
+    """
+    module.half()
+    module.register_forward_pre_hook(lambda m, args: _cast_floats(args, torch.float16))
+    module.register_forward_hook(lambda m, args, output: _cast_floats(output, torch.float32))
+    return module
+
 
 class EasyOCRProvider(OCRProvider):
     """
@@ -50,26 +101,50 @@ class EasyOCRProvider(OCRProvider):
     Install: pip install easyocr
     """
     
-    def __init__(self, languages: List[str] = None, use_gpu: bool = False):
+    def __init__(
+        self,
+        languages: List[str] = None,
+        use_gpu: bool = False,
+        batch_size: int = 8,
+        max_long_side: int = 1280,
+        precision: str = "int8",
+    ):
         """
         Initialize EasyOCR provider.
         
         Args:
             languages: List of language codes (default: ['ja', 'en'])
             use_gpu: Whether to use GPU acceleration
+            batch_size: Max images per forward pass in process_batch()
+            max_long_side: Downscale images whose longer side exceeds this
+                          before OCR (0 disables). Cards are small and the
+                          recognizer works on <=64 px tall crops anyway, so
+                          larger inputs only cost detector time.
+            precision: "int8" - dynamic quantization on CPU (EasyOCR's
+                       default; GPU runs fp32), "fp32" - no quantization,
+                       "fp16" - half-precision models on CUDA (GPU only)
         """
         super().__init__()
         self.name = "easyocr"
         self.languages = languages or ['ja', 'en']
         self.use_gpu = use_gpu
+        self.batch_size = batch_size
+        self.max_long_side = max_long_side
+        self.precision = precision
         self._reader = None
     
     def is_available(self) -> bool:
         """Check if EasyOCR and dependencies are installed"""
         return EASYOCR_AVAILABLE and PILLOW_AVAILABLE and NUMPY_AVAILABLE
     
-    def initialize(self) -> bool:
-        """Initialize the EasyOCR reader (lazy loading)"""
+    def initialize(self, warmup: bool = False) -> bool:
+        """
+        Initialize the EasyOCR reader (lazy loading).
+        
+        Args:
+            warmup: If True, run a blank image through the reader so the first
+                   real image doesn't pay for kernel compilation/allocation.
+        """
         if self._reader is not None:
             return True
         
@@ -77,16 +152,133 @@ class EasyOCRProvider(OCRProvider):
             logger.error("EasyOCR dependencies not available")
             return False
         
+        if self.precision not in PRECISIONS:
+            logger.warning(f"Unknown precision '{self.precision}', using int8")
+            self.precision = "int8"
+        if self.precision == "fp16" and not self.use_gpu:
+            logger.warning("FP16 needs use_gpu=True, using fp32")
+            self.precision = "fp32"
+        
         try:
-            logger.info(f"Initializing EasyOCR reader (languages: {self.languages})...")
-            self._reader = easyocr.Reader(self.languages, gpu=self.use_gpu)
-            logger.info("EasyOCR reader initialized successfully")
+            # Language order matters to EasyOCR (model/charset selection), so it's part of the key
+            key = (tuple(self.languages), self.use_gpu, self.precision)
+            with _READER_LOCK:
+                reader = _READER_CACHE.get(key)
+                if reader is None:
+                    logger.info(f"Initializing EasyOCR reader (languages: {self.languages})...")
+                    reader = easyocr.Reader(
+                        self.languages, gpu=self.use_gpu, quantize=self.precision == "int8"
+                    )
+                    if self.precision == "fp16":
+                        reader.detector = _run_in_fp16(reader.detector)
+                        reader.recognizer = _run_in_fp16(reader.recognizer)
+                    _READER_CACHE[key] = reader
+                    logger.info(f"EasyOCR reader initialized successfully (precision: {self.precision})")
+                else:
+                    logger.info(f"Reusing shared EasyOCR reader (languages: {self.languages})")
+            self._reader = reader
+            
+            if warmup:
+                try:
+                    self._reader.readtext(np.zeros((32, 32, 3), dtype=np.uint8))
+                    logger.info("EasyOCR warmup complete")
+                except Exception as e:
+                    logger.warning(f"Warmup failed (non-critical): {e}")
             return True
         except Exception as e:
             logger.error(f"Failed to initialize EasyOCR: {e}")
             return False
     
-    def process_image(self, image_data: bytes) -> OCRResult:
+    @staticmethod
+    def _to_text_blocks(ocr_results, scale: float = 1.0) -> List[OCRTextBlock]:
+        """
+        Convert EasyOCR (bbox, text, confidence) tuples to OCRTextBlock objects.
+        
+        Args:
+            ocr_results: readtext() output
+            scale: Factor the image was downscaled by; bboxes are mapped back
+                   to original-image coordinates
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        text_blocks = []
+        for (bbox, text, confidence) in ocr_results:
+            # Convert numpy types to native Python types in one C-level pass
+            # (bbox is a list of [x,y] points, as ints or numpy scalars)
+            conf_value = float(confidence)
+            points = np.asarray(bbox, dtype=np.float64)
+            if scale != 1.0:
+                points /= scale
+            
+            text_blocks.append(OCRTextBlock(
+                text=text,
+                confidence=conf_value,
+                bbox=tuple(points.ravel().tolist())
+            ))
+            if debug:
+                logger.debug(f"OCR: '{text}' (conf: {conf_value:.2f})")
+        return text_blocks
+    
+    def _decode_image(self, image_data: bytes):
+        """
+        Decode image bytes to an RGB/grayscale numpy array.
+        
+        JPEGs go through libjpeg-turbo when available; everything else
+        (PNG, JP2, TIFF) and any turbo failure uses Pillow. Large JPEGs are
+        decoded at 1/2, 1/4 or 1/8 scale in the DCT domain (never smaller
+        than max_long_side), so the full-resolution pixel buffer is never
+        allocated.
+        
+        Returns:
+            (array, scale) - decoded size relative to the original
+        """
+        if _turbo_jpeg is not None and image_data[:3] == JPEG_MAGIC:
+            try:
+                width, height, _, _ = _turbo_jpeg.decode_header(image_data)
+                denom = self._jpeg_scale_denom(max(width, height))
+                img_array = _turbo_jpeg.decode(
+                    image_data, pixel_format=TJPF_RGB, scaling_factor=(1, denom)
+                )
+                return img_array, img_array.shape[1] / width
+            except Exception as e:
+                logger.debug(f"TurboJPEG decode failed, using Pillow: {e}")
+        
+        img = Image.open(io.BytesIO(image_data))
+        width, height = img.size
+        if img.format == 'JPEG' and self._jpeg_scale_denom(max(width, height)) > 1:
+            # draft() picks the largest DCT scale that still covers the requested size
+            ratio = self.max_long_side / max(width, height)
+            img.draft(img.mode, (int(width * ratio), int(height * ratio)))
+        return np.asarray(img), img.size[0] / width
+    
+    def _jpeg_scale_denom(self, long_side: int) -> int:
+        """Largest JPEG DCT scale denominator (1, 2, 4, 8) keeping long_side >= max_long_side"""
+        denom = 1
+        if self.max_long_side:
+            while denom < 8 and long_side // (denom * 2) >= self.max_long_side:
+                denom *= 2
+        return denom
+    
+    def _load_image(self, image_data: bytes):
+        """
+        Decode and downscale an image so its longer side is at most max_long_side.
+        
+        Returns:
+            (array, scale) - scale relative to the original image (1.0 when
+            the image was left alone), used to map bboxes back
+        """
+        img_array, scale = self._decode_image(image_data)
+        height, width = img_array.shape[:2]
+        long_side = max(height, width)
+        if not self.max_long_side or long_side <= self.max_long_side:
+            return img_array, scale
+        
+        resize_scale = self.max_long_side / long_side
+        new_size = (max(1, int(width * resize_scale)), max(1, int(height * resize_scale)))
+        resized = np.asarray(Image.fromarray(img_array).resize(new_size, Image.BILINEAR))
+        logger.debug(f"Downscaled image from {width}x{height} to {new_size[0]}x{new_size[1]}")
+        return resized, scale * resize_scale
+    
+    def _process_image_impl(self, image_data: bytes) -> OCRResult:
         """
         Process image and extract text using EasyOCR.
         
@@ -105,37 +297,14 @@ class EasyOCRProvider(OCRProvider):
         
         try:
             # Convert bytes to numpy array
-            img = Image.open(io.BytesIO(image_data))
-            img_array = np.array(img)
+            img_array, scale = self._load_image(image_data)
             
-            logger.info(f"Running EasyOCR on image (size: {img.size}, mode: {img.mode})...")
+            logger.info(f"Running EasyOCR on image (shape: {img_array.shape})...")
             
             # Run OCR
             ocr_results = self._reader.readtext(img_array)
             
-            # Convert to OCRTextBlock objects
-            text_blocks = []
-            for (bbox, text, confidence) in ocr_results:
-                # Convert numpy types to native Python types
-                conf_value = float(confidence) if hasattr(confidence, 'item') else confidence
-                
-                # Convert bbox (list of [x,y] points)
-                bbox_native = []
-                for point in bbox:
-                    if hasattr(point, 'tolist'):
-                        bbox_native.append(point.tolist())
-                    elif isinstance(point, (list, tuple)):
-                        bbox_native.append([float(x) if hasattr(x, 'item') else x for x in point])
-                    else:
-                        bbox_native.append(point)
-                
-                text_blocks.append(OCRTextBlock(
-                    text=text,
-                    confidence=conf_value,
-                    bbox=bbox_native
-                ))
-                logger.debug(f"OCR: '{text}' (conf: {conf_value:.2f})")
-            
+            text_blocks = self._to_text_blocks(ocr_results, scale)
             logger.info(f"EasyOCR extracted {len(text_blocks)} text regions")
             
             return OCRResult(
@@ -154,6 +323,60 @@ class EasyOCRProvider(OCRProvider):
                 provider=self.name
             )
     
+    def process_batch(self, images: List[bytes]) -> List[OCRResult]:
+        """
+        Process several images with batched EasyOCR inference.
+        
+        Images of the same size go through readtext_batched() together, so one
+        detector/recognizer pass covers up to batch_size images. Mixed sizes
+        fall back to one readtext() per image (batching them would mean
+        resizing every image to a common size and distorting the text).
+        
+        Args:
+            images: Raw image bytes for each image
+            
+        Returns:
+            List of OCRResult, same length and order as images
+        """
+        if len(images) <= 1:
+            return [self.process_image(image_data) for image_data in images]
+        
+        if not self.ensure_initialized():
+            return [OCRResult(
+                success=False,
+                error="EasyOCR not available. Install: pip install easyocr",
+                provider=self.name
+            ) for _ in images]
+        
+        try:
+            prepared = [self._load_image(image_data) for image_data in images]
+        except Exception as e:
+            logger.error(f"EasyOCR batch decode failed: {e}")
+            return [self.process_image(image_data) for image_data in images]
+        
+        arrays = [img_array for img_array, _ in prepared]
+        if len({a.shape for a in arrays}) != 1:
+            return [self.process_image(image_data) for image_data in images]
+        
+        try:
+            logger.info(f"Running batched EasyOCR on {len(arrays)} images (shape: {arrays[0].shape})...")
+            batch_results = self._reader.readtext_batched(
+                arrays, batch_size=min(len(arrays), self.batch_size)
+            )
+        except Exception as e:
+            logger.error(f"Batched EasyOCR failed, processing one by one: {e}")
+            return [self.process_image(image_data) for image_data in images]
+        
+        results = []
+        for image_data, ocr_results, (_, scale) in zip(images, batch_results, prepared):
+            text_blocks = self._to_text_blocks(ocr_results, scale)
+            result = OCRResult(success=True, text_blocks=text_blocks, provider=self.name)
+            self._cache_put(self._cache_key(image_data), result)
+            results.append(result)
+        logger.info(f"EasyOCR extracted {sum(len(r.text_blocks) for r in results)} text regions "
+                    f"from {len(results)} images")
+        return results
+    
     def get_install_instructions(self) -> str:
         """Get installation instructions"""
         missing = []
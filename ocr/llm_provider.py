@@ -6,13 +6,73 @@ This is a template showing how to implement LLM-based OCR.
 You'll need to add your API key and implement the actual API calls.
 """
 
+import asyncio
 import base64
 import logging
+import threading
+import time
 from typing import List, Optional
 from .base import OCRProvider, OCRResult, OCRTextBlock
 
 logger = logging.getLogger(__name__)
 
+# Try to import dependencies
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Responses that mean "slow down and try again"
+RETRY_STATUS_CODES = (429, 503)
+MAX_BACKOFF = 30.0
+
+# Leading bytes -> MIME type for the data URL sent to the API
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF8', 'image/gif'),
+    (b'\x00\x00\x00\x0cjP  ', 'image/jp2'),
+    (b'\xffO\xffQ', 'image/jp2'),  # Raw J2K codestream
+)
+
+
+def _sniff_mime_type(image_data: bytes) -> str:
+    """Guess the image MIME type from magic bytes (default: image/jpeg)"""
+    for signature, mime_type in IMAGE_SIGNATURES:
+        if image_data.startswith(signature):
+            return mime_type
+    if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'
+
+
+class _RateLimiter:
+    """Spaces request starts at least 1/rps seconds apart"""
+    
+    def __init__(self, requests_per_second: float):
+        self.min_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = asyncio.Lock()
+        self._next_time = 0.0
+    
+    async def acquire(self):
+        if not self.min_interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_time > now:
+                await asyncio.sleep(self._next_time - now)
+                now = self._next_time
+            self._next_time = now + self.min_interval
+
 
 class LLMOCRProvider(OCRProvider):
     """
@@ -57,7 +117,10 @@ class LLMOCRProvider(OCRProvider):
         self,
         model: str = "gpt-4o",
         api_key: Optional[str] = None,
-        prompt: Optional[str] = None
+        prompt: Optional[str] = None,
+        max_concurrency: int = 4,
+        requests_per_second: float = 0,
+        max_retries: int = 3,
     ):
         """
         Initialize LLM OCR provider.
@@ -66,12 +129,27 @@ class LLMOCRProvider(OCRProvider):
             model: Model name (e.g., "gpt-4o", "claude-3-sonnet")
             api_key: API key for the LLM service
             prompt: Custom prompt for text extraction
+            max_concurrency: Max API requests in flight at once
+            requests_per_second: Rate limit on request starts (0 = unlimited)
+            max_retries: Retries on 429/503 (exponential backoff, capped at 30s)
         """
         super().__init__()
         self.name = "llm"
         self.model = model
         self.api_key = api_key
         self.prompt = prompt or self._default_prompt()
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
+        # All API calls run on one private event loop (background thread)
+        # that owns the client, semaphore and rate limiter, so the limits
+        # hold across every calling thread and event loop.
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+        self._client = None
+        self._sem = None
+        self._rate_limiter = None
     
     def _default_prompt(self) -> str:
         """Default prompt for card text extraction"""
@@ -97,16 +175,7 @@ For dates, use ISO format (YYYY-MM-DD) when possible."""
     
     def is_available(self) -> bool:
         """Check if required libraries are available"""
-        # Check for httpx or requests
-        try:
-            import httpx
-            return True
-        except ImportError:
-            try:
-                import requests
-                return True
-            except ImportError:
-                return False
+        return HTTPX_AVAILABLE
     
     def initialize(self) -> bool:
         """Validate configuration"""
@@ -119,10 +188,105 @@ For dates, use ISO format (YYYY-MM-DD) when possible."""
         
         return True
     
-    def process_image(self, image_data: bytes) -> OCRResult:
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the provider's event loop thread on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever, name="llm_ocr_loop", daemon=True
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Get the shared AsyncClient (only called on the provider's loop)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=32),
+            )
+            self._sem = asyncio.Semaphore(self.max_concurrency)
+            self._rate_limiter = _RateLimiter(self.requests_per_second)
+        return self._client
+    
+    async def _post_with_retry(self, url: str, headers: dict, payload: dict) -> "httpx.Response":
+        """POST under the concurrency cap and rate limit, backing off on 429/503"""
+        client = self._get_client()
+        attempt = 0
+        while True:
+            async with self._sem:
+                await self._rate_limiter.acquire()
+                response = await client.post(url, headers=headers, json=payload)
+            
+            rate_limited = (response.status_code in RETRY_STATUS_CODES
+                            or (response.status_code != 200 and "rate limit" in response.text.lower()))
+            if not rate_limited or attempt >= self.max_retries:
+                return response
+            
+            delay = min(2 ** attempt, MAX_BACKOFF)
+            attempt += 1
+            logger.warning(f"LLM API returned {response.status_code}, retry {attempt}/{self.max_retries} in {delay}s")
+            await asyncio.sleep(delay)
+    
+    def _process_image_impl(self, image_data: bytes) -> OCRResult:
         """
         Process image using LLM vision API.
         
+        Synchronous entry point for callers outside an event loop (e.g. the
+        OCR worker threads); blocks until the provider's loop has the result.
+        """
+        future = asyncio.run_coroutine_threadsafe(self._aprocess_image(image_data), self._ensure_loop())
+        return future.result()
+    
+    async def aprocess_image(self, image_data: bytes) -> OCRResult:
+        """
+        Process image using LLM vision API from any event loop.
+        
+        The request itself runs on the provider's loop so it shares the
+        concurrency cap and rate limit with all other callers. Uses the same
+        result cache as process_image().
+        """
+        key = self._cache_key(image_data) if self.cache_size else None
+        if key is not None:
+            result = self._cache_get(key)
+            if result is not None:
+                logger.info(f"OCR cache hit ({self.name})")
+                return result
+        
+        future = asyncio.run_coroutine_threadsafe(self._aprocess_image(image_data), self._ensure_loop())
+        result = await asyncio.wrap_future(future)
+        if key is not None:
+            self._cache_put(key, result)
+        return result
+    
+    def close(self):
+        """Close the HTTP client and stop the provider's event loop"""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        if loop is None:
+            return
+        
+        async def shutdown():
+            if self._client is not None:
+                await self._client.aclose()
+            self._client = None
+            self._sem = None
+            self._rate_limiter = None
+        
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    
+    async def _aprocess_image(self, image_data: bytes) -> OCRResult:
+        """
+        Process image using LLM vision API (runs on the provider's loop).
+        
         Note: This is a template implementation.
         You need to implement the actual API calls for your chosen LLM.
         """
@@ -134,18 +298,19 @@ For dates, use ISO format (YYYY-MM-DD) when possible."""
             )
         
         try:
-            # Encode image to base64
-            image_b64 = base64.b64encode(image_data).decode('utf-8')
+            # Encode image to base64 once; kept as bytes until the request is built
+            image_b64 = base64.b64encode(image_data)
+            mime_type = _sniff_mime_type(image_data)
             
             # Determine provider
             provider = self.SUPPORTED_MODELS.get(self.model, "openai")
             
             if provider == "openai":
-                return self._process_openai(image_b64)
+                return await self._process_openai(image_b64, mime_type)
             elif provider == "anthropic":
-                return self._process_anthropic(image_b64)
+                return self._process_anthropic(image_b64, mime_type)
             elif provider == "google":
-                return self._process_google(image_b64)
+                return self._process_google(image_b64, mime_type)
             else:
                 return OCRResult(
                     success=False,
@@ -163,12 +328,10 @@ For dates, use ISO format (YYYY-MM-DD) when possible."""
                 provider=self.name
             )
     
-    def _process_openai(self, image_b64: str) -> OCRResult:
+    async def _process_openai(self, image_b64: bytes, mime_type: str) -> OCRResult:
         """Process using OpenAI GPT-4 Vision"""
-        try:
-            import httpx
-        except ImportError:
-            import requests as httpx
+        # Built once; retries in _post_with_retry resend the same payload
+        data_url = (f"data:{mime_type};base64,".encode('ascii') + image_b64).decode('ascii')
         
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -185,7 +348,7 @@ For dates, use ISO format (YYYY-MM-DD) when possible."""
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{image_b64}"
+                                "url": data_url
                             }
                         }
                     ]
@@ -194,11 +357,10 @@ For dates, use ISO format (YYYY-MM-DD) when possible."""
             "max_tokens": 1000
         }
         
-        response = httpx.post(
+        response = await self._post_with_retry(
             "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=payload,
-            timeout=60.0
+            headers,
+            payload
         )
         
         if response.status_code != 200:
@@ -218,7 +380,7 @@ For dates, use ISO format (YYYY-MM-DD) when possible."""
             provider=f"{self.name}:{self.model}"
         )
     
-    def _process_anthropic(self, image_b64: str) -> OCRResult:
+    def _process_anthropic(self, image_b64: bytes, mime_type: str) -> OCRResult:
         """Process using Anthropic Claude"""
         # TODO: Implement Anthropic API call
         return OCRResult(
@@ -227,7 +389,7 @@ For dates, use ISO format (YYYY-MM-DD) when possible."""
             provider=self.name
         )
     
-    def _process_google(self, image_b64: str) -> OCRResult:
+    def _process_google(self, image_b64: bytes, mime_type: str) -> OCRResult:
         """Process using Google Gemini"""
         # TODO: Implement Google Gemini API call
         return OCRResult(
@@ -250,7 +250,7 @@ class PaddleOCRProvider(OCRProvider):
             logger.warning(f"Image preprocessing failed: {e}")
             return img
     
-    def process_image(self, image_data: bytes) -> OCRResult:
+    def _process_image_impl(self, image_data: bytes) -> OCRResult:
         """
         Process image and extract text using PaddleOCR.
         
@@ -347,7 +347,7 @@ class PaddleOCRProvider(OCRProvider):
                         confidence = float(rec_scores[i]) if i < len(rec_scores) else 0.0
                         bbox = rec_polys[i] if i < len(rec_polys) else []
                         
-                        # Convert bbox to list format
+                        # Convert bbox to flat tuple format
                         bbox_list = self._convert_bbox(bbox)
                         
                         text_blocks.append(OCRTextBlock(
@@ -389,18 +389,14 @@ class PaddleOCRProvider(OCRProvider):
                 except Exception:
                     pass
     
-    def _convert_bbox(self, bbox) -> list:
-        """Convert bbox to list format."""
+    def _convert_bbox(self, bbox) -> tuple:
+        """Convert bbox (points array or list of [x,y]) to a flat (x0, y0, x1, y1, ...) tuple."""
         if bbox is None:
-            return []
-        if hasattr(bbox, 'tolist'):
-            return bbox.tolist()
-        if isinstance(bbox, (list, tuple)):
-            try:
-                return [[float(p[0]), float(p[1])] for p in bbox]
-            except (TypeError, ValueError, IndexError):
-                return list(bbox) if bbox else []
-        return []
+            return ()
+        try:
+            return tuple(np.asarray(bbox, dtype=np.float64).ravel().tolist())
+        except (TypeError, ValueError):
+            return ()
     
     def _parse_legacy_format(self, page_result) -> List[OCRTextBlock]:
         """Parse legacy PaddleOCR format: list of [bbox, (text, confidence)] tuples."""
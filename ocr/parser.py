@@ -14,6 +14,23 @@ from .base import OCRResult, OCRTextBlock
 
 logger = logging.getLogger(__name__)
 
+# Patterns used per line/block while parsing - compiled once at import
+_RE_DATE_MONTH_END = re.compile(r'.+\d{1,2}月$')
+_RE_CARD_NUMBER = re.compile(r'([A-Z]{2}\d{8}[A-Z]{2})')  # 2 letters + 8 digits + 2 letters
+_RE_DIGIT = re.compile(r'\d')
+_RE_JAPANESE = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]')
+_RE_DOB = re.compile(r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*[日月]')  # YYYY年MM月DD日
+_RE_PERIOD = re.compile(r'(\d{1,2})\s*年\s*(?:(\d{1,2})\s*月)?')  # X年Y月 or X年
+_RE_EXPIRY_PAREN = re.compile(r'[（\(]\s*(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*[日月]\s*[）\)]')
+_RE_VALID_UNTIL = re.compile(r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日\s*まで\s*有効')
+_RE_FULL_DATE = re.compile(r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日')
+_RE_YEAR = re.compile(r'\d{4}\s*年')
+_RE_STANDALONE_PERIOD = re.compile(r'(?<!\d)(\d{1,2})\s*年\s*(\d{1,2})\s*月(?!\d)')
+_RE_STUDENT = re.compile(r'\bStudent\b', re.IGNORECASE)
+_RE_PREFECTURE = re.compile(r'(東京都|北海道|(?:京都|大阪)府|.{2,3}県)')
+_RE_ADDRESS_LABEL = re.compile(r'住居地\s*[:：]?\s*')
+_RE_LATIN_PREFIX = re.compile(r'^\s*[A-Za-z\s]+\s*')
+
 
 class ZairyuCardParser:
     """
@@ -312,7 +329,7 @@ class ZairyuCardParser:
         date_str = date_str.replace(" ", "")
         
         # Fix common OCR error where '日' is read as '月' at end of date
-        if re.match(r'.+\d{1,2}月$', date_str) and date_str.count('月') > 1:
+        if _RE_DATE_MONTH_END.match(date_str) and date_str.count('月') > 1:
             date_str = date_str[:-1] + "日"
         
         # Fix OCR errors in numbers
@@ -323,19 +340,16 @@ class ZairyuCardParser:
     
     def _extract_card_number(self, full_text: str, all_texts: List[str]) -> Dict[str, str]:
         """Extract card number (e.g., UH17622299ER)"""
-        # Pattern: 2 letters + 8 digits + 2 letters
-        pattern = r'([A-Z]{2}\d{8}[A-Z]{2})'
-        
         # First try in full text (no spaces)
         clean_text = full_text.replace(" ", "").upper()
-        match = re.search(pattern, clean_text)
+        match = _RE_CARD_NUMBER.search(clean_text)
         if match:
             return {"card_number": match.group(1)}
         
         # Try in individual text blocks
         for text in all_texts:
             clean = text.replace(" ", "").upper()
-            match = re.search(pattern, clean)
+            match = _RE_CARD_NUMBER.search(clean)
             if match:
                 return {"card_number": match.group(1)}
         
@@ -360,11 +374,11 @@ class ZairyuCardParser:
                     continue
                 
                 # Skip if contains numbers (except for spacing issues)
-                if re.search(r'\d', check_content):
+                if _RE_DIGIT.search(check_content):
                     continue
                 
                 # Skip if contains Japanese characters
-                if re.search(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]', check_content):
+                if _RE_JAPANESE.search(check_content):
                     continue
                 
                 # Skip known non-name words
@@ -513,11 +527,11 @@ class ZairyuCardParser:
                 continue
             
             # Skip if contains numbers
-            if re.search(r'\d', check_content):
+            if _RE_DIGIT.search(check_content):
                 continue
             
             # Skip if contains Japanese characters
-            if re.search(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]', check_content):
+            if _RE_JAPANESE.search(check_content):
                 continue
             
             # Skip known non-name words
@@ -712,15 +726,12 @@ class ZairyuCardParser:
         """Extract date of birth, gender, and nationality"""
         result = {}
         
-        # Date pattern: YYYY年MM月DD日
-        dob_pattern = r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*[日月]'
-        
         logger.warning("=== EXTRACTING DOB/GENDER/NATIONALITY ===")
         logger.warning(f"  Searching in {len(text_lines)} lines")
         
         # First, find DOB line
         for i, line in enumerate(text_lines):
-            dob_match = re.search(dob_pattern, line)
+            dob_match = _RE_DOB.search(line)
             if dob_match:
                 year = dob_match.group(1)
                 month = dob_match.group(2).zfill(2)
@@ -804,16 +815,10 @@ class ZairyuCardParser:
         """Extract period of stay and expiration date"""
         result = {}
         
-        # Pattern for period: X年Y月 or X年
-        period_pattern = r'(\d{1,2})\s*年\s*(?:(\d{1,2})\s*月)?'
-        
-        # Pattern for expiry in parentheses: (YYYY年MM月DD日)
-        expiry_paren_pattern = r'[（\(]\s*(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*[日月]\s*[）\)]'
-        
-        # Look for period with expiry in parentheses
+        # Look for period with expiry in parentheses: (YYYY年MM月DD日)
         for line in text_lines:
             # Check for expiry in parentheses
-            expiry_match = re.search(expiry_paren_pattern, line)
+            expiry_match = _RE_EXPIRY_PAREN.search(line)
             if expiry_match:
                 year = expiry_match.group(1)
                 month = expiry_match.group(2).zfill(2)
@@ -822,7 +827,7 @@ class ZairyuCardParser:
                 
                 # Also extract period before the parentheses
                 before_paren = line[:expiry_match.start()]
-                period_match = re.search(period_pattern, before_paren)
+                period_match = _RE_PERIOD.search(before_paren)
                 if period_match:
                     years = period_match.group(1)
                     months = period_match.group(2)
@@ -835,8 +840,7 @@ class ZairyuCardParser:
         
         # Fallback: look for "まで有効" pattern
         if "expiration_date" not in result:
-            valid_pattern = r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日\s*まで\s*有効'
-            match = re.search(valid_pattern, full_text)
+            match = _RE_VALID_UNTIL.search(full_text)
             if match:
                 year = match.group(1)
                 month = match.group(2).zfill(2)
@@ -846,8 +850,7 @@ class ZairyuCardParser:
         # Additional fallback for expiry date
         if "expiration_date" not in result:
             # Look for any 4-digit year date that's not DOB
-            date_pattern = r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日'
-            matches = re.findall(date_pattern, full_text)
+            matches = _RE_FULL_DATE.findall(full_text)
             if len(matches) >= 2:
                 # Take the later date as expiry
                 dates = []
@@ -869,9 +872,9 @@ class ZairyuCardParser:
             # Look for standalone period (not part of date)
             for line in text_lines:
                 # Skip lines with full dates
-                if re.search(r'\d{4}\s*年', line):
+                if _RE_YEAR.search(line):
                     # But check for period pattern before or after
-                    period_match = re.search(r'(?<!\d)(\d{1,2})\s*年\s*(\d{1,2})\s*月(?!\d)', line)
+                    period_match = _RE_STANDALONE_PERIOD.search(line)
                     if period_match:
                         result["period_of_stay"] = f"{period_match.group(1)}年{period_match.group(2)}月"
                         break
@@ -904,7 +907,7 @@ class ZairyuCardParser:
                 return result
         
         # Check for "Student" in English
-        if re.search(r'\bStudent\b', full_text, re.IGNORECASE):
+        if _RE_STUDENT.search(full_text):
             return {"status_of_residence": "留学", "status_of_residence_en": "Student"}
         
         return {}
@@ -912,24 +915,20 @@ class ZairyuCardParser:
     def _extract_address(self, text_lines: List[str], full_text: str) -> Dict[str, str]:
         """Extract address (Japanese prefecture/city pattern)"""
         
-        # Prefecture patterns
-        prefecture_pattern = r'(東京都|北海道|(?:京都|大阪)府|.{2,3}県)'
-        city_pattern = r'(.+?[市区町村])'
-        
         for line in text_lines:
             # Skip lines with dates
-            if re.search(r'\d{4}\s*年', line):
+            if _RE_YEAR.search(line):
                 continue
             
             # Check for prefecture
-            pref_match = re.search(prefecture_pattern, line)
+            pref_match = _RE_PREFECTURE.search(line)
             if pref_match:
                 # Try to get the full address from this line
                 address = line.strip()
                 
                 # Clean up unwanted parts
-                address = re.sub(r'住居地\s*[:：]?\s*', '', address)
-                address = re.sub(r'^\s*[A-Za-z\s]+\s*', '', address)  # Remove English prefix
+                address = _RE_ADDRESS_LABEL.sub('', address)
+                address = _RE_LATIN_PREFIX.sub('', address)  # Remove English prefix
                 
                 if address:
                     return {"address": address}
@@ -10,6 +10,7 @@ class APDU:
     
     # Basic commands
     GET_UID = [0xFF, 0xCA, 0x00, 0x00, 0x00]
+    SELECT_MF = [0x00, 0xA4, 0x00, 0x00, 0x02, 0x3F, 0x00]
     
     # ICAO 9303 (e-Passport / CCCD) commands
     SELECT_MRTD_APP = [0x00, 0xA4, 0x04, 0x0C, 0x07, 0xA0, 0x00, 0x00, 0x02, 0x47, 0x10, 0x01]
@@ -23,6 +24,11 @@ class APDU:
     EF_DG12 = [0x01, 0x0C]     # Additional document details
     EF_SOD = [0x01, 0x1D]      # Security Object
     
+    @staticmethod
+    def select_application(aid: List[int], p2: int = 0x0C) -> List[int]:
+        """Create SELECT by AID (DF name) command"""
+        return [0x00, 0xA4, 0x04, p2, len(aid)] + aid
+    
     @staticmethod
     def select_file(file_id: List[int]) -> List[int]:
         """Create SELECT FILE command"""
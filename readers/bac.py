@@ -7,7 +7,7 @@ import hashlib
 import logging
 from typing import Tuple
 
-from .utils import CRYPTO_AVAILABLE
+from .utils import CRYPTO_AVAILABLE, xor_bytes
 
 if CRYPTO_AVAILABLE:
     from Crypto.Cipher import DES3, DES
@@ -131,7 +131,7 @@ class BACAuthentication:
         cipher_a = DES.new(ka, DES.MODE_ECB)
         for i in range(0, len(padded), 8):
             block = padded[i:i+8]
-            xored = bytes(a ^ b for a, b in zip(h, block))
+            xored = xor_bytes(h, block)
             h = cipher_a.encrypt(xored)
         
         # Final block: decrypt with kb, encrypt with ka
@@ -66,6 +66,12 @@ def get_hex_string(data):
     return ' '.join(f'{b:02X}' for b in data)
 
 
+def xor_bytes(a: bytes, b: bytes) -> bytes:
+    """XOR two byte strings (truncated to the shorter one, like zip)"""
+    n = min(len(a), len(b))
+    return (int.from_bytes(a[:n], 'big') ^ int.from_bytes(b[:n], 'big')).to_bytes(n, 'big')
+
+
 def get_readers():
     """Get list of available card readers"""
     if not SMARTCARD_AVAILABLE:
@@ -13,7 +13,7 @@ import os
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from .utils import get_hex_string, CRYPTO_AVAILABLE, PILLOW_AVAILABLE
+from .utils import get_hex_string, xor_bytes, CRYPTO_AVAILABLE, PILLOW_AVAILABLE
 
 if CRYPTO_AVAILABLE:
     from Crypto.Cipher import DES3, DES
@@ -173,7 +173,7 @@ class ZairyuCardReader:
         cipher_a = DES.new(ka, DES.MODE_ECB)
         for i in range(0, len(padded), 8):
             block = padded[i:i+8]
-            xored = bytes(a ^ b for a, b in zip(h, block))
+            xored = xor_bytes(h, block)
             h = cipher_a.encrypt(xored)
         
         cipher_b = DES.new(kb, DES.MODE_ECB)
@@ -212,7 +212,7 @@ class ZairyuCardReader:
         
         for i in range(0, len(data), 8):
             block = data[i:i+8]
-            xored = bytes(a ^ b for a, b in zip(block, prev_block))
+            xored = xor_bytes(block, prev_block)
             encrypted = self._tdes_ede_block(k1, k2, xored, encrypt=True)
             result.extend(encrypted)
             prev_block = encrypted
@@ -234,7 +234,7 @@ class ZairyuCardReader:
         for i in range(0, len(data), 8):
             block = data[i:i+8]
             decrypted = self._tdes_ede_block(k1, k2, block, encrypt=False)
-            xored = bytes(a ^ b for a, b in zip(decrypted, prev_block))
+            xored = xor_bytes(decrypted, prev_block)
             result.extend(xored)
             prev_block = block
         
@@ -347,7 +347,7 @@ class ZairyuCardReader:
         
         logger.info("RND values verified successfully")
         
-        key_material = bytes(a ^ b for a, b in zip(k_ifd, k_icc))
+        key_material = xor_bytes(k_ifd, k_icc)
         logger.info(f"Key material (K.IFD XOR K.ICC): {get_hex_string(list(key_material))}")
         
         self.ks_enc = self._compute_session_key(key_material)
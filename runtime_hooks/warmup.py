@@ -0,0 +1,25 @@
+"""
+PyInstaller runtime hook: import the server's heavy dependencies up front.
+
+Runs before server.py / nfc_service.py in the frozen exe, so the modules
+are loaded from the PYZ archive in one pass instead of piecemeal as the
+main script imports them. Anything missing is left for the script to report.
+"""
+
+try:
+    import websockets.legacy.server  # noqa: F401
+except ImportError:
+    pass
+
+try:
+    import smartcard.System  # noqa: F401
+except ImportError:
+    pass
+
+try:
+    from Crypto.Cipher import DES3  # noqa: F401
+except ImportError:
+    try:
+        from Cryptodome.Cipher import DES3  # noqa: F401
+    except ImportError:
+        pass
@@ -25,6 +25,7 @@ import logging
 import sys
 import io
 import os
+from pathlib import Path
 
 # Skip PaddleOCR network connectivity check (slows startup significantly)
 os.environ['DISABLE_MODEL_SOURCE_CHECK'] = 'True'
@@ -41,13 +42,21 @@ except ImportError:
     print("Run: pip install websockets")
     exit(1)
 
-from bridge import NFCBridge
+from bridge import NFCBridge, install_fast_event_loop
 from readers import SMARTCARD_AVAILABLE
 
 # Configuration
 HOST = "localhost"
 PORT = 3005
 
+# Kept fresh while the server runs so the launcher can skip its TCP probe
+PID_FILE = Path(os.environ.get('LOCALAPPDATA', str(Path.home()))) / 'NFCBridge' / 'server.pid'
+PID_FILE_INTERVAL = 2  # seconds between touches (launcher trusts files < 5s old)
+
+# Named event set once we are listening - the launcher waits on it after starting us
+READY_EVENT = "Local\\NFCBridgeReady"
+_ready_event_handle = None  # kept open for the process lifetime so the event persists
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -140,6 +149,49 @@ async def warmup_ocr_in_background(ocr_provider):
     await loop.run_in_executor(None, do_warmup)
 
 
+def signal_ready():
+    """Set READY_EVENT so a waiting launcher wakes up (Windows only)"""
+    global _ready_event_handle
+    if sys.platform != 'win32' or _ready_event_handle:
+        return
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateEventW.restype = ctypes.c_void_p
+    kernel32.SetEvent.argtypes = [ctypes.c_void_p]
+    # Manual-reset: stays signalled for launchers that open it later
+    _ready_event_handle = kernel32.CreateEventW(None, True, False, READY_EVENT)
+    if _ready_event_handle:
+        kernel32.SetEvent(_ready_event_handle)
+    else:
+        logger.warning(f"Cannot create {READY_EVENT} event")
+
+
+async def keep_pid_file_fresh():
+    """
+    Write our PID to PID_FILE and touch it every PID_FILE_INTERVAL seconds.
+    The file is removed again when the server stops.
+    """
+    try:
+        PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PID_FILE.write_text(str(os.getpid()), encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"Cannot write {PID_FILE}: {e}")
+        return
+    
+    try:
+        while True:
+            await asyncio.sleep(PID_FILE_INTERVAL)
+            try:
+                PID_FILE.touch()
+            except OSError:
+                pass
+    finally:
+        try:
+            PID_FILE.unlink()
+        except OSError:
+            pass
+
+
 async def main():
     """Main server entry point"""
     
@@ -176,6 +228,8 @@ async def main():
     # Start WebSocket server first (so it can accept connections immediately)
     async with websockets.serve(bridge.handler, HOST, PORT):
         logger.info(f"Server started on ws://{HOST}:{PORT}")
+        pid_task = asyncio.create_task(keep_pid_file_fresh())
+        signal_ready()
         
         # Start OCR warmup in background (doesn't block server)
         if ocr_provider:
@@ -188,6 +242,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    loop_name = install_fast_event_loop()
+    if loop_name:
+        logger.info(f"Using {loop_name} event loop")
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
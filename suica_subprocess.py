@@ -194,9 +194,26 @@ def read_suica():
     return result
 
 
+def serve():
+    """
+    Persistent worker mode (--serve): answer each "READ" line on stdin
+    with one JSON result line. nfcpy and suica_viewer stay imported
+    between reads, so only the first read pays the start-up cost.
+    """
+    sys.stdout.reconfigure(encoding='utf-8')
+    for line in sys.stdin:
+        if line.strip() != "READ":
+            continue
+        result = read_suica()
+        print(json.dumps(result, ensure_ascii=False), flush=True)
+
+
 if __name__ == "__main__":
-    result = read_suica()
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if "--serve" in sys.argv[1:]:
+        serve()
+    else:
+        result = read_suica()
+        print(json.dumps(result, ensure_ascii=False, indent=2))
 
 
 